@@ -1,9 +1,11 @@
 import streamlit as st
 import os
 import pandas as pd
-from main.problemas import Maximizacion, Minimizacion, Transporte, Asignacion
+from main.problemas import Maximizacion, Minimizacion, Transporte, Asignacion, Problema
+from main.problemas import SOLVERS, SOLVER_POR_DEFECTO, PRESOLVE_POR_DEFECTO, HILOS_POR_DEFECTO
 from main.utils import mostrar_ejemplo_excel
-from main.interfaz import manejar_carga_desde_excel, manejar_carga_manual
+from main.registro import RUTA_LOG
+from main.interfaz import manejar_carga_desde_excel, manejar_carga_manual, mostrar_estado_cache, mostrar_historial
 from PIL import Image
 
 def cargar_estilos():
@@ -45,34 +47,8 @@ opcion = st.sidebar.selectbox(
 )
 
 if opcion == "📜 Historial de ejecuciones":
-    st.subheader("📜 Historial de ejecuciones anteriores")
-
-    ruta_log = "logs/registro.csv"
-
-    if not os.path.exists(ruta_log):
-        st.info("Aún no hay registros guardados.")
-    else:
-        df_log = pd.read_csv(ruta_log)
-
-        # Opcional: mostrar filtros
-        with st.expander("🔍 Filtros avanzados"):
-            tipos = df_log["tipo"].unique().tolist()
-            tipo_seleccionado = st.selectbox("Filtrar por tipo de problema", ["Todos"] + tipos)
-            fecha_busqueda = st.date_input("Filtrar por fecha (opcional)", value=None)
-
-        # Aplicar filtros
-        if tipo_seleccionado != "Todos":
-            df_log = df_log[df_log["tipo"] == tipo_seleccionado]
-
-        if fecha_busqueda:
-            df_log = df_log[df_log["timestamp"].str.contains(str(fecha_busqueda))]
-
-        st.dataframe(df_log.sort_values(by="timestamp", ascending=False))
-
-        # Mostrar JSON de un registro
-        st.markdown("### 📋 Ver detalles de un registro")
-        idx = st.number_input("Selecciona índice del registro", min_value=0, max_value=len(df_log)-1, step=1)
-        st.json(df_log.iloc[idx].to_dict())
+    mostrar_historial(RUTA_LOG)
+    st.stop()
 
 # Diccionario central de configuración por tipo de problema
 config_problemas = {
@@ -94,17 +70,51 @@ config_problemas = {
         "hojas": {"costos": "Matriz de costos y capacidades"},
         "nombre_modelo": "Transporte"
     },
-    "Problema de Asignación de Recursos": {
-    "clase": Asignacion,
-    "archivo_ejemplo": "data/ejemplo_asignacion.xlsx",
-    "hojas": {"costos": "Matriz de costos de asignación"},
-    "nombre_modelo": "Asignación"
+    "Problema de Asignación": {
+        "clase": Asignacion,
+        "archivo_ejemplo": "data/ejemplo_asignacion.xlsx",
+        "hojas": {"costos": "Matriz de costos de asignación (o pares Agente, Tarea, Costo)"},
+        "nombre_modelo": "Asignación"
     }
 }
 
 # Datos de la selección actual
 conf = config_problemas[opcion]
 
+# Solver de la clase elegida (por defecto, variable OPTIMIZADOR_SOLVER)
+solvers_disponibles = getattr(conf["clase"], "solvers", SOLVERS)
+solver = st.sidebar.selectbox(
+    "Solver:",
+    solvers_disponibles,
+    index=solvers_disponibles.index(SOLVER_POR_DEFECTO) if SOLVER_POR_DEFECTO in solvers_disponibles else 0
+)
+
+# Presolve, sensibilidad y límites de los modelos lineales (presolve por defecto: variable OPTIMIZADOR_PRESOLVE)
+presolve, sensibilidad, limite_tiempo, gap, hilos = None, False, None, None, None
+if issubclass(conf["clase"], Problema):
+    presolve = st.sidebar.checkbox(
+        "Aplicar presolve",
+        value=PRESOLVE_POR_DEFECTO,
+        help="Elimina filas vacías, duplicadas o redundantes y fija variables antes de llamar al solver."
+    )
+    sensibilidad = st.sidebar.checkbox(
+        "Análisis de sensibilidad",
+        help="Agrega precios sombra, holguras, costos reducidos y rangos de la FO y del RHS."
+    )
+    limite_tiempo = st.sidebar.number_input(
+        "Límite de tiempo (s)", min_value=0, value=0, step=10,
+        help="0 = sin límite. Al agotarse, el solver devuelve la mejor solución encontrada."
+    ) or None
+    gap = st.sidebar.number_input(
+        "Gap de optimalidad (%)", min_value=0.0, max_value=100.0, value=0.0, step=0.5,
+        help="El solver puede detenerse con una solución a esta distancia relativa de la cota. 0 = óptimo."
+    ) / 100 or None
+    hilos = st.sidebar.number_input(
+        "Hilos del solver", min_value=1, max_value=max(HILOS_POR_DEFECTO, os.cpu_count() or 1),
+        value=HILOS_POR_DEFECTO,
+        help="Hilos de CBC para los modelos con variables enteras o binarias (columna 'Tipo_Var')."
+    )
+
 # Subtítulo dinámico
 st.subheader(f"🔧 Resolución de {opcion}")
 
@@ -126,10 +136,18 @@ if tipo_carga == "Desde archivo Excel":
         hojas=conf["hojas"],
         nombre_hoja_modelo="costos" if opcion == "Problema de Transporte" else "modelo",
         nombre_hoja_restricciones=None if opcion == "Problema de Transporte" else "restricciones",
-        nombre_modelo=conf["nombre_modelo"]
+        nombre_modelo=conf["nombre_modelo"],
+        solver=solver,
+        presolve=presolve,
+        sensibilidad=sensibilidad,
+        limite_tiempo=limite_tiempo,
+        gap=gap,
+        hilos=hilos
     )
 
 # Carga manual
 elif tipo_carga == "Ingreso manual":
-    manejar_carga_manual(conf["nombre_modelo"], conf["clase"])
+    manejar_carga_manual(conf["nombre_modelo"], conf["clase"], solver=solver, presolve=presolve,
+                         sensibilidad=sensibilidad, limite_tiempo=limite_tiempo, gap=gap, hilos=hilos)
 
+mostrar_estado_cache()
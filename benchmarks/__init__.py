@@ -0,0 +1,10 @@
+"""
+Benchmark sintético de los cuatro tipos de problema.
+
+`generadores` crea modelos aleatorios reproducibles (PL factibles, redes de
+transporte y matrices de asignación) con la cantidad de coeficientes no nulos
+pedida; `ejecutor` mide cada fase del flujo de la app con ellos y guarda los
+resultados para comparar versiones. Uso desde la línea de comandos:
+
+    python -m benchmarks --escalas 10 1000 100000 --salida resultados.json
+"""
@@ -0,0 +1,52 @@
+import argparse
+
+from benchmarks.ejecutor import ESCALAS, EXPORTADORES, PROBLEMAS
+from benchmarks.ejecutor import comparar_resultados, ejecutar_benchmark, guardar_resultados, leer_resultados
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Mide lectura, validación, construcción, resolución, exportación y registro "
+                    "con modelos sintéticos de cada tipo de problema."
+    )
+    parser.add_argument("--problemas", nargs="+", choices=list(PROBLEMAS), help="Tipos de problema (por defecto, todos).")
+    parser.add_argument("--escalas", nargs="+", type=int, default=list(ESCALAS),
+                        help="Coeficientes no nulos de cada caso (de 10 a 1000000).")
+    parser.add_argument("--backends", nargs="+", help="Solvers a medir (cbc, highs, modi, hungaro). Por defecto, todos.")
+    parser.add_argument("--repeticiones", type=int, default=1)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--densidad", type=float, default=1.0,
+                        help="Densidad de la matriz de PL y de los pares permitidos de asignación.")
+    parser.add_argument("--entrada", default="parquet", choices=["parquet", "csv", "xlsx"], help="Formato de los archivos de entrada.")
+    parser.add_argument("--exportacion", default="Parquet", choices=list(EXPORTADORES), help="Formato del archivo de resultados.")
+    parser.add_argument("--presolve", action="store_true", help="Aplicar el presolve en los modelos de PL.")
+    parser.add_argument("--limite-tiempo", type=float, help="Segundos máximos por resolución.")
+    parser.add_argument("--memoria", action="store_true", help="Medir la memoria pico de cada fase (tracemalloc, más lento).")
+    parser.add_argument("--version", default="", help="Etiqueta de la versión medida.")
+    parser.add_argument("--salida", help="Archivo de resultados (.json o .csv).")
+    parser.add_argument("--comparar", help="Resultados de otra versión (.json o .csv) para comparar.")
+    args = parser.parse_args(argumentos)
+
+    opciones = {"presolve": True} if args.presolve else {}
+    if args.limite_tiempo:
+        opciones["limite_tiempo"] = args.limite_tiempo
+
+    def informar(fila):
+        estado = fila["error"] or fila["estado"]
+        print(f"{fila['problema']:<13} {fila['backend']:<8} {fila['escala']:>9} nnz  {fila['total_s']:9.3f} s  {estado}")
+
+    tabla = ejecutar_benchmark(
+        args.problemas, args.escalas, args.backends, args.repeticiones, args.semilla, args.densidad,
+        args.entrada, args.exportacion, args.memoria, args.version, progreso=informar, **opciones
+    )
+    if args.salida:
+        guardar_resultados(tabla, args.salida)
+        print(f"Resultados guardados en {args.salida}")
+    if args.comparar:
+        comparacion = comparar_resultados(leer_resultados(args.comparar), tabla, ["total_s"])
+        print(comparacion.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
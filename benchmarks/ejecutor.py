@@ -0,0 +1,318 @@
+import json
+import os
+import platform
+import tempfile
+from datetime import datetime
+from io import BytesIO
+
+import pandas as pd
+
+from benchmarks.generadores import generar_asignacion, generar_lp, generar_transporte
+from main.ingesta import leer_archivos
+from main.medicion import Medicion
+from main.problemas import Asignacion, Maximizacion, Minimizacion, Transporte, crear_problema
+from main.utils import exportar_resultado_csv, exportar_resultado_excel, exportar_resultado_parquet
+from main.utils import registrar_log, validar_datos_asignacion, validar_datos_manual, validar_datos_transporte
+
+# Tipos de problema del benchmark, con los nombres de la app
+PROBLEMAS = {
+    "Maximización": Maximizacion,
+    "Minimización": Minimizacion,
+    "Transporte": Transporte,
+    "Asignación": Asignacion,
+}
+
+# Escalas por defecto (coeficientes no nulos); 1_000_000 se pide explícitamente
+ESCALAS = (10, 1_000, 10_000, 100_000)
+
+# Fases medidas en cada caso, en orden
+FASES = ("ingesta", "validacion", "construccion", "resolucion", "exportacion", "registro")
+
+# Columnas que identifican un caso al comparar dos corridas
+CLAVES_CASO = ["problema", "backend", "escala"]
+
+EXPORTADORES = {
+    "Excel": lambda resultado, datos: exportar_resultado_excel(resultado, datos),
+    "CSV": lambda resultado, datos: exportar_resultado_csv(resultado),
+    "Parquet": lambda resultado, datos: exportar_resultado_parquet(resultado),
+}
+
+
+def generar_caso(problema, escala, semilla=0, densidad=1.0) -> dict:
+    """
+    Genera los datos de entrada de un caso del benchmark.
+
+    Args:
+        problema (str): Tipo de problema (clave de PROBLEMAS).
+        escala (int): Coeficientes no nulos aproximados del modelo.
+        semilla (int): Semilla de los generadores.
+        densidad (float): Densidad de la matriz en PL y de los pares permitidos en asignación.
+
+    Returns:
+        dict: DataFrames de entrada ('modelo' y 'restricciones', o 'costos').
+
+    Raises:
+        ValueError: Si el tipo de problema no existe.
+    """
+
+    if problema not in PROBLEMAS:
+        raise ValueError(f"❌ Tipo de problema desconocido: '{problema}'. Opciones: {', '.join(PROBLEMAS)}.")
+    if problema == "Transporte":
+        return {"costos": generar_transporte(escala, semilla)}
+    if problema == "Asignación":
+        return {"costos": generar_asignacion(escala, semilla, densidad)}
+    df_modelo, df_restricciones = generar_lp(escala, semilla, maximizar=problema == "Maximización", densidad=densidad)
+    return {"modelo": df_modelo, "restricciones": df_restricciones}
+
+
+def archivos_entrada(datos_entrada: dict, formato="parquet") -> list:
+    """
+    Serializa los datos de entrada como los archivos que subiría un usuario.
+
+    Args:
+        datos_entrada (dict): DataFrames de entrada por nombre de hoja.
+        formato (str): "xlsx" (un libro con una hoja por tabla), "parquet" o "csv" (un archivo por tabla).
+
+    Returns:
+        list: Tuplas (nombre, bytes), aptas para `main.ingesta.leer_archivos`.
+    """
+
+    if formato == "xlsx":
+        salida = BytesIO()
+        with pd.ExcelWriter(salida, engine="openpyxl") as writer:
+            for hoja, df in datos_entrada.items():
+                df.to_excel(writer, sheet_name=hoja, index=False)
+        return [("entrada.xlsx", salida.getvalue())]
+
+    archivos = []
+    for hoja, df in datos_entrada.items():
+        salida = BytesIO()
+        if formato == "csv":
+            df.to_csv(salida, index=False)
+        else:
+            df.to_parquet(salida, index=False)
+        archivos.append((f"{hoja}.{formato}", salida.getvalue()))
+    return archivos
+
+
+def validar(problema, datos_entrada: dict):
+    """Aplica la validación de la app que corresponde al tipo de problema."""
+
+    if problema == "Asignación":
+        validar_datos_asignacion(datos_entrada["costos"])
+    elif problema == "Transporte":
+        validar_datos_transporte(datos_entrada["costos"])
+    else:
+        validar_datos_manual(datos_entrada["modelo"], datos_entrada["restricciones"])
+
+
+def medir_caso(problema, backend, archivos, ruta_log, formato_salida="Parquet", medicion=None, **opciones) -> dict:
+    """
+    Recorre el flujo completo de la app para un caso y mide cada fase.
+
+    Las fases son las de FASES: lectura de los archivos, validación,
+    construcción, resolución, exportación del resultado y registro en el
+    historial. Un error en cualquier fase se informa en el resultado y las
+    fases siguientes no se ejecutan.
+
+    Args:
+        problema (str): Tipo de problema (clave de PROBLEMAS).
+        backend (str): Solver ("cbc", "highs", "modi" o "hungaro").
+        archivos (list): Archivos de entrada (ver `archivos_entrada`).
+        ruta_log (str): Historial donde se registra la ejecución.
+        formato_salida (str): Formato del archivo de resultados (clave de EXPORTADORES).
+        medicion (Medicion, optional): Dónde acumular las mediciones.
+        **opciones: Opciones del constructor (por ejemplo `presolve` o `limite_tiempo`).
+
+    Returns:
+        dict: 'estado', 'valor_objetivo', 'error' y 'mediciones' (ver `Medicion.a_dict`).
+    """
+
+    clase = PROBLEMAS[problema]
+    medicion = medicion if medicion is not None else Medicion()
+    if clase is not Asignacion:
+        opciones["solver"] = backend
+
+    resultado, error = {}, None
+    try:
+        with medicion.fase("ingesta"):
+            datos_entrada = leer_archivos(archivos, clase.entradas)
+        with medicion.fase("validacion"):
+            validar(problema, datos_entrada)
+        instancia = crear_problema(clase, datos_entrada, **opciones)
+        with medicion.fase("construccion"):
+            instancia.construir()
+        with medicion.fase("resolucion"):
+            resultado = instancia.resolver()
+        medicion.medir_modelo(instancia)
+        with medicion.fase("exportacion"):
+            EXPORTADORES[formato_salida](resultado, datos_entrada)
+        with medicion.fase("registro"):
+            registrar_log(problema, resultado, datos_entrada, ruta=ruta_log)
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        "estado": resultado.get("status"),
+        "valor_objetivo": resultado.get("valor_objetivo"),
+        "error": error,
+        "mediciones": medicion.a_dict(),
+    }
+
+
+def _fila(caso: dict, medido: dict) -> dict:
+    """Aplana un caso medido en una fila: tamaño del modelo y segundos/CPU/memoria por fase."""
+
+    fila = {**caso, **{k: medido[k] for k in ("estado", "valor_objetivo", "error")}}
+    tamano = medido["mediciones"]["tamano"]
+    for clave in ("variables", "restricciones", "no_nulos"):
+        fila[clave] = tamano.get(clave)
+    for fase in medido["mediciones"]["fases"]:
+        nombre = fase["fase"]
+        fila[f"{nombre}_s"] = fase["segundos"]
+        fila[f"{nombre}_cpu"] = fase["cpu"]
+        if fase["memoria_pico"] is not None:
+            fila[f"{nombre}_memoria"] = fase["memoria_pico"]
+    fila["total_s"] = sum(fase["segundos"] for fase in medido["mediciones"]["fases"])
+    return fila
+
+
+def ejecutar_benchmark(problemas=None, escalas=ESCALAS, backends=None, repeticiones=1, semilla=0,
+                       densidad=1.0, formato_entrada="parquet", formato_salida="Parquet",
+                       memoria=False, version="", progreso=None, **opciones) -> pd.DataFrame:
+    """
+    Ejecuta el benchmark: cada tipo de problema, en cada escala y con cada backend.
+
+    Los datos de cada escala se generan una sola vez (con la misma semilla, de
+    modo que dos versiones del código miden exactamente los mismos modelos) y
+    se serializan antes de medir; las repeticiones se registran en un historial
+    temporal que se descarta al terminar.
+
+    Args:
+        problemas (iterable, optional): Tipos de problema (claves de PROBLEMAS). Por defecto, todos.
+        escalas (iterable): Coeficientes no nulos aproximados de cada caso.
+        backends (iterable, optional): Solvers a medir; a cada problema se le aplican los que
+            admite. Por defecto, todos los de cada clase.
+        repeticiones (int): Veces que se mide cada caso.
+        semilla (int): Semilla de los generadores.
+        densidad (float): Densidad de la matriz en PL y de los pares permitidos en asignación.
+        formato_entrada (str): Formato de los archivos de entrada (ver `archivos_entrada`).
+        formato_salida (str): Formato del archivo de resultados (clave de EXPORTADORES).
+        memoria (bool): Medir también la memoria pico de cada fase (más lento, ver `main.medicion`).
+        version (str): Etiqueta de la versión medida, para comparar corridas.
+        progreso (callable, optional): Se llama con cada fila al terminar su caso.
+        **opciones: Opciones del constructor (por ejemplo `presolve` o `limite_tiempo`).
+
+    Returns:
+        pd.DataFrame: Una fila por caso y repetición, con el tamaño del modelo, el estado y
+        las columnas '<fase>_s' y '<fase>_cpu' (y '<fase>_memoria' si se mide) de cada fase.
+
+    Raises:
+        ValueError: Si algún tipo de problema no existe.
+    """
+
+    problemas = list(problemas or PROBLEMAS)
+    desconocidos = [p for p in problemas if p not in PROBLEMAS]
+    if desconocidos:
+        raise ValueError(f"❌ Tipos de problema desconocidos: {', '.join(desconocidos)}. Opciones: {', '.join(PROBLEMAS)}.")
+
+    filas = []
+    with tempfile.TemporaryDirectory(prefix="benchmark-") as carpeta:
+        ruta_log = os.path.join(carpeta, "registro.db")
+        for problema in problemas:
+            clase = PROBLEMAS[problema]
+            solvers = [b for b in (backends or clase.solvers) if b in clase.solvers]
+            for escala in escalas:
+                archivos = archivos_entrada(generar_caso(problema, escala, semilla, densidad), formato_entrada)
+                for backend in solvers:
+                    for repeticion in range(repeticiones):
+                        caso = {"version": version, "problema": problema, "backend": backend,
+                                "escala": escala, "repeticion": repeticion}
+                        medido = medir_caso(problema, backend, archivos, ruta_log, formato_salida,
+                                            Medicion(memoria=memoria), **opciones)
+                        filas.append(_fila(caso, medido))
+                        if progreso is not None:
+                            progreso(filas[-1])
+
+    columnas = list(dict.fromkeys(
+        ["version", "problema", "backend", "escala", "repeticion", "variables", "restricciones",
+         "no_nulos", "estado", "valor_objetivo", "error"]
+        + [f"{fase}_{medida}" for fase in FASES for medida in ("s", "cpu")]
+        + [col for fila in filas for col in fila]
+    ))
+    return pd.DataFrame(filas).reindex(columns=columnas)
+
+
+def guardar_resultados(tabla: pd.DataFrame, ruta):
+    """
+    Guarda los resultados del benchmark en JSON (con metadatos del entorno) o CSV, según la extensión.
+
+    Args:
+        tabla (pd.DataFrame): Resultados de `ejecutar_benchmark`.
+        ruta (str): Archivo de salida (.json o .csv).
+
+    Raises:
+        ValueError: Si la extensión no es .json ni .csv.
+    """
+
+    extension = os.path.splitext(str(ruta))[1].lower()
+    if extension == ".csv":
+        tabla.to_csv(ruta, index=False)
+    elif extension == ".json":
+        metadatos = {
+            "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "procesador": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(),
+        }
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump({"metadatos": metadatos, "resultados": json.loads(tabla.to_json(orient="records"))},
+                      f, ensure_ascii=False, indent=1)
+    else:
+        raise ValueError("❌ El archivo de resultados debe ser .json o .csv.")
+
+
+def leer_resultados(ruta) -> pd.DataFrame:
+    """
+    Lee resultados guardados con `guardar_resultados`.
+
+    Args:
+        ruta (str): Archivo .json o .csv.
+
+    Returns:
+        pd.DataFrame: Resultados, una fila por caso y repetición.
+    """
+
+    if str(ruta).lower().endswith(".csv"):
+        return pd.read_csv(ruta)
+    with open(ruta, encoding="utf-8") as f:
+        return pd.DataFrame(json.load(f)["resultados"])
+
+
+def comparar_resultados(base: pd.DataFrame, nueva: pd.DataFrame, medidas=None) -> pd.DataFrame:
+    """
+    Compara dos corridas del benchmark caso por caso.
+
+    Promedia las repeticiones de cada caso (problema, backend, escala) y
+    calcula el cociente nueva/base de cada medida: valores menores que 1 indican
+    que la nueva versión es más rápida.
+
+    Args:
+        base (pd.DataFrame): Resultados de referencia.
+        nueva (pd.DataFrame): Resultados a comparar.
+        medidas (list, optional): Columnas a comparar. Por defecto, los segundos de cada fase y el total.
+
+    Returns:
+        pd.DataFrame: Por caso, las columnas '<medida>_base', '<medida>_nueva' y '<medida>_cociente'.
+    """
+
+    medidas = medidas or [f"{fase}_s" for fase in FASES] + ["total_s"]
+    medidas = [m for m in medidas if m in base.columns and m in nueva.columns]
+    promedio_base = base.groupby(CLAVES_CASO)[medidas].mean()
+    promedio_nueva = nueva.groupby(CLAVES_CASO)[medidas].mean()
+
+    tabla = promedio_base.join(promedio_nueva, lsuffix="_base", rsuffix="_nueva", how="inner")
+    for medida in medidas:
+        tabla[f"{medida}_cociente"] = tabla[f"{medida}_nueva"] / tabla[f"{medida}_base"]
+    return tabla.reset_index()
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from main.problemas import FILA_OBJETIVO
+
+
+def _coordenadas(rng, filas, columnas, no_nulos):
+    """
+    Posiciones (fila, columna) distintas de una matriz dispersa con unos `no_nulos` elementos.
+
+    Cada columna aparece al menos una vez (repartidas entre las filas en forma
+    cíclica); el resto se sortea. Se generan en O(no_nulos), sin materializar la matriz.
+    """
+
+    if no_nulos >= filas * columnas:
+        return np.divmod(np.arange(filas * columnas), columnas)
+    extra = max(no_nulos - columnas, 0)
+    claves = np.concatenate([
+        (np.arange(columnas) % filas) * columnas + np.arange(columnas),
+        rng.integers(filas, size=extra) * columnas + rng.integers(columnas, size=extra),
+    ])
+    return np.divmod(np.unique(claves), columnas)
+
+
+def generar_lp(no_nulos, semilla=0, maximizar=True, densidad=1.0, largo=None):
+    """
+    Genera un modelo lineal aleatorio factible y acotado con unos `no_nulos` coeficientes.
+
+    Las restricciones tienen coeficientes positivos y su RHS se calcula a partir
+    de un punto x0 >= 0, de modo que x0 es factible: al maximizar son '<=' (y,
+    como cada variable aparece en alguna restricción, el óptimo es finito) y al
+    minimizar son '>=' con costos positivos. Hay el doble de variables que de
+    restricciones.
+
+    Args:
+        no_nulos (int): Coeficientes no nulos aproximados de la matriz de restricciones.
+        semilla (int): Semilla del generador aleatorio (el mismo valor da el mismo modelo).
+        maximizar (bool): Generar un modelo de maximización ('<=') o de minimización ('>=').
+        densidad (float): Fracción de coeficientes no nulos por restricción (0 < densidad <= 1).
+        largo (bool, optional): Devolver el modelo en formato largo (Restriccion, Variable,
+            Coef). Por defecto, solo si la matriz es dispersa (densidad < 1).
+
+    Returns:
+        tuple: (df_modelo, df_restricciones) con el formato de la app.
+
+    Raises:
+        ValueError: Si la densidad no está en (0, 1].
+    """
+
+    if not 0 < densidad <= 1:
+        raise ValueError("❌ La densidad debe estar entre 0 (excluido) y 1.")
+    largo = densidad < 1 if largo is None else largo
+
+    rng = np.random.default_rng(semilla)
+    m = max(1, int(np.sqrt(no_nulos / (2 * densidad))))
+    n = 2 * m
+    filas, columnas = _coordenadas(rng, m, n, int(no_nulos))
+    A = sparse.csr_matrix(
+        (rng.integers(1, 10, size=len(filas)).astype(float), (filas, columnas)), shape=(m, n)
+    )
+
+    x0 = rng.uniform(0, 10, size=n)
+    actividad = A @ x0
+    if maximizar:
+        tipo, rhs = "<=", np.ceil(actividad * rng.uniform(1.0, 1.5, size=m))
+    else:
+        tipo, rhs = ">=", np.floor(actividad * rng.uniform(0.5, 1.0, size=m))
+    c = rng.integers(1, 21, size=n).astype(float)
+
+    variables = np.array([f"X{j + 1}" for j in range(n)], dtype=object)
+    restricciones = np.array([f"R{i + 1}" for i in range(m)], dtype=object)
+    df_restricciones = pd.DataFrame({"Restriccion": restricciones, "Tipo": tipo, "RHS": rhs})
+
+    if largo:
+        coo = A.tocoo()
+        df_modelo = pd.DataFrame({
+            "Restriccion": np.concatenate([np.full(n, FILA_OBJETIVO, dtype=object), restricciones[coo.row]]),
+            "Variable": np.concatenate([variables, variables[coo.col]]),
+            "Coef": np.concatenate([c, coo.data]),
+        })
+    else:
+        df_modelo = pd.DataFrame(A.T.toarray(), columns=[f"Coef_R{i + 1}" for i in range(m)])
+        df_modelo.insert(0, "Coef_FO", c)
+        df_modelo.insert(0, "Variable", variables)
+    return df_modelo, df_restricciones
+
+
+def generar_transporte(no_nulos, semilla=0):
+    """
+    Genera una red de transporte balanceada y completa (todas las rutas permitidas).
+
+    Cada ruta es una variable con dos coeficientes (su origen y su destino), por
+    lo que la red tiene unas `no_nulos / 2` rutas, con el doble de destinos que de
+    orígenes. La oferta total es igual a la demanda total.
+
+    Args:
+        no_nulos (int): Coeficientes no nulos aproximados del modelo (2 por ruta).
+        semilla (int): Semilla del generador aleatorio.
+
+    Returns:
+        pd.DataFrame: Tabla con 'Origen', 'Destino', 'Costo', 'Oferta' y 'Demanda'
+        (la oferta en la primera ruta de cada origen y la demanda en la primera de cada destino).
+    """
+
+    rng = np.random.default_rng(semilla)
+    rutas = max(1, int(no_nulos) // 2)
+    origenes = max(1, int(np.sqrt(rutas / 2)))
+    destinos = max(1, rutas // origenes)
+
+    oferta = rng.integers(10, 100, size=origenes).astype(float)
+    demanda = rng.multinomial(int(oferta.sum()), np.full(destinos, 1 / destinos)).astype(float)
+
+    idx_origen = np.repeat(np.arange(origenes), destinos)
+    idx_destino = np.tile(np.arange(destinos), origenes)
+    return pd.DataFrame({
+        "Origen": np.array([f"O{i + 1}" for i in range(origenes)], dtype=object)[idx_origen],
+        "Destino": np.array([f"D{j + 1}" for j in range(destinos)], dtype=object)[idx_destino],
+        "Costo": rng.integers(1, 50, size=len(idx_origen)).astype(float),
+        "Oferta": np.where(idx_destino == 0, oferta[idx_origen], np.nan),
+        "Demanda": np.where(idx_origen == 0, demanda[idx_destino], np.nan),
+    })
+
+
+def generar_asignacion(no_nulos, semilla=0, densidad=1.0):
+    """
+    Genera un problema de asignación cuadrado con solución completa.
+
+    Cada par agente-tarea permitido es una variable con dos coeficientes, por lo
+    que hay unos `no_nulos / 2` pares. Con densidad 1 se devuelve la matriz de
+    costos completa; con densidad menor, la tabla de pares permitidos
+    (Agente, Tarea, Costo), que siempre incluye una asignación completa al azar.
+
+    Args:
+        no_nulos (int): Coeficientes no nulos aproximados del modelo (2 por par permitido).
+        semilla (int): Semilla del generador aleatorio.
+        densidad (float): Fracción de pares permitidos (0 < densidad <= 1).
+
+    Returns:
+        pd.DataFrame: Matriz de costos (con la columna 'Agente' como etiquetas) o pares permitidos.
+
+    Raises:
+        ValueError: Si la densidad no está en (0, 1].
+    """
+
+    if not 0 < densidad <= 1:
+        raise ValueError("❌ La densidad debe estar entre 0 (excluido) y 1.")
+
+    rng = np.random.default_rng(semilla)
+    n = max(1, int(np.sqrt(max(1, int(no_nulos) // 2) / densidad)))
+    agentes = np.array([f"A{i + 1}" for i in range(n)], dtype=object)
+    tareas = np.array([f"T{j + 1}" for j in range(n)], dtype=object)
+
+    if densidad == 1:
+        df = pd.DataFrame(rng.integers(1, 100, size=(n, n)).astype(float), columns=tareas)
+        df.insert(0, "Agente", agentes)
+        return df
+
+    # Una permutación garantiza que exista una asignación completa
+    pares = max(n, int(n * n * densidad))
+    claves = np.unique(np.concatenate([
+        np.arange(n) * n + rng.permutation(n),
+        rng.integers(n, size=pares - n) * n + rng.integers(n, size=pares - n),
+    ]))
+    filas, columnas = np.divmod(claves, n)
+    return pd.DataFrame({
+        "Agente": agentes[filas],
+        "Tarea": tareas[columnas],
+        "Costo": rng.integers(1, 100, size=len(claves)).astype(float),
+    })
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Estados definitivos: los demás (por ejemplo "Not Solved" al agotar el límite de
+# tiempo) dependen de la carga del momento y no se guardan
+ESTADOS_FINALES = {"Optimal", "Infeasible", "Unbounded", "Óptimo", "Infactible"}
+
+
+def hash_dataframe(df: pd.DataFrame) -> bytes:
+    """
+    Calcula un hash estable del contenido de un DataFrame.
+
+    Normaliza las columnas numéricas a float64 (para que 1 y 1.0 coincidan) e
+    incluye nombres de columnas e índice, de modo que dos tablas con los mismos
+    datos producen el mismo hash aunque vengan de fuentes distintas.
+
+    Args:
+        df (pd.DataFrame): Tabla a resumir.
+
+    Returns:
+        bytes: Resumen SHA-256 del contenido.
+    """
+
+    normalizado = df.copy(deep=False)
+    for col in normalizado.columns:
+        if pd.api.types.is_numeric_dtype(normalizado[col]) and not pd.api.types.is_bool_dtype(normalizado[col]):
+            normalizado[col] = normalizado[col].astype("float64")
+
+    h = hashlib.sha256()
+    h.update(json.dumps([str(c) for c in normalizado.columns]).encode())
+    h.update(pd.util.hash_pandas_object(normalizado, index=True).to_numpy().tobytes())
+    return h.digest()
+
+
+def clave_problema(clase_problema, datos_entrada: dict, opciones: dict = None) -> str:
+    """
+    Genera la clave de caché de un problema.
+
+    Combina la clase del problema, el contenido de cada DataFrame de entrada
+    (por nombre) y las opciones de resolución (solver, maximizar, etc.).
+
+    Args:
+        clase_problema (class): Clase del modelo (Maximizacion, Transporte, ...).
+        datos_entrada (dict): DataFrames de entrada por nombre ('modelo', 'restricciones', 'costos').
+        opciones (dict, optional): Opciones que afectan al resultado.
+
+    Returns:
+        str: Clave hexadecimal estable entre ejecuciones.
+    """
+
+    h = hashlib.sha256()
+    h.update(f"{clase_problema.__module__}.{clase_problema.__qualname__}".encode())
+    h.update(json.dumps(opciones or {}, sort_keys=True, default=str).encode())
+    for nombre in sorted(datos_entrada):
+        h.update(nombre.encode())
+        h.update(hash_dataframe(datos_entrada[nombre]))
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché LRU de resultados de modelos resueltos, con persistencia opcional en disco.
+
+    Guarda en memoria hasta `max_entradas` resultados y descarta los menos usados
+    recientemente. Solo se guardan los resultados con un estado definitivo
+    (ver ESTADOS_FINALES): una ejecución detenida por el límite de tiempo se
+    vuelve a resolver la próxima vez. Si se indica `directorio`, cada resultado se guarda también
+    como archivo pickle, de modo que los aciertos sobreviven a reinicios de la
+    app; el directorio se limita a `max_bytes_disco` eliminando los archivos
+    usados hace más tiempo. Es segura para usar desde varias sesiones a la vez.
+
+    Args:
+        max_entradas (int): Número máximo de resultados en memoria.
+        directorio (str, optional): Carpeta para persistir resultados.
+        max_bytes_disco (int): Tamaño máximo de la carpeta de persistencia.
+
+    Attributes:
+        aciertos (int): Consultas resueltas desde la caché.
+        fallos (int): Consultas que requirieron resolver el modelo.
+    """
+
+    def __init__(self, max_entradas=128, directorio=None, max_bytes_disco=256 * 1024 * 1024):
+        self.max_entradas = max_entradas
+        self.directorio = directorio
+        self.max_bytes_disco = max_bytes_disco
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        self._lock = threading.Lock()
+
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, f"{clave}.pkl")
+
+    def obtener(self, clave):
+        """
+        Devuelve el resultado guardado para `clave` o None si no existe.
+
+        Args:
+            clave (str): Clave generada con `clave_problema`.
+
+        Returns:
+            dict | None: Copia del resultado guardado.
+        """
+
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return dict(self._entradas[clave])
+
+            if self.directorio and os.path.exists(self._ruta(clave)):
+                try:
+                    with open(self._ruta(clave), "rb") as f:
+                        resultado = pickle.load(f)
+                    os.utime(self._ruta(clave))
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    resultado = None
+                if resultado is not None:
+                    self._agregar(clave, resultado)
+                    self.aciertos += 1
+                    return dict(resultado)
+
+            self.fallos += 1
+            return None
+
+    def guardar(self, clave, resultado: dict):
+        """
+        Guarda un resultado en memoria (y en disco si hay directorio configurado).
+
+        Los resultados sin un estado definitivo (ver ESTADOS_FINALES) se ignoran.
+
+        Args:
+            clave (str): Clave generada con `clave_problema`.
+            resultado (dict): Resultado devuelto por `resolver()`.
+
+        Returns:
+            bool: True si el resultado se guardó.
+        """
+
+        if resultado.get("status") not in ESTADOS_FINALES:
+            return False
+        with self._lock:
+            self._agregar(clave, resultado)
+            if self.directorio:
+                with open(self._ruta(clave), "wb") as f:
+                    pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._limitar_disco()
+        return True
+
+    def limpiar(self):
+        """Vacía la caché en memoria y en disco y reinicia los contadores."""
+
+        with self._lock:
+            self._entradas.clear()
+            self.aciertos = 0
+            self.fallos = 0
+            if self.directorio:
+                for nombre in os.listdir(self.directorio):
+                    if nombre.endswith(".pkl"):
+                        os.remove(os.path.join(self.directorio, nombre))
+
+    def _agregar(self, clave, resultado):
+        self._entradas[clave] = resultado
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+
+    def _limitar_disco(self):
+        archivos = [
+            os.path.join(self.directorio, nombre)
+            for nombre in os.listdir(self.directorio)
+            if nombre.endswith(".pkl")
+        ]
+        tamanos = np.array([os.path.getsize(a) for a in archivos])
+        if tamanos.sum() <= self.max_bytes_disco:
+            return
+
+        # Eliminar primero los usados hace más tiempo
+        orden = np.argsort([os.path.getmtime(a) for a in archivos])
+        total = tamanos.sum()
+        for k in orden:
+            if total <= self.max_bytes_disco:
+                break
+            os.remove(archivos[k])
+            total -= tamanos[k]
+
+    def __len__(self):
+        return len(self._entradas)
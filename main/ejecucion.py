@@ -0,0 +1,262 @@
+import multiprocessing
+import os
+import re
+import signal
+import tempfile
+import threading
+import time
+
+from main.medicion import Medicion
+from main.problemas import crear_problema
+
+# Segundos de tolerancia sobre el límite de tiempo antes de detener el proceso a la fuerza
+MARGEN_LIMITE = 10
+
+# Límite duro para las ejecuciones sin límite de tiempo (configurable por variable de entorno)
+LIMITE_TIEMPO_MAXIMO = float(os.environ.get("OPTIMIZADOR_LIMITE_TIEMPO", 600))
+
+# Segundos que se espera a que el proceso termine tras SIGTERM antes de usar SIGKILL
+ESPERA_CANCELAR = 2
+
+# Líneas del log de CBC con progreso: solución entera encontrada, estado del árbol e iteraciones de Clp
+_SOLUCION_ENTERA = re.compile(r"Cbc0012I Integer solution of (\S+)")
+_ARBOL = re.compile(r"Cbc0010I After (\d+) nodes, \d+ on tree, (\S+) best solution, best possible (\S+)")
+_ITERACION = re.compile(r"Clp0006I\s+(\d+)\s+Obj\s+(\S+)")
+
+# CBC informa "1e+50" como mejor solución mientras no encuentra ninguna
+_SIN_SOLUCION = 1e49
+
+
+def progreso_cbc(texto: str, maximizar=False) -> dict:
+    """
+    Extrae el progreso de un fragmento del log de CBC.
+
+    CBC trabaja minimizando: al maximizar, los valores del log tienen el signo
+    cambiado y se devuelven en el sentido original del modelo.
+
+    Args:
+        texto (str): Líneas del log.
+        maximizar (bool): Sentido de la FO del modelo.
+
+    Returns:
+        dict: Últimos valores de 'incumbente', 'cota', 'nodos' e 'iteraciones' que aparecen en el texto.
+    """
+
+    signo = -1.0 if maximizar else 1.0
+    progreso = {}
+    for linea in texto.splitlines():
+        if m := _ARBOL.search(linea):
+            progreso["nodos"] = int(m.group(1))
+            progreso["cota"] = signo * float(m.group(3))
+            if abs(float(m.group(2))) < _SIN_SOLUCION:
+                progreso["incumbente"] = signo * float(m.group(2))
+        elif m := _SOLUCION_ENTERA.search(linea):
+            progreso["incumbente"] = signo * float(m.group(1))
+        elif m := _ITERACION.search(linea):
+            progreso["iteraciones"] = int(m.group(1))
+    return progreso
+
+
+def _contexto():
+    """Contexto de multiprocessing: forkserver (con los módulos ya importados) o spawn."""
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        contexto = multiprocessing.get_context("forkserver")
+        contexto.set_forkserver_preload(["main.problemas"])
+        return contexto
+    return multiprocessing.get_context("spawn")
+
+
+def _trabajar(conexion, clase_problema, datos_entrada: dict, opciones: dict, registro, limite):
+    """Construye y resuelve el problema en el proceso de trabajo y envía el resultado."""
+
+    # Grupo de procesos propio: al cancelar se detiene también el subproceso de CBC. El propio
+    # proceso se detiene al superar el límite, aunque la sesión que lo inició ya no lo consulte.
+    if hasattr(os, "setsid"):
+        os.setsid()
+        vigilante = threading.Timer(limite, os.killpg, (os.getpid(), signal.SIGKILL))
+        vigilante.daemon = True
+        vigilante.start()
+    medicion = Medicion()
+    try:
+        problema = crear_problema(clase_problema, datos_entrada, **opciones)
+        problema.registro_solver = registro
+        with medicion.fase("construccion"):
+            problema.construir()
+        forma = getattr(problema, "forma_vigente", None)
+        conexion.send(("maximizar", forma().maximizar if forma else None))
+        with medicion.fase("resolucion"):
+            resultado = problema.resolver()
+        medicion.medir_modelo(problema)
+        conexion.send(("mediciones", medicion.a_dict()))
+        conexion.send(("resultado", resultado))
+    except Exception as e:
+        conexion.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conexion.close()
+
+
+class EjecucionSegundoPlano:
+    """
+    Resuelve un problema en un proceso de trabajo que se puede consultar y cancelar.
+
+    Pensado para la interfaz: la sesión inicia la ejecución, consulta cada
+    segundo `consultar()` y `progreso()` (tiempo transcurrido y, con CBC, la
+    mejor solución y la cota leídas de su log) y puede cancelarla. El proceso
+    tiene su propio grupo, de modo que cancelar detiene también el solver. Si la
+    ejecución supera su límite de tiempo (o LIMITE_TIEMPO_MAXIMO) más
+    MARGEN_LIMITE segundos, el proceso se detiene a sí mismo (y, si no puede,
+    se lo detiene en la siguiente consulta).
+
+    Args:
+        clase_problema (class): Clase del modelo.
+        datos_entrada (dict): DataFrames de entrada ('modelo' y 'restricciones', o 'costos').
+        **opciones: Opciones del constructor (por ejemplo `solver`, `limite_tiempo` o `gap`).
+
+    Attributes:
+        resultado (dict): Resultado del modelo, cuando termina sin errores.
+        error (str): Motivo por el que no hay resultado (error del modelo, cancelación o límite).
+        maximizar (bool): Sentido de la FO (se conoce cuando el modelo está construido).
+        mediciones (dict): Tiempos de construcción y resolución y tamaño del modelo
+            (ver `main.medicion.Medicion.a_dict`), cuando termina sin errores.
+    """
+
+    def __init__(self, clase_problema, datos_entrada: dict, **opciones):
+        self.resultado = None
+        self.error = None
+        self.maximizar = None
+        self.mediciones = None
+        self._limite = (opciones.get("limite_tiempo") or LIMITE_TIEMPO_MAXIMO) + MARGEN_LIMITE
+        self._progreso = {}
+        self._duracion = None
+
+        descriptor, self._registro = tempfile.mkstemp(prefix="optimizador-", suffix=".log")
+        os.close(descriptor)
+        self._posicion = 0
+
+        contexto = _contexto()
+        self._conexion, extremo = contexto.Pipe(duplex=False)
+        self._proceso = contexto.Process(
+            target=_trabajar,
+            args=(extremo, clase_problema, datos_entrada, opciones, self._registro, self._limite),
+            daemon=True
+        )
+        self._inicio = time.monotonic()
+        self._proceso.start()
+        extremo.close()
+
+    @property
+    def segundos(self) -> float:
+        """Segundos transcurridos desde el inicio (o hasta el final, si ya terminó)."""
+
+        if self._duracion is not None:
+            return self._duracion
+        return time.monotonic() - self._inicio
+
+    @property
+    def terminada(self) -> bool:
+        """Indica si la ejecución terminó (con resultado, error o cancelación)."""
+
+        return self.resultado is not None or self.error is not None
+
+    def consultar(self) -> bool:
+        """
+        Recoge los mensajes del proceso de trabajo y aplica el límite duro de tiempo.
+
+        Returns:
+            bool: True si la ejecución terminó.
+        """
+
+        if self.terminada:
+            return True
+        try:
+            while not self.terminada and self._conexion.poll():
+                tipo, valor = self._conexion.recv()
+                if tipo == "maximizar":
+                    self.maximizar = valor
+                elif tipo == "mediciones":
+                    self.mediciones = valor
+                elif tipo == "resultado":
+                    self.resultado = valor
+                else:
+                    self.error = valor
+        except EOFError:
+            if self.segundos >= self._limite:
+                self.error = self._mensaje_limite()
+            else:
+                self.error = "❌ El proceso de resolución terminó sin devolver un resultado."
+
+        if self.terminada:
+            self._cerrar()
+        elif self.segundos > self._limite:
+            self.cancelar(self._mensaje_limite())
+        return self.terminada
+
+    def progreso(self) -> dict:
+        """
+        Progreso de la ejecución.
+
+        Returns:
+            dict: 'segundos' y, según lo que haya informado el solver, 'incumbente'
+            (mejor solución), 'cota' (mejor cota), 'nodos' e 'iteraciones'.
+        """
+
+        if not self.terminada:
+            self._leer_registro()
+        return {"segundos": self.segundos, **self._progreso}
+
+    def cancelar(self, motivo="🛑 Resolución cancelada."):
+        """
+        Detiene el proceso de trabajo y el solver (SIGTERM y, si no alcanza, SIGKILL).
+
+        Args:
+            motivo (str): Texto que queda en `error`.
+        """
+
+        if self.terminada:
+            return
+        if self._proceso.is_alive():
+            self._senal(signal.SIGTERM)
+            self._proceso.join(ESPERA_CANCELAR)
+            if self._proceso.is_alive():
+                self._senal(getattr(signal, "SIGKILL", signal.SIGTERM))
+                self._proceso.join(ESPERA_CANCELAR)
+        self.error = motivo
+        self._cerrar()
+
+    def _mensaje_limite(self):
+        return f"⏱️ Se detuvo la resolución al superar {self._limite:.0f} segundos."
+
+    def _senal(self, senal):
+        # Sin grupo propio (Windows, o si aún no llegó a crearlo) se detiene solo el proceso
+        try:
+            os.killpg(self._proceso.pid, senal)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            if senal == signal.SIGTERM:
+                self._proceso.terminate()
+            else:
+                self._proceso.kill()
+
+    def _cerrar(self):
+        self._duracion = time.monotonic() - self._inicio
+        self._proceso.join(ESPERA_CANCELAR)
+        self._conexion.close()
+        try:
+            os.remove(self._registro)
+        except OSError:
+            pass
+
+    def _leer_registro(self):
+        """Lee las líneas nuevas del log de CBC y actualiza el progreso."""
+
+        try:
+            with open(self._registro, "rb") as f:
+                f.seek(self._posicion)
+                nuevas = f.read()
+        except OSError:
+            return
+        # Solo se procesan líneas completas
+        completas = nuevas[:nuevas.rfind(b"\n") + 1]
+        self._posicion += len(completas)
+
+        self._progreso.update(progreso_cbc(completas.decode("utf-8", errors="replace"), self.maximizar))
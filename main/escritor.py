@@ -0,0 +1,120 @@
+import atexit
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Marca de fin para el hilo de trabajo
+_FIN = object()
+
+
+class EscritorSegundoPlano:
+    """
+    Ejecuta en un hilo de trabajo las tareas de escritura que no deben bloquear la interfaz.
+
+    Pensado para el registro en el historial y la generación de archivos de
+    resultados: la interfaz encola la tarea, recibe un `Future` y muestra los
+    resultados de inmediato. La cola es acotada, de modo que si el disco se
+    atrasa las nuevas tareas esperan en lugar de acumular memoria sin límite.
+    Al cerrar la aplicación se procesan las tareas pendientes antes de salir.
+
+    Args:
+        max_tareas (int): Tamaño máximo de la cola de tareas pendientes.
+        nombre (str): Nombre del hilo de trabajo.
+
+    Attributes:
+        errores (deque): Últimos fallos como tuplas (fecha, descripción, excepción).
+    """
+
+    def __init__(self, max_tareas=64, nombre="escritor-segundo-plano"):
+        self._cola = queue.Queue(maxsize=max_tareas)
+        self._cerrado = False
+        self._lock = threading.Lock()
+        self.errores = deque(maxlen=50)
+
+        self._hilo = threading.Thread(target=self._trabajar, name=nombre, daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)
+
+    def enviar(self, funcion, *args, descripcion=None, **kwargs) -> Future:
+        """
+        Encola una tarea y devuelve su `Future`.
+
+        Si la cola está llena, espera a que haya lugar.
+
+        Args:
+            funcion (callable): Tarea a ejecutar en el hilo de trabajo.
+            *args: Argumentos posicionales de la tarea.
+            descripcion (str, optional): Texto para identificar la tarea en los errores.
+            **kwargs: Argumentos con nombre de la tarea.
+
+        Returns:
+            concurrent.futures.Future: Resultado (o excepción) de la tarea.
+        """
+
+        with self._lock:
+            if self._cerrado:
+                raise RuntimeError("El escritor en segundo plano ya fue cerrado.")
+            futuro = Future()
+            self._cola.put((futuro, funcion, args, kwargs, descripcion or funcion.__name__))
+        return futuro
+
+    def vaciar(self):
+        """Espera a que se procesen todas las tareas encoladas hasta el momento."""
+
+        self._cola.join()
+
+    def cerrar(self, timeout=None):
+        """
+        Procesa las tareas pendientes y detiene el hilo de trabajo.
+
+        Se registra automáticamente con `atexit`, de modo que las escrituras
+        encoladas no se pierden al detener la aplicación. Los fallos ocurridos
+        y las tareas que no alcanzaron a terminar se informan en el log.
+
+        Args:
+            timeout (float, optional): Segundos máximos a esperar al hilo.
+        """
+
+        with self._lock:
+            if self._cerrado:
+                return
+            self._cerrado = True
+            self._cola.put(_FIN)
+        self._hilo.join(timeout)
+
+        if self._hilo.is_alive():
+            logger.warning("El escritor en segundo plano se cerró con %d tareas pendientes", self.pendientes)
+        if self.errores:
+            logger.warning(
+                "El escritor en segundo plano tuvo %d fallos: %s",
+                len(self.errores), "; ".join(f"{desc}: {e}" for _, desc, e in self.errores)
+            )
+
+    @property
+    def pendientes(self) -> int:
+        """Cantidad aproximada de tareas en espera."""
+
+        return self._cola.qsize()
+
+    def _trabajar(self):
+        while True:
+            tarea = self._cola.get()
+            try:
+                if tarea is _FIN:
+                    return
+                futuro, funcion, args, kwargs, descripcion = tarea
+                if not futuro.set_running_or_notify_cancel():
+                    continue
+                try:
+                    futuro.set_result(funcion(*args, **kwargs))
+                except Exception as e:
+                    logger.exception("Falló la tarea en segundo plano '%s'", descripcion)
+                    self.errores.append((datetime.now(), descripcion, e))
+                    futuro.set_exception(e)
+            finally:
+                self._cola.task_done()
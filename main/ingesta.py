@@ -0,0 +1,218 @@
+import hashlib
+import os
+from io import BytesIO
+
+import pandas as pd
+
+# Columnas de texto conocidas: se leen como cadenas aunque contengan números (p. ej. "1")
+COLUMNAS_TEXTO = {"Variable", "Restriccion", "Tipo", "Origen", "Destino", "Agente", "Tarea"}
+
+# Extensiones de entrada admitidas. Un libro Excel contiene todas las hojas; en los
+# formatos columnares cada archivo es una tabla y su nombre (sin extensión) es la hoja.
+EXTENSIONES_EXCEL = ("xlsx",)
+EXTENSIONES_COLUMNARES = ("parquet", "arrow", "feather", "ipc", "csv")
+EXTENSIONES_ENTRADA = EXTENSIONES_EXCEL + EXTENSIONES_COLUMNARES
+
+
+def hash_contenido(contenido: bytes) -> str:
+    """
+    Calcula el hash del contenido de un archivo subido.
+
+    Args:
+        contenido (bytes): Bytes del archivo.
+
+    Returns:
+        str: SHA-256 en hexadecimal.
+    """
+
+    return hashlib.sha256(contenido).hexdigest()
+
+
+def _tabla_desde_filas(filas) -> pd.DataFrame:
+    """
+    Arma un DataFrame a partir de las filas de una hoja (la primera es el encabezado).
+
+    Replica lo que hace `pd.read_excel`: los encabezados vacíos se nombran
+    'Unnamed: i', las filas completamente vacías se descartan y los tipos numéricos
+    se infieren por columna. Las columnas de `COLUMNAS_TEXTO` se leen como texto.
+    """
+
+    filas = iter(filas)
+    encabezado = next(filas, None)
+    if encabezado is None:
+        return pd.DataFrame()
+
+    # Recortar columnas vacías al final del encabezado
+    ancho = len(encabezado)
+    while ancho > 0 and encabezado[ancho - 1] is None:
+        ancho -= 1
+    columnas = [
+        f"Unnamed: {i}" if valor is None else (valor.strip() if isinstance(valor, str) else valor)
+        for i, valor in enumerate(encabezado[:ancho])
+    ]
+
+    datos = [fila[:ancho] for fila in filas if any(v is not None for v in fila[:ancho])]
+    df = pd.DataFrame(datos, columns=columnas).infer_objects()
+
+    for col in df.columns:
+        if col in COLUMNAS_TEXTO:
+            df[col] = df[col].map(lambda v: v if v is None or isinstance(v, str) else str(v)).astype(object)
+        elif df[col].dtype == object:
+            # Columnas numéricas con celdas vacías: None → NaN
+            convertida = pd.to_numeric(df[col], errors="coerce")
+            if convertida.notna().sum() == df[col].notna().sum():
+                df[col] = convertida
+    return df
+
+
+def leer_libro(contenido: bytes, hojas=None) -> dict:
+    """
+    Lee las hojas indicadas de un libro Excel en una sola pasada.
+
+    Usa el modo de solo lectura de openpyxl (sin cargar estilos ni objetos por
+    celda) y lee únicamente las hojas pedidas.
+
+    Args:
+        contenido (bytes): Bytes del archivo .xlsx.
+        hojas (iterable, optional): Nombres de las hojas a leer. Por defecto, todas.
+
+    Returns:
+        dict: Nombre de hoja → DataFrame.
+
+    Raises:
+        ValueError: Si falta alguna de las hojas pedidas.
+    """
+
+    from openpyxl import load_workbook
+
+    libro = load_workbook(BytesIO(contenido), read_only=True, data_only=True)
+    try:
+        nombres = libro.sheetnames if hojas is None else list(dict.fromkeys(hojas))
+        faltantes = [h for h in nombres if h not in libro.sheetnames]
+        if faltantes:
+            raise ValueError(
+                f"❌ El archivo no contiene la(s) hoja(s): {', '.join(faltantes)}. "
+                f"Hojas disponibles: {', '.join(libro.sheetnames)}"
+            )
+        return {hoja: _tabla_desde_filas(libro[hoja].iter_rows(values_only=True)) for hoja in nombres}
+    finally:
+        libro.close()
+
+
+def _columnas_texto_a_str(df: pd.DataFrame) -> pd.DataFrame:
+    """Convierte a texto las columnas de `COLUMNAS_TEXTO` que se leyeron como números."""
+
+    for col in COLUMNAS_TEXTO.intersection(df.columns):
+        if df[col].dtype != object:
+            df[col] = df[col].astype(str).where(df[col].notna(), None).astype(object)
+    return df
+
+
+def leer_tabla(contenido: bytes, extension: str) -> pd.DataFrame:
+    """
+    Lee una tabla en formato columnar (Parquet, Arrow IPC o CSV).
+
+    Los tres formatos se leen con pyarrow sobre el mismo buffer de bytes, sin
+    copiarlo; las columnas numéricas sin nulos pasan a pandas sin copia adicional.
+    El CSV se lee con el lector multihilo de pyarrow y las columnas de
+    `COLUMNAS_TEXTO` se declaran como texto.
+
+    Args:
+        contenido (bytes): Bytes del archivo.
+        extension (str): 'parquet', 'arrow', 'feather', 'ipc' o 'csv'.
+
+    Returns:
+        pd.DataFrame
+
+    Raises:
+        ValueError: Si la extensión no es un formato columnar admitido.
+    """
+
+    import pyarrow as pa
+
+    extension = extension.lower().lstrip(".")
+    buffer = pa.py_buffer(contenido)
+
+    if extension == "parquet":
+        import pyarrow.parquet as pq
+        tabla = pq.read_table(pa.BufferReader(buffer))
+    elif extension in ("arrow", "feather", "ipc"):
+        import pyarrow.ipc as ipc
+        try:
+            tabla = ipc.open_file(buffer).read_all()
+        except pa.ArrowInvalid:
+            # Formato de streaming de Arrow (sin pie de archivo)
+            tabla = ipc.open_stream(buffer).read_all()
+    elif extension == "csv":
+        import pyarrow.csv as pcsv
+        tabla = pcsv.read_csv(
+            pa.BufferReader(buffer),
+            convert_options=pcsv.ConvertOptions(column_types={col: pa.string() for col in COLUMNAS_TEXTO})
+        )
+    else:
+        raise ValueError(
+            f"❌ Formato '{extension}' no admitido. Formatos: {', '.join(EXTENSIONES_COLUMNARES)}."
+        )
+
+    return _columnas_texto_a_str(tabla.to_pandas(split_blocks=True, self_destruct=True))
+
+
+def _nombre_y_contenido(archivo):
+    """Normaliza un archivo (ruta, tupla (nombre, bytes) o archivo subido) a (nombre, bytes)."""
+
+    if isinstance(archivo, (str, os.PathLike)):
+        with open(archivo, "rb") as f:
+            return os.path.basename(archivo), f.read()
+    if isinstance(archivo, tuple):
+        return archivo
+    return archivo.name, archivo.getvalue()
+
+
+def leer_archivos(archivos, hojas) -> dict:
+    """
+    Lee las tablas de entrada de un libro Excel o de varios archivos columnares.
+
+    - Un único `.xlsx`: se leen las hojas pedidas con `leer_libro`.
+    - Archivos Parquet/Arrow/CSV: cada archivo es una tabla y su nombre sin
+      extensión indica la hoja (`modelo.parquet`, `restricciones.csv`,
+      `costos.arrow`). Si se pide una sola hoja y se sube un solo archivo, se
+      usa ese archivo sin importar su nombre.
+
+    Args:
+        archivos (list): Rutas, tuplas (nombre, bytes) o archivos subidos.
+        hojas (iterable): Nombres de las tablas necesarias.
+
+    Returns:
+        dict: Nombre de hoja → DataFrame.
+
+    Raises:
+        ValueError: Si el formato no es admitido o falta alguna tabla.
+    """
+
+    archivos = [_nombre_y_contenido(a) for a in archivos]
+    hojas = list(dict.fromkeys(hojas))
+
+    if len(archivos) == 1 and archivos[0][0].lower().endswith(".xlsx"):
+        return leer_libro(archivos[0][1], hojas)
+
+    por_hoja = {}
+    for nombre, contenido in archivos:
+        base, extension = os.path.splitext(nombre)
+        extension = extension.lower().lstrip(".")
+        if extension not in EXTENSIONES_COLUMNARES:
+            raise ValueError(
+                f"❌ El archivo '{nombre}' no es válido aquí. Suba un único .xlsx o archivos "
+                f"{', '.join('.' + e for e in EXTENSIONES_COLUMNARES)}."
+            )
+        por_hoja[base] = (contenido, extension)
+
+    if len(hojas) == 1 and len(por_hoja) == 1:
+        por_hoja = {hojas[0]: next(iter(por_hoja.values()))}
+
+    faltantes = [h for h in hojas if h not in por_hoja]
+    if faltantes:
+        raise ValueError(
+            f"❌ Faltan archivos para: {', '.join(faltantes)}. "
+            "Nombre cada archivo como la hoja que reemplaza (por ejemplo, 'restricciones.csv')."
+        )
+    return {hoja: leer_tabla(*por_hoja[hoja]) for hoja in hojas}
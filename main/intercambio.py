@@ -0,0 +1,847 @@
+import gzip
+import io
+import os
+import re
+from array import array
+from collections import deque
+from contextlib import contextmanager
+from io import BytesIO
+
+import numpy as np
+from scipy import sparse
+
+from main.solvers import FormaMatricial
+
+# Formatos de intercambio de modelos: extensión → nombre
+FORMATOS_MODELO = {"mps": "MPS", "lp": "LP"}
+
+# Columnas (variables) que se formatean y escriben por bloque
+TAMANO_BLOQUE = 10_000
+
+# Términos por línea en las expresiones de los archivos LP
+TERMINOS_POR_LINEA = 8
+
+
+@contextmanager
+def _abrir_texto(archivo, modo):
+    """
+    Abre un archivo de modelo como texto.
+
+    Acepta rutas (las terminadas en `.gz` se comprimen/descomprimen al vuelo),
+    archivos de texto abiertos y archivos binarios (por ejemplo `BytesIO` o un
+    archivo subido en Streamlit), que se envuelven sin copiar su contenido.
+    """
+
+    if isinstance(archivo, (str, os.PathLike)):
+        abrir = gzip.open if os.fspath(archivo).endswith(".gz") else open
+        with abrir(archivo, modo + "t", encoding="utf-8") as f:
+            yield f
+    elif isinstance(archivo, io.TextIOBase):
+        yield archivo
+    else:
+        texto = io.TextIOWrapper(archivo, encoding="utf-8")
+        try:
+            yield texto
+        finally:
+            if modo == "w":
+                texto.flush()
+            texto.detach()
+
+
+def formato_de_archivo(nombre) -> str:
+    """
+    Deduce el formato ('mps' o 'lp') a partir del nombre de un archivo.
+
+    Args:
+        nombre (str): Nombre o ruta del archivo (se ignora un sufijo `.gz`).
+
+    Returns:
+        str: 'mps' o 'lp'.
+
+    Raises:
+        ValueError: Si la extensión no corresponde a un formato admitido.
+    """
+
+    nombre = os.fspath(nombre).lower()
+    if nombre.endswith(".gz"):
+        nombre = nombre[:-3]
+    extension = os.path.splitext(nombre)[1].lstrip(".")
+    if extension not in FORMATOS_MODELO:
+        raise ValueError(f"❌ Formato de modelo no admitido: '{extension}'. Formatos: .mps, .lp.")
+    return extension
+
+
+def _verificar_nombres(forma: FormaMatricial):
+    """Verifica que los nombres de variables y restricciones no contengan espacios."""
+
+    for nombre in (*forma.nombres_variables, *forma.nombres_restricciones):
+        if re.search(r"\s", str(nombre)):
+            raise ValueError(f"❌ El nombre '{nombre}' contiene espacios y no puede exportarse.")
+
+
+def _escribir(funcion, forma, destino, nombre):
+    """Escribe un modelo en `destino` o, si no se indica, en un BytesIO que se devuelve."""
+
+    _verificar_nombres(forma)
+    salida = BytesIO() if destino is None else destino
+    with _abrir_texto(salida, "w") as f:
+        funcion(forma, f, nombre)
+    if destino is None:
+        salida.seek(0)
+        return salida
+    return None
+
+
+def _bloques_columnas(A, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Recorre una matriz CSC por bloques de columnas.
+
+    Genera (inicio, punteros, indices, datos) con listas de Python por bloque,
+    de modo que el formateo no convierte la matriz completa de una vez.
+    """
+
+    n = A.shape[1]
+    for inicio in range(0, n, tamano_bloque):
+        fin = min(n, inicio + tamano_bloque)
+        p0, p1 = A.indptr[inicio], A.indptr[fin]
+        yield (
+            inicio,
+            (A.indptr[inicio:fin + 1] - p0).tolist(),
+            A.indices[p0:p1].tolist(),
+            A.data[p0:p1].tolist(),
+        )
+
+
+# ---------------------------------------------------------------------------
+# MPS
+# ---------------------------------------------------------------------------
+
+def _escribir_mps(forma: FormaMatricial, f, nombre):
+    """Escribe un modelo en formato MPS libre."""
+
+    libres = ~np.isfinite(forma.fila_inf) & ~np.isfinite(forma.fila_sup)
+    filas = np.flatnonzero(~libres)
+    nombres_filas = [forma.nombres_restricciones[i] for i in filas]
+    fila_inf, fila_sup = forma.fila_inf[filas], forma.fila_sup[filas]
+    A = forma.A.tocsr()[filas].tocsc()
+
+    fila_objetivo = "OBJ"
+    existentes = set(nombres_filas)
+    while fila_objetivo in existentes:
+        fila_objetivo += "_"
+
+    f.write(f"NAME {nombre}\n")
+    if forma.maximizar:
+        f.write("OBJSENSE\n    MAX\n")
+
+    # Filas: los rangos se escriben como 'L' con RANGES = sup - inf
+    igualdad = fila_inf == fila_sup
+    tipos = np.where(igualdad, "E", np.where(np.isfinite(fila_sup), "L", "G"))
+    f.write("ROWS\n")
+    f.write(f" N  {fila_objetivo}\n")
+    f.writelines(f" {tipo}  {fila}\n" for tipo, fila in zip(tipos.tolist(), nombres_filas))
+
+    f.write("COLUMNS\n")
+    c = forma.c
+    enteras = forma.enteras.tolist()
+    en_marcador = False
+    for inicio, punteros, indices, datos in _bloques_columnas(A):
+        lineas = []
+        costos = c[inicio:inicio + len(punteros) - 1].tolist()
+        for k, costo in enumerate(costos):
+            variable = forma.nombres_variables[inicio + k]
+            desde, hasta = punteros[k], punteros[k + 1]
+            # Las columnas enteras consecutivas van entre marcadores INTORG / INTEND
+            if enteras[inicio + k] != en_marcador:
+                en_marcador = not en_marcador
+                lineas.append(f"    MARKER  'MARKER'  '{'INTORG' if en_marcador else 'INTEND'}'\n")
+            if costo != 0 or desde == hasta:
+                lineas.append(f"    {variable}  {fila_objetivo}  {costo}\n")
+            for p in range(desde, hasta):
+                lineas.append(f"    {variable}  {nombres_filas[indices[p]]}  {datos[p]}\n")
+        f.write("".join(lineas))
+    if en_marcador:
+        f.write("    MARKER  'MARKER'  'INTEND'\n")
+
+    rhs = np.where(tipos == "G", fila_inf, fila_sup)
+    f.write("RHS\n")
+    if forma.constante:
+        f.write(f"    RHS  {fila_objetivo}  {-float(forma.constante)}\n")
+    for i in np.flatnonzero(rhs).tolist():
+        f.write(f"    RHS  {nombres_filas[i]}  {float(rhs[i])}\n")
+
+    rangos = np.flatnonzero(~igualdad & np.isfinite(fila_inf) & np.isfinite(fila_sup))
+    if len(rangos):
+        f.write("RANGES\n")
+        for i in rangos.tolist():
+            f.write(f"    RNG  {nombres_filas[i]}  {float(fila_sup[i] - fila_inf[i])}\n")
+
+    var_inf, var_sup = forma.var_inf, forma.var_sup
+    # Las enteras sin cota superior llevan PL: algunos lectores las tomarían como binarias
+    con_cotas = np.flatnonzero((var_inf != 0) | np.isfinite(var_sup) | forma.enteras)
+    if len(con_cotas):
+        f.write("BOUNDS\n")
+        for j in con_cotas.tolist():
+            variable, inf, sup = forma.nombres_variables[j], float(var_inf[j]), float(var_sup[j])
+            if inf == sup:
+                f.write(f" FX BND  {variable}  {inf}\n")
+                continue
+            if inf == -np.inf and sup == np.inf:
+                f.write(f" FR BND  {variable}\n")
+                continue
+            if inf == -np.inf:
+                f.write(f" MI BND  {variable}\n")
+            elif inf != 0 or sup < 0:
+                f.write(f" LO BND  {variable}  {inf}\n")
+            if sup != np.inf:
+                f.write(f" UP BND  {variable}  {sup}\n")
+            elif enteras[j]:
+                f.write(f" PL BND  {variable}\n")
+
+    f.write("ENDATA\n")
+
+
+def escribir_mps(forma: FormaMatricial, destino=None, nombre="MODELO"):
+    """
+    Exporta un modelo en formato MPS libre.
+
+    El archivo se escribe por bloques de columnas directamente desde la matriz
+    dispersa, sin armarlo completo en memoria. La maximización se indica con la
+    sección OBJSENSE, las restricciones con ambos lados finitos se escriben como
+    rangos, el término constante de la FO como RHS de la fila objetivo y las
+    variables enteras entre marcadores INTORG / INTEND.
+
+    Args:
+        forma (FormaMatricial): Modelo a exportar.
+        destino (str | file, optional): Ruta (con `.gz` se comprime) o archivo abierto.
+            Si no se indica, se devuelve un BytesIO.
+        nombre (str): Nombre del modelo (sección NAME).
+
+    Returns:
+        BytesIO | None: El archivo en memoria si no se indicó `destino`.
+
+    Raises:
+        ValueError: Si algún nombre contiene espacios.
+    """
+
+    return _escribir(_escribir_mps, forma, destino, nombre)
+
+
+def leer_mps(origen) -> FormaMatricial:
+    """
+    Importa un modelo en formato MPS (libre o fijo, con nombres sin espacios).
+
+    El archivo se lee línea a línea y los coeficientes se acumulan en arreglos
+    compactos que se convierten al final en una matriz dispersa, sin tablas
+    intermedias. Admite las secciones OBJSENSE, ROWS, COLUMNS, RHS, RANGES y
+    BOUNDS; la primera fila 'N' es la función objetivo y las demás filas 'N'
+    se descartan. Las columnas entre marcadores INTORG / INTEND y las de cotas
+    BV, LI o UI se importan como enteras.
+
+    Args:
+        origen (str | file): Ruta (también `.mps.gz`) o archivo abierto (texto o binario).
+
+    Returns:
+        FormaMatricial: Modelo importado.
+
+    Raises:
+        ValueError: Si el archivo no es un MPS válido o usa cotas no admitidas.
+    """
+
+    nombre_fo = None
+    maximizar = False
+    constante = 0.0
+    filas, tipos, libres = {}, [], set()
+    columnas = {}
+    filas_a, columnas_a, valores_a = array("q"), array("q"), array("d")
+    columnas_fo, valores_fo = array("q"), array("d")
+    rhs = rangos = var_inf = var_sup = None
+    inf_explicita = set()
+    enteras, en_marcador = set(), False
+    seccion = None
+
+    def fila(nombre):
+        try:
+            return filas[nombre]
+        except KeyError:
+            raise ValueError(f"❌ Fila '{nombre}' no declarada en la sección ROWS del archivo MPS.") from None
+
+    def columna(nombre):
+        try:
+            return columnas[nombre]
+        except KeyError:
+            raise ValueError(f"❌ Columna '{nombre}' no declarada en la sección COLUMNS del archivo MPS.") from None
+
+    with _abrir_texto(origen, "r") as f:
+        for linea in f:
+            if not linea.strip() or linea.startswith("*"):
+                continue
+            t = linea.split()
+
+            if not linea[0].isspace():
+                seccion = t[0].upper()
+                if seccion == "ENDATA":
+                    break
+                if seccion == "OBJSENSE" and len(t) > 1:
+                    maximizar = t[1].upper() in ("MAX", "MAXIMIZE")
+                if seccion in ("RHS", "RANGES", "BOUNDS") and rhs is None:
+                    rhs = np.zeros(len(tipos))
+                    rangos = np.full(len(tipos), np.nan)
+                if seccion in ("RHS", "RANGES", "BOUNDS") and var_inf is None:
+                    var_inf = np.zeros(len(columnas))
+                    var_sup = np.full(len(columnas), np.inf)
+                continue
+
+            if seccion == "OBJSENSE":
+                maximizar = t[0].upper() in ("MAX", "MAXIMIZE")
+            elif seccion == "ROWS":
+                tipo, nombre = t[0].upper(), t[1]
+                if tipo == "N":
+                    if nombre_fo is None:
+                        nombre_fo = nombre
+                    else:
+                        libres.add(nombre)
+                elif tipo in ("L", "G", "E"):
+                    filas[nombre] = len(tipos)
+                    tipos.append(tipo)
+                else:
+                    raise ValueError(f"❌ Tipo de fila desconocido en el archivo MPS: '{t[0]}'.")
+            elif seccion == "COLUMNS":
+                if len(t) > 1 and t[1] == "'MARKER'":
+                    en_marcador = len(t) > 2 and t[2] == "'INTORG'"
+                    continue
+                j = columnas.setdefault(t[0], len(columnas))
+                if en_marcador:
+                    enteras.add(j)
+                for k in range(1, len(t) - 1, 2):
+                    nombre, valor = t[k], float(t[k + 1])
+                    if nombre == nombre_fo:
+                        columnas_fo.append(j)
+                        valores_fo.append(valor)
+                    elif nombre not in libres:
+                        filas_a.append(fila(nombre))
+                        columnas_a.append(j)
+                        valores_a.append(valor)
+            elif seccion in ("RHS", "RANGES"):
+                if len(t) % 2 == 1:
+                    t = t[1:]  # nombre del conjunto
+                for k in range(0, len(t) - 1, 2):
+                    nombre, valor = t[k], float(t[k + 1])
+                    if nombre == nombre_fo:
+                        if seccion == "RHS":
+                            constante = -valor
+                    elif nombre not in libres:
+                        (rhs if seccion == "RHS" else rangos)[fila(nombre)] = valor
+            elif seccion == "BOUNDS":
+                tipo = t[0].upper()
+                if tipo in ("UP", "LO", "FX", "LI", "UI"):
+                    j, valor = columna(t[-2]), float(t[-1])
+                    if tipo in ("LI", "UI"):
+                        enteras.add(j)
+                    if tipo in ("LO", "LI", "FX"):
+                        var_inf[j] = valor
+                        inf_explicita.add(j)
+                    if tipo in ("UP", "UI", "FX"):
+                        var_sup[j] = valor
+                        # Convención clásica: UP negativo sin cota inferior explícita la vuelve -inf
+                        if valor < 0 and j not in inf_explicita:
+                            var_inf[j] = -np.inf
+                elif tipo in ("FR", "MI", "PL", "BV"):
+                    j = columna(t[2] if len(t) > 2 else t[1])
+                    inf_explicita.add(j)
+                    if tipo in ("FR", "MI"):
+                        var_inf[j] = -np.inf
+                    if tipo in ("FR", "PL"):
+                        var_sup[j] = np.inf
+                    if tipo == "BV":
+                        var_inf[j], var_sup[j] = 0.0, 1.0
+                        enteras.add(j)
+                else:
+                    raise ValueError(f"❌ Tipo de cota no admitido en el archivo MPS: '{t[0]}'.")
+            elif seccion != "NAME":
+                raise ValueError(f"❌ Sección desconocida en el archivo MPS: '{seccion}'.")
+
+    m, n = len(tipos), len(columnas)
+    if rhs is None:
+        rhs, rangos = np.zeros(m), np.full(m, np.nan)
+    if var_inf is None:
+        var_inf, var_sup = np.zeros(n), np.full(n, np.inf)
+
+    tipos = np.array(tipos, dtype="U1")
+    fila_inf = np.where(tipos == "L", -np.inf, rhs)
+    fila_sup = np.where(tipos == "G", np.inf, rhs)
+
+    # Rangos: L → [rhs - |R|, rhs], G → [rhs, rhs + |R|], E → según el signo de R
+    con_rango = ~np.isnan(rangos)
+    r = np.where(con_rango, rangos, 0.0)
+    fila_inf = np.where(con_rango & ((tipos == "L") | ((tipos == "E") & (r < 0))), rhs - np.abs(r), fila_inf)
+    fila_sup = np.where(con_rango & ((tipos == "G") | ((tipos == "E") & (r > 0))), rhs + np.abs(r), fila_sup)
+
+    return FormaMatricial(
+        nombres_variables=list(columnas),
+        nombres_restricciones=list(filas),
+        c=np.bincount(np.frombuffer(columnas_fo, dtype=np.int64), weights=np.frombuffer(valores_fo),
+                      minlength=n).astype(float),
+        A=sparse.csr_matrix(
+            (np.frombuffer(valores_a), (np.frombuffer(filas_a, dtype=np.int64), np.frombuffer(columnas_a, dtype=np.int64))),
+            shape=(m, n)
+        ),
+        fila_inf=fila_inf,
+        fila_sup=fila_sup,
+        var_inf=var_inf,
+        var_sup=var_sup,
+        maximizar=maximizar,
+        constante=constante,
+        enteras=np.isin(np.arange(n), list(enteras)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# LP (formato CPLEX)
+# ---------------------------------------------------------------------------
+
+def _terminos_lp(nombres, coeficientes):
+    """Formatea una expresión lineal del formato LP, cortando la línea cada pocos términos."""
+
+    partes = []
+    for k, (nombre, coef) in enumerate(zip(nombres, coeficientes)):
+        if k and k % TERMINOS_POR_LINEA == 0:
+            partes.append("\n  ")
+        partes.append(f" {'-' if coef < 0 else '+'} {abs(coef)} {nombre}")
+    return "".join(partes)
+
+
+def _numero_lp(valor):
+    """Formatea un número del formato LP (incluidos los infinitos)."""
+
+    if valor == np.inf:
+        return "+inf"
+    if valor == -np.inf:
+        return "-inf"
+    return str(float(valor))
+
+
+# Nombres que el lector LP reconoce como un único identificador
+_PATRON_NOMBRE_LP = r"[A-Za-z_!\"#$%&()/,;?@'`{}|~][^\s+\-:<>=\[\]*^\\]*"
+_NOMBRE_LP = re.compile(_PATRON_NOMBRE_LP)
+
+
+def _verificar_nombres_lp(forma: FormaMatricial):
+    """
+    Verifica que los nombres se puedan leer de vuelta desde un archivo LP.
+
+    El formato LP no tiene separadores entre coeficientes y nombres: un nombre
+    que empieza con un dígito o un punto, que contiene operadores (+-:<>=[]*^\\)
+    o que coincide con una palabra clave (infinito o una sección) se leería
+    como otro modelo.
+    """
+
+    for nombre in (*forma.nombres_variables, *forma.nombres_restricciones):
+        texto = str(nombre)
+        if (not _NOMBRE_LP.fullmatch(texto) or texto.lower() in _INFINITOS
+                or _SECCION_LP.fullmatch(texto)):
+            raise ValueError(
+                f"❌ El nombre '{nombre}' no puede exportarse en formato LP: no debe empezar con un dígito "
+                "ni un punto, ser una palabra clave del formato ni contener espacios ni los caracteres + - : < > = [ ] * ^ \\. Use el formato MPS."
+            )
+
+
+def _escribir_lp(forma: FormaMatricial, f, nombre):
+    """Escribe un modelo en formato LP de CPLEX."""
+
+    nombres = forma.nombres_variables
+    A = forma.A.tocsr()
+    usadas = np.zeros(len(nombres), dtype=bool)
+    usadas[A.indices] = True
+
+    f.write(f"\\ Modelo: {nombre}\n")
+    f.write("Maximize\n" if forma.maximizar else "Minimize\n")
+    no_nulos = np.flatnonzero(forma.c)
+    usadas[no_nulos] = True
+    objetivo = _terminos_lp((nombres[j] for j in no_nulos.tolist()), forma.c[no_nulos].tolist())
+    if forma.constante:
+        objetivo += f" {'-' if forma.constante < 0 else '+'} {abs(float(forma.constante))}"
+    if not objetivo and nombres:
+        objetivo = f" 0 {nombres[0]}"
+    f.write(f" obj:{objetivo}\n")
+
+    f.write("Subject To\n")
+    fila_inf, fila_sup = forma.fila_inf.tolist(), forma.fila_sup.tolist()
+    for i, restriccion in enumerate(forma.nombres_restricciones):
+        inf, sup = fila_inf[i], fila_sup[i]
+        if inf == -np.inf and sup == np.inf:
+            continue
+        desde, hasta = A.indptr[i], A.indptr[i + 1]
+        expr = _terminos_lp((nombres[j] for j in A.indices[desde:hasta].tolist()), A.data[desde:hasta].tolist())
+        if not expr:
+            if not nombres:
+                continue
+            expr = f" 0 {nombres[0]}"
+        if inf == sup:
+            f.write(f" {restriccion}:{expr} = {_numero_lp(sup)}\n")
+        elif inf == -np.inf:
+            f.write(f" {restriccion}:{expr} <= {_numero_lp(sup)}\n")
+        elif sup == np.inf:
+            f.write(f" {restriccion}:{expr} >= {_numero_lp(inf)}\n")
+        else:
+            # Rango: dos restricciones con sufijos _inf / _sup
+            f.write(f" {restriccion}_inf:{expr} >= {_numero_lp(inf)}\n")
+            f.write(f" {restriccion}_sup:{expr} <= {_numero_lp(sup)}\n")
+
+    f.write("Bounds\n")
+    var_inf, var_sup = forma.var_inf, forma.var_sup
+    for j in np.flatnonzero((var_inf != 0) | np.isfinite(var_sup) | ~usadas).tolist():
+        variable, inf, sup = nombres[j], float(var_inf[j]), float(var_sup[j])
+        if inf == sup:
+            f.write(f" {variable} = {_numero_lp(inf)}\n")
+        elif inf == -np.inf and sup == np.inf:
+            f.write(f" {variable} free\n")
+        elif sup == np.inf:
+            f.write(f" {variable} >= {_numero_lp(inf)}\n")
+        else:
+            f.write(f" {_numero_lp(inf)} <= {variable} <= {_numero_lp(sup)}\n")
+
+    enteras = np.flatnonzero(forma.enteras).tolist()
+    if enteras:
+        f.write("General\n")
+        for k in range(0, len(enteras), TERMINOS_POR_LINEA):
+            f.write(" " + " ".join(nombres[j] for j in enteras[k:k + TERMINOS_POR_LINEA]) + "\n")
+
+    f.write("End\n")
+
+
+def escribir_lp(forma: FormaMatricial, destino=None, nombre="MODELO"):
+    """
+    Exporta un modelo en formato LP de CPLEX.
+
+    Las restricciones se escriben una por línea (cortando las expresiones
+    largas) directamente desde la matriz dispersa. Las restricciones con ambos
+    lados finitos y distintos se escriben como dos restricciones con los
+    sufijos `_inf` y `_sup`, y las variables enteras en la sección General.
+
+    Args:
+        forma (FormaMatricial): Modelo a exportar.
+        destino (str | file, optional): Ruta (con `.gz` se comprime) o archivo abierto.
+            Si no se indica, se devuelve un BytesIO.
+        nombre (str): Nombre del modelo (comentario inicial).
+
+    Returns:
+        BytesIO | None: El archivo en memoria si no se indicó `destino`.
+
+    Raises:
+        ValueError: Si algún nombre no puede leerse de vuelta en formato LP (ver `_verificar_nombres_lp`).
+    """
+
+    _verificar_nombres_lp(forma)
+    return _escribir(_escribir_lp, forma, destino, nombre)
+
+
+# Palabras clave de sección del formato LP (al comienzo de una línea)
+_SECCION_LP = re.compile(
+    r"\s*(?:"
+    r"(?P<max>maximi[sz]e|maximum|max)"
+    r"|(?P<min>minimi[sz]e|minimum|min)"
+    r"|(?P<st>subject\s+to|such\s+that|st|s\.t\.)"
+    r"|(?P<bounds>bounds?)"
+    r"|(?P<general>generals?|gen|integers?)"
+    r"|(?P<binary>binar(?:y|ies)|bin)"
+    r"|(?P<semi>semi-continuous|semis?)"
+    r"|(?P<sos>sos)"
+    r"|(?P<end>end)"
+    r")(?=\s|$)",
+    re.IGNORECASE,
+)
+
+_TOKEN_LP = re.compile(
+    r"\s*(?:"
+    r"(?P<op><=|=<|>=|=>|<|>|=)"
+    r"|(?P<signo>[+-])"
+    r"|(?P<dos_puntos>:)"
+    r"|(?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)"
+    rf"|(?P<nombre>{_PATRON_NOMBRE_LP})"
+    r"|(?P<otro>\S)"
+    r")"
+)
+
+_INFINITOS = {"inf", "infinity"}
+
+_OPERADORES = {"<": "<=", "=<": "<=", "<=": "<=", ">": ">=", "=>": ">=", ">=": ">=", "=": "="}
+
+
+def _tokens_lp(f):
+    """Genera los tokens (tipo, texto) de un archivo LP línea a línea, sin comentarios."""
+
+    for linea in f:
+        linea = linea.split("\\", 1)[0]
+        pos = 0
+        seccion = _SECCION_LP.match(linea)
+        if seccion:
+            yield "seccion", seccion.lastgroup
+            pos = seccion.end()
+        for token in _TOKEN_LP.finditer(linea, pos):
+            yield token.lastgroup, token.group(token.lastgroup)
+
+
+class _LectorLP:
+    """Flujo de tokens de un archivo LP con anticipación arbitraria."""
+
+    def __init__(self, f):
+        self._tokens = _tokens_lp(f)
+        self._pendientes = deque()
+
+    def ver(self, k=0):
+        while len(self._pendientes) <= k:
+            self._pendientes.append(next(self._tokens, ("fin", None)))
+        return self._pendientes[k]
+
+    def tomar(self, tipo=None):
+        token = self.ver()
+        if tipo is not None and token[0] != tipo:
+            raise ValueError(f"❌ Se esperaba '{tipo}' en el archivo LP y se encontró '{token[1]}'.")
+        self._pendientes.popleft()
+        return token[1]
+
+    def es_numero(self, k=0):
+        """Indica si en la posición k (tras los signos) comienza un número."""
+
+        while self.ver(k)[0] == "signo":
+            k += 1
+        tipo, valor = self.ver(k)
+        return tipo == "numero" or (tipo == "nombre" and valor.lower() in _INFINITOS), k
+
+    def numero(self):
+        signo = 1.0
+        while self.ver()[0] == "signo":
+            signo *= -1.0 if self.tomar() == "-" else 1.0
+        tipo, valor = self.ver()
+        if tipo == "nombre" and valor.lower() in _INFINITOS:
+            self.tomar()
+            return signo * np.inf
+        return signo * float(self.tomar("numero"))
+
+    def operador(self):
+        return _OPERADORES[self.tomar("op")]
+
+    def expresion(self):
+        """Genera (variable, coeficiente) hasta un operador o una sección; variable None para constantes."""
+
+        while True:
+            tipo, valor = self.ver()
+            if tipo in ("op", "seccion", "fin"):
+                return
+            signo = 1.0
+            while tipo == "signo":
+                signo *= -1.0 if self.tomar() == "-" else 1.0
+                tipo, valor = self.ver()
+            coeficiente = None
+            if tipo == "numero":
+                coeficiente = float(self.tomar())
+                tipo, valor = self.ver()
+            if tipo == "nombre":
+                yield self.tomar(), signo * (1.0 if coeficiente is None else coeficiente)
+            elif coeficiente is not None:
+                yield None, signo * coeficiente
+            else:
+                raise ValueError(f"❌ Término no admitido en el archivo LP: '{valor}'.")
+
+
+def leer_lp(origen) -> FormaMatricial:
+    """
+    Importa un modelo en formato LP de CPLEX.
+
+    El archivo se recorre como un flujo de tokens y cada término se agrega a
+    arreglos compactos que se convierten al final en una matriz dispersa, sin
+    tablas intermedias. Admite la función objetivo (con término constante),
+    restricciones `<=`, `>=`, `=` y de rango (`inf <= expr <= sup`), la sección
+    Bounds (incluidas `free` e `inf`) y las secciones Generals y Binaries (las
+    binarias se importan como enteras con cotas [0, 1]).
+    Las variables se numeran en orden de aparición.
+
+    Args:
+        origen (str | file): Ruta (también `.lp.gz`) o archivo abierto (texto o binario).
+
+    Returns:
+        FormaMatricial: Modelo importado.
+
+    Raises:
+        ValueError: Si el archivo usa elementos no admitidos (términos cuadráticos,
+            SOS, variables semicontinuas) o no es un LP válido.
+    """
+
+    columnas = {}
+    var_inf, var_sup = array("d"), array("d")
+    columnas_fo, valores_fo = array("q"), array("d")
+    filas_a, columnas_a, valores_a = array("q"), array("q"), array("d")
+    nombres_filas, fila_inf, fila_sup = [], array("d"), array("d")
+    maximizar = False
+    constante = 0.0
+    enteras = set()
+
+    def columna(nombre):
+        j = columnas.get(nombre)
+        if j is None:
+            j = columnas[nombre] = len(columnas)
+            var_inf.append(0.0)
+            var_sup.append(np.inf)
+        return j
+
+    def acotar(j, operador, valor):
+        if operador in (">=", "="):
+            var_inf[j] = valor
+        if operador in ("<=", "="):
+            var_sup[j] = valor
+
+    with _abrir_texto(origen, "r") as f:
+        lector = _LectorLP(f)
+        seccion = None
+
+        while True:
+            tipo, valor = lector.ver()
+            if tipo == "fin":
+                break
+
+            if tipo == "seccion":
+                seccion = lector.tomar()
+                if seccion == "end":
+                    break
+                if seccion in ("semi", "sos"):
+                    raise ValueError("❌ El archivo LP usa variables semicontinuas o SOS, que no se admiten.")
+                if seccion in ("max", "min"):
+                    maximizar = seccion == "max"
+                    if lector.ver()[0] == "nombre" and lector.ver(1)[0] == "dos_puntos":
+                        lector.tomar()
+                        lector.tomar()
+                    for variable, coeficiente in lector.expresion():
+                        if variable is None:
+                            constante += coeficiente
+                        else:
+                            columnas_fo.append(columna(variable))
+                            valores_fo.append(coeficiente)
+                    if lector.ver()[0] == "op":
+                        raise ValueError("❌ La función objetivo del archivo LP no puede contener operadores.")
+                continue
+
+            if seccion == "st":
+                nombre = None
+                if tipo == "nombre" and lector.ver(1)[0] == "dos_puntos":
+                    nombre = lector.tomar()
+                    lector.tomar()
+
+                es_rango, k = lector.es_numero()
+                if es_rango and lector.ver(k + 1)[0] == "op":
+                    izquierda = lector.numero()
+                    operador_izq = lector.operador()
+                    terminos = list(lector.expresion())
+                    operador_der = lector.operador()
+                    derecha = lector.numero()
+                    if operador_izq == operador_der == "<=":
+                        inf, sup = izquierda, derecha
+                    elif operador_izq == operador_der == ">=":
+                        inf, sup = derecha, izquierda
+                    else:
+                        raise ValueError(f"❌ Restricción de rango inválida en el archivo LP: '{nombre}'.")
+                else:
+                    terminos = list(lector.expresion())
+                    operador = lector.operador()
+                    rhs = lector.numero()
+                    inf = rhs if operador in (">=", "=") else -np.inf
+                    sup = rhs if operador in ("<=", "=") else np.inf
+
+                # Las constantes del lado izquierdo pasan al lado derecho
+                desplazamiento = sum(coef for variable, coef in terminos if variable is None)
+                i = len(nombres_filas)
+                nombres_filas.append(nombre or f"R{i + 1}")
+                fila_inf.append(inf - desplazamiento)
+                fila_sup.append(sup - desplazamiento)
+                for variable, coeficiente in terminos:
+                    if variable is not None:
+                        filas_a.append(i)
+                        columnas_a.append(columna(variable))
+                        valores_a.append(coeficiente)
+
+            elif seccion == "bounds":
+                siguiente = lector.ver(1)
+                if tipo == "nombre" and siguiente[0] == "nombre" and siguiente[1].lower() == "free":
+                    j = columna(lector.tomar())
+                    lector.tomar()
+                    var_inf[j], var_sup[j] = -np.inf, np.inf
+                elif lector.es_numero()[0]:
+                    valor = lector.numero()
+                    operador = {"<=": ">=", ">=": "<=", "=": "="}[lector.operador()]
+                    j = columna(lector.tomar("nombre"))
+                    acotar(j, operador, valor)
+                    if lector.ver()[0] == "op":
+                        operador = lector.operador()
+                        acotar(j, operador, lector.numero())
+                else:
+                    j = columna(lector.tomar("nombre"))
+                    operador = lector.operador()
+                    acotar(j, operador, lector.numero())
+
+            elif seccion in ("general", "binary"):
+                j = columna(lector.tomar("nombre"))
+                enteras.add(j)
+                if seccion == "binary":
+                    var_inf[j], var_sup[j] = 0.0, 1.0
+
+            else:
+                raise ValueError(f"❌ Contenido inesperado en el archivo LP: '{valor}'.")
+
+    n = len(columnas)
+    return FormaMatricial(
+        nombres_variables=list(columnas),
+        nombres_restricciones=nombres_filas,
+        c=np.bincount(np.frombuffer(columnas_fo, dtype=np.int64), weights=np.frombuffer(valores_fo),
+                      minlength=n).astype(float),
+        A=sparse.csr_matrix(
+            (np.frombuffer(valores_a), (np.frombuffer(filas_a, dtype=np.int64), np.frombuffer(columnas_a, dtype=np.int64))),
+            shape=(len(nombres_filas), n)
+        ),
+        fila_inf=np.frombuffer(fila_inf).copy(),
+        fila_sup=np.frombuffer(fila_sup).copy(),
+        var_inf=np.frombuffer(var_inf).copy(),
+        var_sup=np.frombuffer(var_sup).copy(),
+        maximizar=maximizar,
+        constante=constante,
+        enteras=np.isin(np.arange(n), list(enteras)),
+    )
+
+
+def leer_modelo(origen, formato=None) -> FormaMatricial:
+    """
+    Importa un modelo MPS o LP.
+
+    Args:
+        origen (str | file): Ruta o archivo abierto (o subido, con atributo `name`).
+        formato (str, optional): 'mps' o 'lp'. Por defecto se deduce del nombre del archivo.
+
+    Returns:
+        FormaMatricial: Modelo importado.
+    """
+
+    if formato is None:
+        nombre = getattr(origen, "name", origen)
+        if not isinstance(nombre, (str, os.PathLike)):
+            raise ValueError("❌ Indique el formato del modelo ('mps' o 'lp').")
+        formato = formato_de_archivo(nombre)
+    return leer_lp(origen) if formato.lower() == "lp" else leer_mps(origen)
+
+
+def escribir_modelo(forma: FormaMatricial, destino=None, formato="mps", nombre="MODELO"):
+    """
+    Exporta un modelo en formato MPS o LP (ver `escribir_mps` y `escribir_lp`).
+
+    Args:
+        forma (FormaMatricial): Modelo a exportar.
+        destino (str | file, optional): Ruta o archivo abierto. Si no se indica, se devuelve un BytesIO.
+        formato (str): 'mps' o 'lp'.
+        nombre (str): Nombre del modelo.
+
+    Returns:
+        BytesIO | None: El archivo en memoria si no se indicó `destino`.
+    """
+
+    if formato.lower() not in FORMATOS_MODELO:
+        raise ValueError(f"❌ Formato de modelo no admitido: '{formato}'. Formatos: mps, lp.")
+    escritor = escribir_lp if formato.lower() == "lp" else escribir_mps
+    return escritor(forma, destino, nombre)
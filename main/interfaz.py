@@ -1,10 +1,567 @@
+import os
+from io import BytesIO
+import numpy as np
 import streamlit as st
 import pandas as pd
+from main.cache import CacheResultados, clave_problema
+from main.ejecucion import EjecucionSegundoPlano
+from main.escritor import EscritorSegundoPlano
+from main.ingesta import EXTENSIONES_ENTRADA, hash_contenido, leer_archivos
+from main.intercambio import FORMATOS_MODELO
+from main.medicion import Medicion
+from main.problemas import crear_problema, es_formato_largo
+from main.solvers import diferencias_forma
+from main.registro import RUTA_LOG, consultar_ejecuciones, contar_ejecuciones, existe_historial
+from main.registro import ejecuciones_misma_entrada, obtener_ejecucion, tipos_registrados
 from main.utils import plantilla_modelo, plantilla_restricciones, exportar_resultado_excel
-from main.utils import validar_datos_manual, validar_datos_transporte, registrar_log
-from main.visualizacion import graficar_solucion_lineal
+from main.utils import exportar_resultado_csv, exportar_resultado_parquet
+from main.utils import validar_datos_manual, validar_datos_transporte, registrar_log, modelo_a_ancho
+from main.visualizacion import graficar_parametrico, graficar_solucion_lineal, mostrar_mediciones
 
-def manejar_carga_manual(nombre_modelo, clase_problema):
+@st.cache_resource
+def obtener_cache_resultados():
+    """
+    Devuelve la caché de resultados compartida por todas las sesiones de la app.
+
+    El tamaño se configura con OPTIMIZADOR_CACHE_ENTRADAS y, si se define
+    OPTIMIZADOR_CACHE_DIR, los resultados también se guardan en esa carpeta.
+
+    Returns:
+        CacheResultados: Caché LRU de resultados.
+    """
+
+    return CacheResultados(
+        max_entradas=int(os.environ.get("OPTIMIZADOR_CACHE_ENTRADAS", 128)),
+        directorio=os.environ.get("OPTIMIZADOR_CACHE_DIR")
+    )
+
+def resolver_modelo(clase_problema, datos_entrada: dict, medicion=None, **opciones):
+    """
+    Construye y resuelve un problema, reutilizando el resultado si ya fue resuelto.
+
+    La clave de caché combina la clase, el contenido de los DataFrames de entrada
+    y las opciones, de modo que repetir la ejecución con los mismos datos no
+    vuelve a llamar a `construir()` ni a `resolver()`.
+
+    Args:
+        clase_problema (class): Clase del modelo a resolver.
+        datos_entrada (dict): DataFrames de entrada ('modelo', 'restricciones' o 'costos').
+        medicion (Medicion, optional): Donde medir la construcción, la resolución y el tamaño del modelo.
+        **opciones: Opciones del constructor (por ejemplo `solver` o `maximizar`).
+
+    Returns:
+        dict: Resultado del modelo.
+    """
+
+    medicion = medicion if medicion is not None else Medicion()
+    cache = obtener_cache_resultados()
+    clave = clave_problema(clase_problema, datos_entrada, opciones)
+    resultado = cache.obtener(clave)
+    if resultado is None:
+        problema = crear_problema(clase_problema, datos_entrada, **opciones)
+        with medicion.fase("construccion"):
+            problema.construir()
+        with medicion.fase("resolucion"):
+            resultado = problema.resolver()
+        medicion.medir_modelo(problema)
+        cache.guardar(clave, resultado)
+    return resultado
+
+def resolver_incremental(clave_sesion, clase_problema, datos_entrada: dict, medicion=None, **opciones):
+    """
+    Resuelve un problema editado actualizando el de la ejecución anterior.
+
+    Si el problema guardado en `st.session_state[clave_sesion]` tiene la misma
+    clase, las mismas opciones y las mismas variables, solo se aplican los
+    cambios de FO, RHS y restricciones (`Problema.actualizar`) y se resuelve
+    partiendo de la solución anterior. En otro caso se construye desde cero.
+
+    Args:
+        clave_sesion (str): Clave de `st.session_state` donde se guarda el problema.
+        clase_problema (class): Clase del modelo a resolver (subclase de Problema).
+        datos_entrada (dict): DataFrames de entrada ('modelo', 'restricciones' o 'costos').
+        medicion (Medicion, optional): Donde medir la construcción (o actualización), la
+            resolución y el tamaño del modelo.
+        **opciones: Opciones del constructor (por ejemplo `solver`).
+
+    Returns:
+        dict: Resultado del modelo.
+    """
+
+    medicion = medicion if medicion is not None else Medicion()
+    cache = obtener_cache_resultados()
+    clave = clave_problema(clase_problema, datos_entrada, opciones)
+    resultado = cache.obtener(clave)
+    if resultado is not None:
+        return resultado
+
+    nuevo = crear_problema(clase_problema, datos_entrada, **opciones)
+    firma = (clase_problema, opciones)
+    cambios = None
+    anterior = st.session_state.get(clave_sesion)
+    if anterior is not None and anterior[0] == firma and opciones.get("solver") != "modi":
+        problema = anterior[1]
+        cambios = diferencias_forma(problema.forma_vigente(), nuevo.forma_matricial())
+
+    if cambios is not None:
+        with medicion.fase("actualizacion"):
+            problema.actualizar(**cambios)
+    else:
+        problema = nuevo
+        with medicion.fase("construccion"):
+            problema.construir()
+
+    with medicion.fase("resolucion"):
+        resultado = problema.resolver()
+    medicion.medir_modelo(problema)
+    st.session_state[clave_sesion] = (firma, problema)
+    cache.guardar(clave, resultado)
+    return resultado
+
+def iniciar_resolucion(vista, clave, clase_problema, datos_entrada: dict, medicion=None, **opciones):
+    """
+    Inicia la resolución de un problema en un proceso aparte (ver `main.ejecucion`).
+
+    El script de la app no queda bloqueado: `mostrar_progreso` informa el avance
+    y permite cancelar, y `recoger_resolucion` entrega el resultado al terminar.
+    Si el resultado ya está en la caché no se inicia ningún proceso. Una
+    resolución anterior de la misma vista que siga en curso se cancela.
+
+    Args:
+        vista (str): Identificador de la vista (ver `guardar_resultado_sesion`).
+        clave (str): Clave de la entrada en la vista.
+        clase_problema (class): Clase del modelo a resolver.
+        datos_entrada (dict): DataFrames de entrada ('modelo', 'restricciones' o 'costos').
+        medicion (Medicion, optional): Mediciones de las fases previas; al terminar se le
+            agregan las del proceso de trabajo.
+        **opciones: Opciones del constructor (por ejemplo `solver`, `limite_tiempo` o `gap`).
+
+    Returns:
+        None
+    """
+
+    ejecuciones = st.session_state.setdefault("ejecuciones", {})
+    anterior = ejecuciones.pop(vista, None)
+    if anterior is not None and anterior["ejecucion"] is not None:
+        anterior["ejecucion"].cancelar()
+
+    clave_cache = clave_problema(clase_problema, datos_entrada, opciones)
+    resultado = obtener_cache_resultados().obtener(clave_cache)
+    ejecuciones[vista] = {
+        "clave": clave,
+        "clave_cache": clave_cache,
+        "datos_entrada": datos_entrada,
+        "medicion": medicion if medicion is not None else Medicion(),
+        "resultado": resultado,
+        "ejecucion": None if resultado is not None else EjecucionSegundoPlano(
+            clase_problema, datos_entrada, **opciones
+        ),
+    }
+
+def recoger_resolucion(vista):
+    """
+    Devuelve el resultado de la resolución de la vista si ya terminó.
+
+    El resultado se guarda en la caché de resultados. Si la resolución falló o
+    se canceló, se muestra el motivo.
+
+    Args:
+        vista (str): Identificador de la vista.
+
+    Returns:
+        tuple | None: (clave, resultado, datos_entrada, medicion), o None si no hay una resolución terminada.
+    """
+
+    ejecuciones = st.session_state.get("ejecuciones", {})
+    en_curso = ejecuciones.get(vista)
+    if en_curso is None:
+        return None
+
+    ejecucion = en_curso["ejecucion"]
+    if ejecucion is not None:
+        if not ejecucion.consultar():
+            return None
+        if ejecucion.error is not None:
+            del ejecuciones[vista]
+            st.error(ejecucion.error)
+            return None
+        en_curso["resultado"] = ejecucion.resultado
+        en_curso["medicion"].agregar(ejecucion.mediciones)
+        obtener_cache_resultados().guardar(en_curso["clave_cache"], ejecucion.resultado)
+
+    del ejecuciones[vista]
+    return en_curso["clave"], en_curso["resultado"], en_curso["datos_entrada"], en_curso["medicion"]
+
+@st.fragment(run_every=1)
+def mostrar_progreso(vista):
+    """
+    Muestra el avance de la resolución en curso de la vista y un botón para cancelarla.
+
+    Se vuelve a ejecutar cada segundo (solo este fragmento); cuando la
+    resolución termina, vuelve a ejecutar la app para que `recoger_resolucion`
+    muestre el resultado.
+
+    Args:
+        vista (str): Identificador de la vista.
+
+    Returns:
+        None
+    """
+
+    en_curso = st.session_state.get("ejecuciones", {}).get(vista)
+    if en_curso is None or en_curso["ejecucion"] is None:
+        return
+
+    ejecucion = en_curso["ejecucion"]
+    if ejecucion.consultar():
+        st.rerun()
+
+    progreso = ejecucion.progreso()
+    detalle = [f"{progreso['segundos']:.0f} s"]
+    if "incumbente" in progreso:
+        detalle.append(f"mejor solución: {progreso['incumbente']:g}")
+    if "cota" in progreso:
+        detalle.append(f"cota: {progreso['cota']:g}")
+    if "nodos" in progreso:
+        detalle.append(f"nodos: {progreso['nodos']}")
+    elif "iteraciones" in progreso:
+        detalle.append(f"iteraciones: {progreso['iteraciones']}")
+    st.info("⏳ Resolviendo el modelo · " + " · ".join(detalle))
+
+    if st.button("🛑 Cancelar", key=f"cancelar_{vista}"):
+        ejecucion.cancelar()
+        st.rerun()
+
+# Filas de cada tabla de entrada que se muestran en la vista previa
+FILAS_VISTA_PREVIA = 1000
+
+# Formatos de descarga de resultados: (extensión, tipo MIME)
+FORMATOS_EXPORTACION = {
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+@st.cache_resource
+def obtener_escritor():
+    """
+    Devuelve el escritor en segundo plano compartido por todas las sesiones de la app.
+
+    El tamaño de la cola se configura con OPTIMIZADOR_COLA_ESCRITURA.
+
+    Returns:
+        EscritorSegundoPlano: Hilo de trabajo para registros y archivos de resultados.
+    """
+
+    return EscritorSegundoPlano(max_tareas=int(os.environ.get("OPTIMIZADOR_COLA_ESCRITURA", 64)))
+
+def elegir_formato_exportacion(clave=""):
+    """
+    Muestra las opciones del archivo de resultados (formato y variables nulas).
+
+    Args:
+        clave (str): Sufijo para las claves de los widgets.
+
+    Returns:
+        dict: Opciones 'formato' y 'omitir_ceros' para `encolar_escrituras`.
+    """
+
+    col1, col2 = st.columns(2)
+    formato = col1.selectbox("Formato del archivo de resultados", list(FORMATOS_EXPORTACION), key=f"formato_{clave}")
+    omitir_ceros = col2.checkbox("Omitir variables con valor cero", key=f"omitir_ceros_{clave}")
+    return {"formato": formato, "omitir_ceros": omitir_ceros}
+
+def encolar_escrituras(nombre_modelo, resultado: dict, datos_entrada: dict, grafico_buffer=None,
+                       formato="Excel", omitir_ceros=False, registrar=True, medicion=None):
+    """
+    Envía al escritor en segundo plano el registro en el historial y la generación del archivo de resultados.
+
+    Args:
+        nombre_modelo (str): Etiqueta del tipo de problema.
+        resultado (dict): Resultado del modelo.
+        datos_entrada (dict): DataFrames de entrada.
+        grafico_buffer (BytesIO, optional): Imagen del gráfico a incluir en el Excel.
+        formato (str): Formato del archivo ("Excel", "CSV" o "Parquet").
+        omitir_ceros (bool): Si es True, el archivo no incluye las variables con valor cero.
+        registrar (bool): Si es False, solo genera el archivo (por ejemplo, al cambiar de formato).
+        medicion (Medicion, optional): Mediciones de la ejecución. La generación del archivo
+            se mide como la fase "exportacion" y se encola antes del registro, de modo que
+            el historial la incluye.
+
+    Returns:
+        dict: `Future` del registro ('log', None si no se registra) y del archivo ('archivo'),
+        y las opciones del archivo ('formato' y 'omitir_ceros'), para `mostrar_descarga`.
+    """
+
+    escritor = obtener_escritor()
+    if formato == "CSV":
+        funcion, argumentos = exportar_resultado_csv, (resultado,)
+    elif formato == "Parquet":
+        funcion, argumentos = exportar_resultado_parquet, (resultado,)
+    else:
+        funcion, argumentos = exportar_resultado_excel, (resultado, datos_entrada, grafico_buffer)
+    if medicion is not None:
+        funcion = medicion.medir("exportacion")(funcion)
+
+    # El escritor procesa las tareas en orden: el registro se hace después de exportar
+    archivo = escritor.enviar(funcion, *argumentos, omitir_ceros=omitir_ceros,
+                              descripcion=f"{formato} de {nombre_modelo}")
+    return {
+        "log": escritor.enviar(registrar_log, nombre_modelo, resultado, datos_entrada, medicion=medicion,
+                               descripcion=f"registro de {nombre_modelo}") if registrar else None,
+        "archivo": archivo,
+        "formato": formato,
+        "omitir_ceros": omitir_ceros,
+    }
+
+def guardar_resultado_sesion(vista, clave, resultado: dict, datos_entrada: dict, grafico_buffer=None,
+                             medicion=None):
+    """
+    Guarda el resultado de una vista en `st.session_state` para las reejecuciones de la app.
+
+    Streamlit vuelve a ejecutar el script completo con cada interacción, por lo
+    que el resultado, el gráfico y el archivo exportado se guardan en
+    `st.session_state["resultados"][vista]` junto con la clave de la entrada
+    (ver `main.cache.clave_problema`). `mostrar_resultado_sesion` los vuelve a
+    mostrar sin resolver el modelo mientras la entrada no cambie.
+
+    Args:
+        vista (str): Identificador de la vista (modo de carga y tipo de problema).
+        clave (str): Clave de la entrada resuelta.
+        resultado (dict): Resultado del modelo.
+        datos_entrada (dict): DataFrames de entrada.
+        grafico_buffer (BytesIO, optional): Imagen del gráfico.
+        medicion (Medicion, optional): Tiempos por fase y tamaño del modelo de la ejecución.
+
+    Returns:
+        None
+    """
+
+    st.session_state.setdefault("resultados", {})[vista] = {
+        "clave": clave,
+        "resultado": resultado,
+        "datos_entrada": datos_entrada,
+        "grafico": None if grafico_buffer is None else grafico_buffer.getvalue(),
+        "medicion": medicion if medicion is not None else Medicion(),
+        "escrituras": None,
+    }
+
+def resultado_sesion(vista, clave):
+    """
+    Devuelve lo guardado por `guardar_resultado_sesion` si corresponde a la entrada `clave`.
+
+    Returns:
+        dict | None: Resultado, datos de entrada, gráfico, mediciones y escrituras de la vista, o None.
+    """
+
+    guardado = st.session_state.get("resultados", {}).get(vista)
+    return guardado if guardado is not None and guardado["clave"] == clave else None
+
+def mostrar_resultado_sesion(vista, clave, nombre_modelo, opciones_exportacion: dict,
+                             etiqueta="⬇️ Descargar resultados"):
+    """
+    Muestra el último resultado de la vista, su gráfico y el botón de descarga.
+
+    El registro en el historial y el archivo de resultados se encolan una sola
+    vez por resultado; si después cambia el formato de exportación solo se
+    vuelve a generar el archivo. Si la entrada cambió desde la última ejecución,
+    se avisa en lugar de mostrar un resultado desactualizado.
+
+    Args:
+        vista (str): Identificador de la vista (ver `guardar_resultado_sesion`).
+        clave (str): Clave de la entrada actual.
+        nombre_modelo (str): Etiqueta del tipo de problema.
+        opciones_exportacion (dict): Opciones de `elegir_formato_exportacion`.
+        etiqueta (str): Texto del botón de descarga.
+
+    Returns:
+        None
+    """
+
+    guardado = resultado_sesion(vista, clave)
+    if guardado is None:
+        if vista in st.session_state.get("resultados", {}):
+            st.info("✏️ Los datos cambiaron desde la última ejecución. Ejecute el modelo para actualizar los resultados.")
+        return
+
+    from main import visualizacion
+    visualizacion.mostrar_resultados(guardado["resultado"])
+    if guardado["grafico"] is not None:
+        st.image(guardado["grafico"])
+
+    escrituras = guardado["escrituras"]
+    if escrituras is None or any(escrituras[k] != v for k, v in opciones_exportacion.items()):
+        grafico = None if guardado["grafico"] is None else BytesIO(guardado["grafico"])
+        guardado["escrituras"] = encolar_escrituras(
+            nombre_modelo, guardado["resultado"], guardado["datos_entrada"], grafico,
+            registrar=escrituras is None, medicion=guardado["medicion"], **opciones_exportacion
+        )
+
+    mostrar_descarga(vista, etiqueta)
+
+def mostrar_exportacion_modelo(clase_problema, datos_entrada: dict, clave="", **opciones):
+    """
+    Permite descargar el modelo (sin resolverlo) en formato MPS o LP.
+
+    El archivo se genera desde la forma matricial del problema solo cuando el
+    usuario lo pide, para no recalcularlo en cada reejecución de la app.
+
+    Args:
+        clase_problema (class): Clase del modelo.
+        datos_entrada (dict): DataFrames de entrada ('modelo' y 'restricciones', o 'costos').
+        clave (str): Sufijo para las claves de los widgets.
+        **opciones: Opciones del constructor (por ejemplo `solver`).
+
+    Returns:
+        None
+    """
+
+    with st.expander("📤 Exportar modelo (MPS / LP)"):
+        extension = st.selectbox(
+            "Formato del modelo", list(FORMATOS_MODELO), format_func=FORMATOS_MODELO.get,
+            key=f"formato_modelo_{clave}"
+        )
+        if st.button("Generar archivo del modelo", key=f"generar_modelo_{clave}"):
+            problema = crear_problema(clase_problema, datos_entrada, **opciones)
+            try:
+                archivo = problema.exportar(formato=extension)
+            except ValueError as e:
+                st.error(str(e))
+                return
+            st.download_button(
+                f"⬇️ Descargar modelo ({FORMATOS_MODELO[extension]})",
+                data=archivo,
+                file_name=f"modelo.{extension}",
+                mime="text/plain",
+                key=f"descargar_modelo_{clave}"
+            )
+
+def mostrar_analisis_parametrico(clase_problema, datos_entrada: dict, clave="", **opciones):
+    """
+    Permite variar un RHS o un coeficiente de la FO en un rango y ver la curva del valor óptimo.
+
+    Los nombres de restricciones y variables se obtienen de la forma matricial
+    solo si el usuario activa el análisis (ver `Problema.analisis_parametrico`).
+
+    Args:
+        clase_problema (class): Clase del modelo.
+        datos_entrada (dict): DataFrames de entrada ('modelo' y 'restricciones', o 'costos').
+        clave (str): Sufijo para las claves de los widgets.
+        **opciones: Opciones del constructor (por ejemplo `solver`).
+
+    Returns:
+        None
+    """
+
+    with st.expander("📉 Análisis paramétrico"):
+        if not st.checkbox("Activar análisis paramétrico", key=f"parametrico_{clave}"):
+            return
+
+        problema = crear_problema(clase_problema, datos_entrada, **opciones)
+        forma = problema.forma_vigente()
+
+        col1, col2 = st.columns(2)
+        tipo = col1.radio("Parámetro", ["RHS", "FO"], horizontal=True, key=f"parametro_tipo_{clave}")
+        nombres = forma.nombres_restricciones if tipo == "RHS" else forma.nombres_variables
+        nombre = col2.selectbox("Restricción" if tipo == "RHS" else "Variable", nombres, key=f"parametro_nombre_{clave}")
+
+        col1, col2, col3 = st.columns(3)
+        desde = col1.number_input("Desde", value=0.0, key=f"parametro_desde_{clave}")
+        hasta = col2.number_input("Hasta", value=100.0, key=f"parametro_hasta_{clave}")
+        pasos = col3.number_input("Pasos", min_value=2, max_value=1000, value=20, key=f"parametro_pasos_{clave}")
+
+        if st.button("▶️ Ejecutar análisis", key=f"parametro_ejecutar_{clave}"):
+            try:
+                valores = {nombre: np.linspace(desde, hasta, int(pasos))}
+                tabla = problema.analisis_parametrico(**({"rhs": valores} if tipo == "RHS" else {"objetivo": valores}))
+                graficar_parametrico(tabla)
+                st.dataframe(tabla)
+            except Exception as e:
+                st.error(f"❌ Error: {e}")
+
+@st.fragment(run_every=1)
+def mostrar_descarga(vista, etiqueta="⬇️ Descargar resultados"):
+    """
+    Muestra el botón de descarga cuando el escritor termina de generar el archivo de resultados.
+
+    Se vuelve a ejecutar cada segundo (solo este fragmento) mientras el archivo
+    se genera, e informa si el registro o la exportación fallaron. Debajo muestra
+    el desglose de tiempos por fase, que se completa cuando terminan las escrituras.
+
+    Args:
+        vista (str): Vista cuyas escrituras se muestran (ver `mostrar_resultado_sesion`).
+        etiqueta (str): Texto del botón de descarga.
+
+    Returns:
+        None
+    """
+
+    guardado = st.session_state.get("resultados", {}).get(vista)
+    escrituras = guardado and guardado["escrituras"]
+    if not escrituras:
+        return
+
+    futuro_log = escrituras["log"]
+    if futuro_log is not None and futuro_log.done() and futuro_log.exception() is not None:
+        st.warning(f"⚠️ No se pudo registrar la ejecución en el historial: {futuro_log.exception()}")
+
+    futuro_archivo = escrituras["archivo"]
+    extension, mime = FORMATOS_EXPORTACION[escrituras["formato"]]
+    if not futuro_archivo.done():
+        st.caption("⏳ Generando archivo de resultados...")
+    elif futuro_archivo.exception() is not None:
+        st.error(f"❌ No se pudo generar el archivo de resultados: {futuro_archivo.exception()}")
+    else:
+        st.download_button(
+            label=f"{etiqueta} ({escrituras['formato']})",
+            data=futuro_archivo.result(),
+            file_name=f"resultado_completo.{extension}",
+            mime=mime,
+            key=f"descargar_{vista}"
+        )
+
+    mostrar_mediciones(guardado["medicion"].a_dict())
+
+@st.cache_data(max_entries=8, show_spinner="Leyendo archivos...")
+def cargar_archivos(claves: tuple, _archivos: tuple, hojas: tuple) -> dict:
+    """
+    Lee una sola vez las tablas de los archivos subidos.
+
+    La caché se indexa por el nombre y el hash del contenido de cada archivo
+    (y las hojas pedidas), por lo que las reejecuciones de la app por
+    interacción con widgets reutilizan las tablas ya leídas en lugar de volver
+    a abrir los archivos. La lectura se mide una sola vez, cuando realmente se
+    leen los archivos, y esa medición se guarda en la caché junto con las tablas.
+
+    Args:
+        claves (tuple): Pares (nombre, hash) de cada archivo (ver `hash_contenido`).
+        _archivos (tuple): Pares (nombre, bytes) de cada archivo (no forman parte de la clave).
+        hojas (tuple): Hojas o tablas a leer.
+
+    Returns:
+        tuple: (dict nombre de hoja → DataFrame, mediciones de la fase "lectura").
+    """
+
+    medicion = Medicion()
+    with medicion.fase("lectura"):
+        tablas = leer_archivos(_archivos, hojas)
+    return tablas, medicion.a_dict()
+
+def mostrar_estado_cache():
+    """
+    Muestra en la barra lateral los aciertos y fallos de la caché de resultados.
+
+    Returns:
+        None
+    """
+
+    cache = obtener_cache_resultados()
+    st.sidebar.caption(
+        f"🗃️ Caché de resultados: {cache.aciertos} aciertos · {cache.fallos} fallos · {len(cache)} guardados"
+    )
+
+def manejar_carga_manual(nombre_modelo, clase_problema, solver=None, presolve=None, sensibilidad=False,
+                         limite_tiempo=None, gap=None, hilos=None):
     """
     Permite al usuario ingresar manualmente los datos del modelo, resolverlo y exportar resultados.
 
@@ -14,12 +571,19 @@ def manejar_carga_manual(nombre_modelo, clase_problema):
     Args:
         nombre_modelo (str): Etiqueta del tipo de problema.
         clase_problema (class): Clase correspondiente al modelo a resolver.
+        solver (str, optional): Solver a usar ("cbc" o "highs") en los modelos de PL.
+        presolve (bool, optional): Aplicar el presolve en los modelos de PL.
+        sensibilidad (bool): Incluir el análisis de sensibilidad en los modelos de PL.
+        limite_tiempo (float, optional): Segundos máximos para el solver en los modelos de PL.
+        gap (float, optional): Brecha relativa de optimalidad en los modelos de PL.
+        hilos (int, optional): Hilos de CBC en los modelos con variables enteras.
 
     Returns:
         None
     """
 
     st.markdown(f"### ✍️ Ingreso manual de datos para {nombre_modelo}")
+    vista = f"manual_{nombre_modelo}"
 
     if nombre_modelo == "Transporte":
         num_origenes = st.number_input("Número de orígenes", min_value=1, max_value=10, value=2)
@@ -40,106 +604,108 @@ def manejar_carga_manual(nombre_modelo, clase_problema):
 
         editado = st.data_editor(df_costos, use_container_width=True, num_rows="fixed", key="editor_transporte")
 
-        if st.button("🚀 Ejecutar modelo"):
-            validar_datos_transporte(editado)
-            try:
-                problema = clase_problema(editado, pd.DataFrame())
-                problema.construir()
-                resultado = problema.resolver()
-                from main import visualizacion
-                visualizacion.mostrar_resultados(resultado)
-            except Exception as e:
-                st.error(f"❌ Error: {e}")
-
-        registrar_log(nombre_modelo, resultado, datos_entrada)
-
-        datos_entrada = {
-            "costos": df_editado
+        datos_entrada = {"costos": editado}
+        opciones = {
+            "solver": solver, "presolve": presolve, "sensibilidad": sensibilidad,
+            "limite_tiempo": limite_tiempo, "gap": gap, "hilos": hilos
         }
-        excel_resultado = exportar_resultado_excel(resultado, datos_entrada)
 
+        def resolver(medicion):
+            with medicion.fase("validacion"):
+                validar_datos_transporte(editado)
+            return resolver_incremental(f"problema_manual_{nombre_modelo}", clase_problema, datos_entrada,
+                                        medicion=medicion, **opciones), None
 
     elif nombre_modelo == "Asignación":
-        st.markdown("Ingrese una matriz de costos o utilidades para el problema de asignación.")
-        num = st.number_input("Tamaño de la matriz cuadrada", min_value=2, max_value=10, value=3)
+        st.markdown("Ingrese una matriz de costos o utilidades para el problema de asignación. Deje vacías las celdas de los pares no permitidos.")
+        col1, col2 = st.columns(2)
+        num_agentes = col1.number_input("Número de agentes", min_value=1, max_value=10, value=3)
+        num_tareas = col2.number_input("Número de tareas", min_value=1, max_value=10, value=3)
+        maximizar = st.checkbox("Maximizar utilidad (en lugar de minimizar costo)", key="maximizar_asignacion")
 
-        # Crear DataFrame cuadrado con valores por defecto
-        df = pd.DataFrame([[0]*num for _ in range(num)], 
-                        columns=[f"Tarea {j+1}" for j in range(num)],
-                        index=[f"Agente {i+1}" for i in range(num)])
+        # Crear DataFrame con valores por defecto
+        df = pd.DataFrame([[0.0]*num_tareas for _ in range(num_agentes)],
+                        columns=[f"Tarea {j+1}" for j in range(num_tareas)],
+                        index=[f"Agente {i+1}" for i in range(num_agentes)])
 
         df_editado = st.data_editor(df, key="editor_asignacion")
 
-        if st.button("🚀 Ejecutar modelo"):
-            from main.utils import validar_datos_asignacion
-            from main.problemas import Asignacion
-            validar_datos_asignacion(df_editado)
-
-            problema = Asignacion(df_editado)
-            problema.construir()
-            resultado = problema.resolver()
-
-            from main import visualizacion
-            visualizacion.mostrar_resultados(resultado)
-
-        registrar_log(nombre_modelo, resultado, datos_entrada)
-
-        datos_entrada = {
-            "costos": df_editado
-        }
-        excel_resultado = exportar_resultado_excel(resultado, datos_entrada)
+        datos_entrada = {"costos": df_editado}
+        opciones = {"maximizar": maximizar}
 
+        def resolver(medicion):
+            from main.utils import validar_datos_asignacion
+            with medicion.fase("validacion"):
+                validar_datos_asignacion(df_editado)
+            return resolver_modelo(clase_problema, datos_entrada, medicion=medicion, **opciones), None
 
     else:  # Para Max y Min
         col1, col2 = st.columns(2)
         num_vars = col1.number_input("Número de variables", min_value=1, max_value=10, value=2)
         num_restr = col2.number_input("Número de restricciones", min_value=1, max_value=10, value=2)
 
-        df_modelo = plantilla_modelo(num_vars, num_restr)
+        largo = st.checkbox(
+            "Coeficientes en formato largo (Restriccion, Variable, Coef)",
+            key=f"formato_largo_{nombre_modelo}",
+            help="Una fila por coeficiente no nulo; use 'FO' como restricción para la función objetivo."
+        )
+
+        df_modelo = plantilla_modelo(num_vars, num_restr, largo=largo)
         df_restricciones = plantilla_restricciones(num_restr)
 
-        edit_modelo = st.data_editor(df_modelo, use_container_width=True, num_rows="fixed", key=f"editor_modelo_{nombre_modelo}")
+        edit_modelo = st.data_editor(
+            df_modelo, use_container_width=True, num_rows="dynamic" if largo else "fixed",
+            key=f"editor_modelo_{nombre_modelo}_{'largo' if largo else 'ancho'}"
+        )
         edit_restr = st.data_editor(df_restricciones, use_container_width=True, num_rows="fixed", key=f"editor_restricciones_{nombre_modelo}")
 
-        if st.button("🚀 Ejecutar modelo"):
-            validar_datos_manual(edit_modelo, edit_restr)
-            try:
-                problema = clase_problema(edit_modelo, edit_restr)
-                problema.construir()
-                resultado = problema.resolver()
-                from main import visualizacion
-                visualizacion.mostrar_resultados(resultado)
-                # Solo graficar si es Max/Min y tiene 2 variables
-                grafico_buffer = None
-                if edit_modelo.shape[0] == 2:
-                    grafico_buffer = graficar_solucion_lineal(edit_modelo, edit_restr, resultado, tipo=nombre_modelo)
-            except Exception as e:
-                st.error(f"❌ Error: {e}")
-
-        registrar_log(nombre_modelo, resultado, datos_entrada)
-
-        datos_entrada = {
-            "modelo": edit_modelo,
-            "restricciones": edit_restr
+        datos_entrada = {"modelo": edit_modelo, "restricciones": edit_restr}
+        opciones = {
+            "solver": solver, "presolve": presolve, "sensibilidad": sensibilidad,
+            "limite_tiempo": limite_tiempo, "gap": gap, "hilos": hilos
         }
-        excel_resultado = exportar_resultado_excel(resultado, datos_entrada, grafico_img=grafico_buffer)
 
-    st.download_button(
-        label="⬇️ Descargar resultados con datos originales",
-        data=excel_resultado,
-        file_name="resultado_completo.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
+        def resolver(medicion):
+            with medicion.fase("validacion"):
+                validar_datos_manual(edit_modelo, edit_restr)
+            resultado = resolver_incremental(f"problema_manual_{nombre_modelo}", clase_problema, datos_entrada,
+                                             medicion=medicion, **opciones)
+            # Solo graficar si es Max/Min y tiene 2 variables
+            grafico_buffer = None
+            df_grafico = modelo_a_ancho(edit_modelo, edit_restr) if largo else edit_modelo
+            if df_grafico.shape[0] == 2:
+                with medicion.fase("grafico"):
+                    grafico_buffer = graficar_solucion_lineal(
+                        df_grafico, edit_restr, resultado, tipo=nombre_modelo, mostrar=False
+                    )
+            return resultado, grafico_buffer
+
+    opciones_exportacion = elegir_formato_exportacion(vista)
+    clave = clave_problema(clase_problema, datos_entrada, opciones)
+
+    # Con la misma entrada se reutiliza el resultado guardado en la sesión
+    if st.button("🚀 Ejecutar modelo") and resultado_sesion(vista, clave) is None:
+        try:
+            medicion = Medicion()
+            resultado, grafico_buffer = resolver(medicion)
+            guardar_resultado_sesion(vista, clave, resultado, datos_entrada, grafico_buffer, medicion)
+        except Exception as e:
+            st.error(f"❌ Error: {e}")
+
+    mostrar_resultado_sesion(vista, clave, nombre_modelo, opciones_exportacion,
+                             etiqueta="⬇️ Descargar resultados con datos originales")
 
 def manejar_carga_desde_excel(nombre_archivo, clase_problema, hojas,
                                nombre_hoja_modelo="modelo",
                                nombre_hoja_restricciones="restricciones",
-                               nombre_modelo=""):
+                               nombre_modelo="", solver=None, presolve=None, sensibilidad=False,
+                               limite_tiempo=None, gap=None, hilos=None):
     """
     Maneja la carga de datos desde un archivo Excel y ejecuta el modelo.
 
     Soporta distintos tipos de problema (Maximización, Minimización, Transporte, Asignación),
-    leyendo las hojas correspondientes y validando sus contenidos.
+    leyendo las hojas correspondientes y validando sus contenidos. El modelo se resuelve
+    en un proceso aparte, con progreso y opción de cancelar (ver `iniciar_resolucion`).
 
     Args:
         nombre_archivo (str): Texto descriptivo del tipo de archivo (para mostrar al usuario).
@@ -148,90 +714,188 @@ def manejar_carga_desde_excel(nombre_archivo, clase_problema, hojas,
         nombre_hoja_modelo (str): Nombre de la hoja con el modelo base.
         nombre_hoja_restricciones (str): Nombre de la hoja con restricciones (si aplica).
         nombre_modelo (str): Etiqueta del tipo de problema (usada para exportación/logs).
+        solver (str, optional): Solver a usar ("cbc" o "highs") en los modelos de PL.
+        presolve (bool, optional): Aplicar el presolve en los modelos de PL.
+        sensibilidad (bool): Incluir el análisis de sensibilidad en los modelos de PL.
+        limite_tiempo (float, optional): Segundos máximos para el solver en los modelos de PL.
+        gap (float, optional): Brecha relativa de optimalidad en los modelos de PL.
+        hilos (int, optional): Hilos de CBC en los modelos con variables enteras.
 
     Returns:
         None
     """
 
-    archivo = st.file_uploader(f"📁 Sube tu archivo Excel de {nombre_archivo}", type=["xlsx"])
+    archivos = st.file_uploader(
+        f"📁 Sube tu archivo Excel de {nombre_archivo} (o un archivo Parquet/Arrow/CSV por hoja)",
+        type=list(EXTENSIONES_ENTRADA),
+        accept_multiple_files=True,
+        help="En formatos Parquet, Arrow o CSV, nombre cada archivo como la hoja que reemplaza "
+             "(por ejemplo, modelo.parquet y restricciones.parquet)."
+    )
 
-    if archivo is not None:
+    if archivos:
         try:
-            xls = pd.ExcelFile(archivo)
-            st.success("✅ Archivo cargado correctamente")
+            # Hojas necesarias: las de la vista previa y las que usa el modelo
+            if clase_problema.__name__ == "Asignacion" or nombre_hoja_modelo == "costos":
+                hojas_modelo = ("costos",)
+            else:
+                hojas_modelo = (nombre_hoja_modelo, nombre_hoja_restricciones)
+            contenidos = tuple((archivo.name, archivo.getvalue()) for archivo in archivos)
+            claves_archivos = tuple((nombre, hash_contenido(contenido)) for nombre, contenido in contenidos)
+            tablas, lectura = cargar_archivos(
+                claves_archivos,
+                contenidos,
+                tuple(dict.fromkeys((*hojas, *hojas_modelo)))
+            )
+            st.success("✅ Archivos cargados correctamente" if len(archivos) > 1 else "✅ Archivo cargado correctamente")
 
             for hoja, titulo in hojas.items():
-                df = xls.parse(hoja)
                 st.markdown(f"#### {titulo}")
-                st.dataframe(df)
-
-            if st.button("🚀 Ejecutar modelo"):
-                # 🔁 Lógica para Asignación
-                if clase_problema.__name__ == "Asignacion":
-                    df_costos = xls.parse("costos")
-                    from main.utils import validar_datos_asignacion
-                    validar_datos_asignacion(df_costos)
-
-                    problema = clase_problema(df_costos)
-                    problema.construir()
-                    resultado = problema.resolver()
+                st.dataframe(tablas[hoja].head(FILAS_VISTA_PREVIA))
+                if len(tablas[hoja]) > FILAS_VISTA_PREVIA:
+                    st.caption(f"Mostrando {FILAS_VISTA_PREVIA} de {len(tablas[hoja])} filas.")
 
-                    from main import visualizacion
-                    visualizacion.mostrar_resultados(resultado)
+            maximizar = False
+            if clase_problema.__name__ == "Asignacion":
+                maximizar = st.checkbox("Maximizar utilidad (en lugar de minimizar costo)")
 
-                    datos_entrada = {"costos": df_costos}
-                    excel_resultado = exportar_resultado_excel(resultado, datos_entrada)
+            opciones_exportacion = elegir_formato_exportacion(nombre_modelo)
 
-                # 🔁 Lógica para Transporte
-                elif nombre_hoja_modelo == "costos":
-                    df_costos = xls.parse("costos")
-                    from main.utils import validar_datos_transporte
-                    validar_datos_transporte(df_costos)
-
-                    problema = clase_problema(df_costos, pd.DataFrame())
-                    problema.construir()
-                    resultado = problema.resolver()
-
-                    from main import visualizacion
-                    visualizacion.mostrar_resultados(resultado)
-
-                    datos_entrada = {"costos": df_costos}
-                    excel_resultado = exportar_resultado_excel(resultado, datos_entrada)
-
-                # 🔁 Lógica para Max y Min
+            if clase_problema.__name__ != "Asignacion":
+                if nombre_hoja_modelo == "costos":
+                    datos_modelo = {"costos": tablas["costos"]}
                 else:
-                    df_modelo = xls.parse(nombre_hoja_modelo)
-                    df_restricciones = xls.parse(nombre_hoja_restricciones)
-
-                    from main.utils import validar_datos_manual
-                    validar_datos_manual(df_modelo, df_restricciones)
-
-                    problema = clase_problema(df_modelo, df_restricciones)
-                    problema.construir()
-                    resultado = problema.resolver()
-
-                    # Solo graficar si hay 2 variables
-                    grafico_buffer = None
-                    if clase_problema.__name__ in ["Maximizacion", "Minimizacion"] and df_modelo.shape[0] == 2:
-                        grafico_buffer = graficar_solucion_lineal(df_modelo, df_restricciones, resultado, tipo=nombre_modelo)
+                    datos_modelo = {"modelo": tablas[nombre_hoja_modelo], "restricciones": tablas[nombre_hoja_restricciones]}
+                mostrar_exportacion_modelo(clase_problema, datos_modelo, nombre_modelo, solver=solver)
+                mostrar_analisis_parametrico(clase_problema, datos_modelo, nombre_modelo, solver=solver, presolve=presolve)
+
+            # La clave de la entrada sale de los hashes de los archivos, sin volver a recorrer las tablas
+            vista = f"archivo_{nombre_modelo}"
+            opciones = {"maximizar": maximizar} if clase_problema.__name__ == "Asignacion" else {
+                "solver": solver, "presolve": presolve, "sensibilidad": sensibilidad,
+                "limite_tiempo": limite_tiempo, "gap": gap, "hilos": hilos
+            }
+            clave = clave_problema(clase_problema, {}, {"archivos": claves_archivos, **opciones})
+
+            # Con los mismos archivos y opciones se reutiliza el resultado guardado en la sesión
+            if st.button("🚀 Ejecutar modelo") and resultado_sesion(vista, clave) is None:
+                medicion = Medicion()
+                medicion.agregar(lectura)
+                with medicion.fase("validacion"):
+                    # 🔁 Lógica para Asignación
+                    if clase_problema.__name__ == "Asignacion":
+                        df_costos = tablas["costos"]
+                        from main.utils import validar_datos_asignacion
+                        validar_datos_asignacion(df_costos)
+                        datos_entrada = {"costos": df_costos}
+
+                    # 🔁 Lógica para Transporte
+                    elif nombre_hoja_modelo == "costos":
+                        df_costos = tablas["costos"]
+                        from main.utils import validar_datos_transporte
+                        validar_datos_transporte(df_costos)
+                        datos_entrada = {"costos": df_costos}
+
+                    # 🔁 Lógica para Max y Min
+                    else:
+                        df_modelo = tablas[nombre_hoja_modelo]
+                        df_restricciones = tablas[nombre_hoja_restricciones]
+                        from main.utils import validar_datos_manual
+                        validar_datos_manual(df_modelo, df_restricciones)
+                        datos_entrada = {"modelo": df_modelo, "restricciones": df_restricciones}
+
+                iniciar_resolucion(vista, clave, clase_problema, datos_entrada, medicion=medicion, **opciones)
+
+            # ⏳ El modelo se resuelve en un proceso aparte; al terminar se guarda con su gráfico
+            terminada = recoger_resolucion(vista)
+            if terminada is not None:
+                clave_resuelta, resultado, datos_entrada, medicion = terminada
+
+                # Solo graficar si es Max/Min y hay 2 variables
+                grafico_buffer = None
+                if clase_problema.__name__ in ["Maximizacion", "Minimizacion"]:
+                    df_modelo, df_restricciones = datos_entrada["modelo"], datos_entrada["restricciones"]
+                    df_grafico = df_modelo
+                    if es_formato_largo(df_modelo) and df_modelo["Variable"].nunique() == 2:
+                        df_grafico = modelo_a_ancho(df_modelo, df_restricciones)
+                    if df_grafico.shape[0] == 2:
+                        with medicion.fase("grafico"):
+                            grafico_buffer = graficar_solucion_lineal(
+                                df_grafico, df_restricciones, resultado, tipo=nombre_modelo, mostrar=False
+                            )
+
+                guardar_resultado_sesion(vista, clave_resuelta, resultado, datos_entrada, grafico_buffer, medicion)
+            mostrar_progreso(vista)
+
+            # 📝 Resultados, registro y archivo (en segundo plano), también en las reejecuciones de la app
+            mostrar_resultado_sesion(vista, clave, nombre_modelo, opciones_exportacion)
 
-                    datos_entrada = {"modelo": df_modelo, "restricciones": df_restricciones}
-                    excel_resultado = exportar_resultado_excel(resultado, datos_entrada, grafico_img=grafico_buffer)
+        except Exception as e:
+            st.error(f"❌ Error al procesar el archivo: {e}")
 
+def mostrar_historial(ruta=RUTA_LOG, tamano_pagina=50):
+    """
+    Muestra el historial de ejecuciones con filtros y paginación en la base de datos.
 
-                    from main import visualizacion
-                    visualizacion.mostrar_resultados(resultado)
+    Los filtros de tipo y rango de fechas se aplican en la consulta SQL (sobre
+    los índices de `tipo` y `timestamp`) y solo se trae la página visible, sin
+    las columnas JSON. Las entradas y la solución de un registro se cargan
+    únicamente al abrir su detalle.
 
+    Args:
+        ruta (str): Ruta del historial.
+        tamano_pagina (int): Registros por página por defecto.
 
-                registrar_log(nombre_modelo, resultado, datos_entrada)
+    Returns:
+        None
+    """
 
-                # ✅ Botón para descargar resultados
-                st.download_button(
-                    label="⬇️ Descargar resultados en Excel",
-                    data=excel_resultado,
-                    file_name="resultado_completo.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
+    st.subheader("📜 Historial de ejecuciones anteriores")
+
+    if not existe_historial(ruta):
+        st.info("Aún no hay registros guardados.")
+        return
+
+    with st.expander("🔍 Filtros avanzados"):
+        tipo_seleccionado = st.selectbox("Filtrar por tipo de problema", ["Todos"] + tipos_registrados(ruta))
+        rango = st.date_input("Filtrar por rango de fechas (opcional)", value=())
+        opciones_pagina = sorted({25, 50, 100, 250, tamano_pagina})
+        tamano_pagina = st.selectbox("Registros por página", opciones_pagina, index=opciones_pagina.index(tamano_pagina))
+
+    filtros = {
+        "tipo": None if tipo_seleccionado == "Todos" else tipo_seleccionado,
+        "desde": rango[0] if len(rango) > 0 else None,
+        "hasta": rango[-1] if len(rango) > 0 else None,
+    }
+
+    total = contar_ejecuciones(ruta, **filtros)
+    if total == 0:
+        st.info("No hay registros que coincidan con los filtros.")
+        return
+
+    paginas = (total - 1) // tamano_pagina + 1
+    pagina = st.number_input(f"Página (de {paginas})", min_value=1, max_value=paginas, value=1, step=1)
+    df_pagina = consultar_ejecuciones(
+        ruta, limite=tamano_pagina, desplazamiento=(pagina - 1) * tamano_pagina, **filtros
+    )
 
-        except Exception as e:
-            st.error(f"❌ Error al procesar el archivo: {e}")
+    st.caption(f"{total} registros · mostrando {len(df_pagina)}")
+    st.dataframe(df_pagina, hide_index=True, use_container_width=True)
+
+    # Detalle de un registro (carga las entradas y la solución bajo demanda)
+    st.markdown("### 📋 Ver detalles de un registro")
+    id_ejecucion = st.selectbox(
+        "Selecciona el registro",
+        df_pagina["id"].tolist(),
+        format_func=lambda i: f"#{i} · " + " · ".join(
+            str(v) for v in df_pagina.loc[df_pagina["id"] == i, ["timestamp", "tipo", "estado"]].iloc[0]
+        )
+    )
+    misma_entrada = ejecuciones_misma_entrada(id_ejecucion, ruta)
+    if not misma_entrada.empty:
+        st.info(
+            "🔁 Misma entrada que las ejecuciones "
+            + ", ".join(f"#{i}" for i in misma_entrada["id"])
+        )
+    if st.toggle("Cargar entradas y solución"):
+        st.json(obtener_ejecucion(id_ejecucion, ruta))
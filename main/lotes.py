@@ -0,0 +1,194 @@
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import pandas as pd
+
+from main.ingesta import EXTENSIONES_ENTRADA
+from main.medicion import Medicion
+from main.problemas import HILOS_POR_DEFECTO, Problema, crear_problema, crear_problema_desde_archivos
+
+# Escenarios enviados a cada proceso por anticipado (acota la memoria con lotes muy grandes)
+PENDIENTES_POR_PROCESO = 4
+
+
+def escenarios_desde_carpeta(carpeta, extensiones=("xlsx",)):
+    """
+    Lista los archivos de una carpeta como escenarios de un lote.
+
+    Cada archivo es un escenario completo (un libro Excel con las hojas del
+    problema o, para problemas de una sola tabla, un archivo columnar).
+
+    Args:
+        carpeta (str | Path): Carpeta con los archivos.
+        extensiones (tuple): Extensiones a incluir (ver `main.ingesta.EXTENSIONES_ENTRADA`).
+
+    Returns:
+        list: Tuplas (nombre, ruta) ordenadas por nombre de archivo.
+
+    Raises:
+        ValueError: Si la carpeta no existe o alguna extensión no es admitida.
+    """
+
+    carpeta = Path(carpeta)
+    if not carpeta.is_dir():
+        raise ValueError(f"❌ La carpeta '{carpeta}' no existe.")
+    invalidas = [e for e in extensiones if e not in EXTENSIONES_ENTRADA]
+    if invalidas:
+        raise ValueError(f"❌ Extensiones no admitidas: {', '.join(invalidas)}.")
+
+    return [
+        (ruta.stem, str(ruta))
+        for ruta in sorted(carpeta.iterdir())
+        if ruta.is_file() and ruta.suffix.lower().lstrip(".") in extensiones
+    ]
+
+
+def _normalizar(escenarios):
+    """Convierte cada escenario en (nombre, entrada), numerando los que no tienen nombre."""
+
+    if isinstance(escenarios, (str, os.PathLike)):
+        yield from escenarios_desde_carpeta(escenarios)
+        return
+    for i, escenario in enumerate(escenarios):
+        if isinstance(escenario, tuple):
+            yield escenario
+        elif isinstance(escenario, (str, os.PathLike)):
+            yield Path(escenario).stem, str(escenario)
+        else:
+            yield i, escenario
+
+
+def resolver_escenario(clase_problema, nombre, entrada, opciones: dict) -> dict:
+    """
+    Construye y resuelve un escenario, capturando cualquier error.
+
+    Args:
+        clase_problema (class): Clase del modelo.
+        nombre: Identificador del escenario.
+        entrada (dict | pd.DataFrame | str): DataFrames de entrada ('modelo' y 'restricciones',
+            o 'costos'), la tabla de costos sola o la ruta a un archivo con ellos.
+        opciones (dict): Opciones del constructor (por ejemplo `solver` o `maximizar`).
+
+    Returns:
+        dict: 'escenario', 'resultado' (None si falló), 'error' (None si no falló), 'segundos'
+        y 'mediciones' (tiempos por fase y tamaño del modelo, ver `main.medicion.Medicion`).
+    """
+
+    inicio = time.perf_counter()
+    medicion = Medicion()
+    try:
+        if isinstance(entrada, pd.DataFrame):
+            entrada = {clase_problema.entradas[0]: entrada}
+        if isinstance(entrada, (str, os.PathLike)):
+            with medicion.fase("lectura"):
+                problema = crear_problema_desde_archivos(clase_problema, [entrada], **opciones)
+        else:
+            problema = crear_problema(clase_problema, entrada, **opciones)
+        with medicion.fase("construccion"):
+            problema.construir()
+        with medicion.fase("resolucion"):
+            resultado, error = problema.resolver(), None
+        medicion.medir_modelo(problema)
+    except Exception as e:
+        resultado, error = None, f"{type(e).__name__}: {e}"
+    return {
+        "escenario": nombre,
+        "resultado": resultado,
+        "error": error,
+        "segundos": time.perf_counter() - inicio,
+        "mediciones": medicion.a_dict(),
+    }
+
+
+def resolver_lote(clase_problema, escenarios, procesos=None, **opciones):
+    """
+    Resuelve muchos escenarios en paralelo y entrega cada resultado apenas termina.
+
+    Los escenarios se reparten en un pool de procesos; solo se mantienen
+    `PENDIENTES_POR_PROCESO` escenarios por proceso en vuelo, de modo que un
+    lote de miles de escenarios no se carga entero en memoria. Los archivos se
+    leen dentro de cada proceso. Un error en un escenario se informa en su
+    resultado y no detiene el lote. Con varios procesos, CBC usa un hilo por
+    escenario salvo que se indique `hilos`.
+
+    Args:
+        clase_problema (class): Maximizacion, Minimizacion, Transporte o Asignacion.
+        escenarios (iterable | str): Entradas por escenario (dicts de DataFrames o la tabla de
+            costos sola), tuplas (nombre, entrada), rutas de archivos o una carpeta (ver `escenarios_desde_carpeta`).
+        procesos (int, optional): Procesos a usar. Por defecto, HILOS_POR_DEFECTO; con 1 se
+            resuelve en el proceso actual.
+        **opciones: Opciones del constructor (por ejemplo `solver` o `maximizar`).
+
+    Yields:
+        dict: Resultado de cada escenario (ver `resolver_escenario`), en orden de finalización.
+    """
+
+    procesos = procesos or HILOS_POR_DEFECTO
+    escenarios = _normalizar(escenarios)
+
+    if procesos > 1 and issubclass(clase_problema, Problema):
+        opciones.setdefault("hilos", 1)
+
+    if procesos == 1:
+        for nombre, entrada in escenarios:
+            yield resolver_escenario(clase_problema, nombre, entrada, opciones)
+        return
+
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        pendientes = set()
+        for nombre, entrada in escenarios:
+            pendientes.add(ejecutor.submit(resolver_escenario, clase_problema, nombre, entrada, opciones))
+            if len(pendientes) >= procesos * PENDIENTES_POR_PROCESO:
+                terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    yield futuro.result()
+        while pendientes:
+            terminados, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                yield futuro.result()
+
+
+def tabla_lote(resultados, incluir_solucion=False) -> pd.DataFrame:
+    """
+    Reúne los resultados de un lote en una tabla, una fila por escenario.
+
+    Args:
+        resultados (iterable): Resultados de `resolver_lote` (puede ser el generador).
+        incluir_solucion (bool): Si es True, agrega una columna por variable con su
+            valor (o la cantidad de asignaciones en problemas de asignación).
+
+    Returns:
+        pd.DataFrame: Columnas 'Escenario', 'Estado', 'Valor óptimo', 'Gap' (modelos enteros),
+        'Error', 'Segundos' y, opcionalmente, la solución; ordenada por escenario.
+    """
+
+    filas, soluciones = [], []
+    for r in resultados:
+        resultado = r["resultado"] or {}
+        filas.append({
+            "Escenario": r["escenario"],
+            "Estado": resultado.get("status", "Error"),
+            "Valor óptimo": resultado.get("valor_objetivo"),
+            "Gap": resultado.get("gap"),
+            "Error": r["error"],
+            "Segundos": r["segundos"],
+        })
+        if incluir_solucion:
+            if "asignaciones" in resultado:
+                soluciones.append({"Asignaciones": len(resultado["asignaciones"])})
+            else:
+                soluciones.append(resultado.get("solucion", {}))
+
+    tabla = pd.DataFrame(filas, columns=["Escenario", "Estado", "Valor óptimo", "Gap", "Error", "Segundos"])
+    tabla["Valor óptimo"] = pd.to_numeric(tabla["Valor óptimo"])
+    tabla["Gap"] = pd.to_numeric(tabla["Gap"])
+    if incluir_solucion:
+        tabla = pd.concat([tabla, pd.DataFrame(soluciones, index=tabla.index)], axis=1)
+
+    # Escenarios numerados se ordenan como números; si hay nombres mezclados, como texto
+    mixtos = tabla["Escenario"].map(type).nunique() > 1
+    return tabla.sort_values(
+        "Escenario", key=lambda s: s.astype(str) if mixtos else s, kind="stable"
+    ).reset_index(drop=True)
@@ -0,0 +1,248 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+import pandas as pd
+from scipy import sparse
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Medir la memoria pico de cada fase con tracemalloc. Hace varias veces más lenta la
+# construcción de modelos grandes, por lo que por defecto solo se mide el tiempo
+# y el máximo de memoria del proceso, que no tienen costo apreciable.
+MEDIR_MEMORIA = os.environ.get("OPTIMIZADOR_MEDIR_MEMORIA", "").lower() in ("1", "true", "si", "sí")
+
+# tracemalloc es global al proceso: se inicia con la primera fase que lo usa y se detiene con la última
+_lock_trazas = threading.Lock()
+_fases_trazando = 0
+_traza_propia = False
+
+
+def tiempo_cpu() -> float:
+    """Segundos de CPU del proceso y de sus subprocesos terminados (por ejemplo, CBC)."""
+
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def memoria_maxima_proceso():
+    """
+    Máximo de memoria residente alcanzado por el proceso hasta el momento.
+
+    Returns:
+        int | None: Bytes, o None si el sistema no lo informa.
+    """
+
+    if resource is None:
+        return None
+    maximo = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa kilobytes y macOS bytes
+    return maximo if sys.platform == "darwin" else maximo * 1024
+
+
+def tamano_modelo(problema) -> dict:
+    """
+    Tamaño del modelo construido, sin volver a construir nada.
+
+    Usa la forma matricial si el problema ya la tiene (la original, si se aplicó
+    el presolve), el modelo de PuLP en otro caso, las rutas en el transporte
+    resuelto con MODI y, en los problemas de asignación, la matriz de costos
+    vista como PL (una variable por par permitido y una restricción por agente
+    y por tarea).
+
+    Args:
+        problema: Problema ya construido (Maximizacion, Minimizacion, Transporte, Asignacion...).
+
+    Returns:
+        dict: 'variables', 'restricciones' y 'no_nulos' (coeficientes no nulos), o vacío si aún no se construyó.
+    """
+
+    reduccion = getattr(problema, "reduccion", None)
+    forma = reduccion.original if reduccion is not None else getattr(problema, "forma", None)
+    if forma is not None:
+        return {
+            "variables": len(forma.nombres_variables),
+            "restricciones": len(forma.nombres_restricciones),
+            "no_nulos": int(forma.A.nnz),
+        }
+
+    modelo = getattr(problema, "modelo", None)
+    if modelo is not None and hasattr(modelo, "constraints"):
+        # El modelo de PuLP solo conoce las variables con algún coeficiente no nulo
+        variables = getattr(problema, "variables", None) or modelo.variables()
+        return {
+            "variables": len(variables),
+            "restricciones": len(modelo.constraints),
+            "no_nulos": sum(len(restriccion) for restriccion in modelo.constraints.values()),
+        }
+
+    # Transporte con MODI: una variable por ruta, con un coeficiente en su origen y otro en su destino
+    origenes = getattr(problema, "origenes", None)
+    if origenes is not None:
+        rutas = len(problema.modelo_df)
+        return {"variables": rutas, "restricciones": len(origenes) + len(problema.destinos), "no_nulos": 2 * rutas}
+
+    matriz = getattr(problema, "matriz", None)
+    if matriz is not None:
+        pares = matriz.nnz if sparse.issparse(matriz) else matriz.size
+        return {"variables": int(pares), "restricciones": sum(matriz.shape), "no_nulos": 2 * int(pares)}
+    return {}
+
+
+def _iniciar_traza():
+    global _fases_trazando, _traza_propia
+    with _lock_trazas:
+        if _fases_trazando == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _traza_propia = True
+        _fases_trazando += 1
+
+
+def _detener_traza():
+    global _fases_trazando, _traza_propia
+    with _lock_trazas:
+        _fases_trazando -= 1
+        if _fases_trazando == 0 and _traza_propia:
+            tracemalloc.stop()
+            _traza_propia = False
+
+
+class Medicion:
+    """
+    Tiempos, CPU y memoria de cada fase de una ejecución, y tamaño del modelo.
+
+    Las fases se miden con el administrador de contexto `fase` o con el
+    decorador `medir`, y pueden anidarse. Siempre se miden el tiempo real, el
+    tiempo de CPU (incluido el de los subprocesos del solver) y el máximo de
+    memoria del proceso; la memoria pico de la fase (tracemalloc) solo si
+    `memoria` es True, porque su costo no es despreciable. tracemalloc mide
+    todo el proceso, por lo que la memoria de fases que corren a la vez en
+    distintos hilos se superpone.
+
+    Args:
+        memoria (bool, optional): Medir la memoria pico con tracemalloc. Por defecto, MEDIR_MEMORIA.
+
+    Attributes:
+        fases (list): Un dict por fase terminada con 'fase', 'segundos', 'cpu',
+            'memoria_pico' (bytes o None) y 'memoria_proceso' (bytes o None).
+        tamano (dict): Tamaño del modelo (ver `tamano_modelo`).
+    """
+
+    def __init__(self, memoria=None):
+        self.memoria = MEDIR_MEMORIA if memoria is None else memoria
+        self.fases = []
+        self.tamano = {}
+        self._lock = threading.Lock()
+        self._picos = []
+
+    @contextmanager
+    def fase(self, nombre):
+        """
+        Mide el bloque como la fase `nombre` (también si termina con una excepción).
+
+        Args:
+            nombre (str): Nombre de la fase (por ejemplo "construccion" o "resolucion").
+        """
+
+        if self.memoria:
+            _iniciar_traza()
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            self._picos.append(base)
+        inicio, inicio_cpu = time.perf_counter(), tiempo_cpu()
+        try:
+            yield
+        finally:
+            fila = {
+                "fase": nombre,
+                "segundos": time.perf_counter() - inicio,
+                "cpu": tiempo_cpu() - inicio_cpu,
+                "memoria_pico": None,
+                "memoria_proceso": memoria_maxima_proceso(),
+            }
+            if self.memoria:
+                # Una fase anidada reinicia el pico: su máximo se propaga a la fase que la contiene
+                pico = max(tracemalloc.get_traced_memory()[1], self._picos.pop())
+                if self._picos:
+                    self._picos[-1] = max(self._picos[-1], pico)
+                fila["memoria_pico"] = pico - base
+                _detener_traza()
+            with self._lock:
+                self.fases.append(fila)
+
+    def medir(self, nombre):
+        """
+        Decorador que mide cada llamada a la función como la fase `nombre`.
+
+        Args:
+            nombre (str): Nombre de la fase.
+
+        Returns:
+            callable: Decorador.
+        """
+
+        def decorador(funcion):
+            @wraps(funcion)
+            def medida(*args, **kwargs):
+                with self.fase(nombre):
+                    return funcion(*args, **kwargs)
+            return medida
+        return decorador
+
+    def medir_modelo(self, problema):
+        """Guarda el tamaño del modelo construido (ver `tamano_modelo`)."""
+
+        self.tamano = tamano_modelo(problema)
+
+    def agregar(self, otra: dict):
+        """
+        Incorpora las fases y el tamaño medidos en otro proceso (ver `a_dict`).
+
+        Args:
+            otra (dict | None): Mediciones como las devuelve `a_dict`.
+        """
+
+        if not otra:
+            return
+        with self._lock:
+            self.fases.extend(otra.get("fases", []))
+        self.tamano = {**self.tamano, **otra.get("tamano", {})}
+
+    def a_dict(self) -> dict:
+        """
+        Returns:
+            dict: 'fases' y 'tamano', listo para guardar como JSON o enviar entre procesos.
+        """
+
+        with self._lock:
+            return {"fases": [dict(fila) for fila in self.fases], "tamano": dict(self.tamano)}
+
+    @staticmethod
+    def tabla(mediciones: dict) -> pd.DataFrame:
+        """
+        Tabla con una fila por fase para mostrar en la interfaz.
+
+        Args:
+            mediciones (dict): Mediciones como las devuelve `a_dict`.
+
+        Returns:
+            pd.DataFrame: Columnas 'Fase', 'Segundos', 'CPU (s)', 'Memoria pico (MB)' y 'Memoria del proceso (MB)'.
+        """
+
+        df = pd.DataFrame(
+            mediciones.get("fases", []),
+            columns=["fase", "segundos", "cpu", "memoria_pico", "memoria_proceso"]
+        )
+        for col in ("memoria_pico", "memoria_proceso"):
+            df[col] = pd.to_numeric(df[col]) / 2**20
+        return df.rename(columns={
+            "fase": "Fase", "segundos": "Segundos", "cpu": "CPU (s)",
+            "memoria_pico": "Memoria pico (MB)", "memoria_proceso": "Memoria del proceso (MB)",
+        })
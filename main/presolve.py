@@ -0,0 +1,368 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy import sparse
+
+from main.solvers import FormaMatricial
+
+# Tolerancia (relativa a la magnitud de la cota) para detectar infactibilidad y variables fijas
+TOLERANCIA = 1e-9
+
+# Tipos de reducción que registra el presolve
+REDUCCIONES = (
+    "filas_vacias",
+    "filas_singleton",
+    "filas_duplicadas",
+    "filas_redundantes",
+    "cotas_redundantes",
+    "variables_fijas",
+    "columnas_vacias",
+)
+
+
+@dataclass
+class Presolve:
+    """
+    Resultado del presolve de un modelo en forma matricial.
+
+    Attributes:
+        original (FormaMatricial): Modelo original.
+        forma (FormaMatricial): Modelo reducido que se entrega al solver.
+        filas (np.ndarray): Índices originales de las restricciones conservadas.
+        columnas (np.ndarray): Índices originales de las variables conservadas.
+        valores_fijos (np.ndarray): Valor de cada variable original eliminada (NaN si se conserva).
+        reducciones (dict): Cantidad de reducciones aplicadas por tipo (ver `REDUCCIONES`).
+        infactible (bool): True si el presolve demostró que el modelo es infactible.
+        pasadas (int): Pasadas realizadas hasta que no hubo más reducciones.
+    """
+
+    original: FormaMatricial
+    forma: FormaMatricial
+    filas: np.ndarray
+    columnas: np.ndarray
+    valores_fijos: np.ndarray
+    reducciones: dict = field(default_factory=dict)
+    infactible: bool = False
+    pasadas: int = 0
+
+    def requiere_solver(self) -> bool:
+        """Indica si queda un modelo por resolver (no es infactible y conserva variables)."""
+        return not self.infactible and len(self.columnas) > 0
+
+    def resumen(self) -> dict:
+        """
+        Resume cuánto se redujo el modelo.
+
+        Returns:
+            dict: Restricciones, variables y coeficientes antes y después, las
+            reducciones por tipo y si se detectó infactibilidad.
+        """
+
+        return {
+            "restricciones": (len(self.original.nombres_restricciones), len(self.filas)),
+            "variables": (len(self.original.nombres_variables), len(self.columnas)),
+            "coeficientes": (int(self.original.A.nnz), int(self.forma.A.nnz)),
+            "reducciones": dict(self.reducciones),
+            "infactible": self.infactible,
+        }
+
+    def restaurar(self, resultado: dict = None) -> dict:
+        """
+        Lleva la solución del modelo reducido a las variables originales.
+
+        Las variables eliminadas toman el valor en que las fijó el presolve y el
+        valor objetivo se recalcula sobre la función objetivo original.
+
+        Args:
+            resultado (dict, optional): Resultado del solver sobre `forma`. No hace
+                falta si `requiere_solver()` es False.
+
+        Returns:
+            dict: 'status', 'valor_objetivo' y 'solucion' con todas las variables
+            originales, más 'presolve' con el `resumen()` y, si el modelo es MIP, 'gap'.
+        """
+
+        nombres = self.original.nombres_variables
+        status = "Infeasible" if self.infactible else "Optimal"
+        x = self.valores_fijos.copy()
+
+        if self.requiere_solver():
+            status = resultado["status"]
+            valores = [resultado["solucion"].get(nombre) for nombre in self.forma.nombres_variables]
+            if any(v is None for v in valores):
+                x = None
+            else:
+                x[self.columnas] = valores
+
+        if self.infactible or x is None:
+            solucion, valor_objetivo = dict.fromkeys(nombres), None
+        else:
+            solucion = dict(zip(nombres, x.tolist()))
+            valor_objetivo = float(self.original.c @ x) + self.original.constante
+
+        restaurado = {
+            "solucion": solucion,
+            "valor_objetivo": valor_objetivo,
+            "status": status,
+            "presolve": self.resumen(),
+        }
+        if self.original.mixta:
+            # Sin modelo reducido que resolver, la solución del presolve es exacta
+            restaurado["gap"] = resultado.get("gap") if self.requiere_solver() else (None if valor_objetivo is None else 0.0)
+        return restaurado
+
+
+def _supera(a, b):
+    """a > b más allá de la tolerancia relativa."""
+    return a > b + TOLERANCIA * np.maximum(1.0, np.abs(np.where(np.isfinite(b), b, 0.0)))
+
+
+def _actividades(S, inf, sup):
+    """Actividad mínima y máxima de cada fila de S dadas las cotas de las variables."""
+
+    columnas = S.indices
+    datos = S.data
+    minimo = np.where(datos > 0, datos * inf[columnas], datos * sup[columnas])
+    maximo = np.where(datos > 0, datos * sup[columnas], datos * inf[columnas])
+    filas = np.repeat(np.arange(S.shape[0]), np.diff(S.indptr))
+    return (
+        np.bincount(filas, weights=minimo, minlength=S.shape[0]),
+        np.bincount(filas, weights=maximo, minlength=S.shape[0]),
+    )
+
+
+def _filas_duplicadas(S):
+    """
+    Agrupa las filas de S que son múltiplos escalares entre sí.
+
+    Cada fila se normaliza por su primer coeficiente y se resume con dos
+    proyecciones aleatorias; las filas con el mismo resumen se comparan luego
+    exactamente.
+
+    Returns:
+        list: Listas de (fila, escala) con dos o más filas proporcionales.
+    """
+
+    S = S.sorted_indices()
+    conteos = np.diff(S.indptr)
+    con_datos = conteos > 1
+    if con_datos.sum() < 2:
+        return []
+
+    escala = np.zeros(S.shape[0])
+    escala[con_datos] = S.data[S.indptr[:-1][con_datos]]
+    normalizada = sparse.csr_matrix(
+        (S.data / np.repeat(np.where(escala == 0, 1.0, escala), conteos), S.indices, S.indptr),
+        shape=S.shape
+    )
+
+    rng = np.random.default_rng(0)
+    proyecciones = normalizada @ rng.standard_normal((S.shape[1], 2))
+    claves = np.column_stack([conteos, np.round(proyecciones, 9)])[con_datos]
+    filas = np.flatnonzero(con_datos)
+    _, grupo, tamanos = np.unique(claves, axis=0, return_inverse=True, return_counts=True)
+    grupo = grupo.ravel()
+
+    grupos = []
+    for g in np.flatnonzero(tamanos > 1):
+        candidatas = filas[grupo == g]
+        base = candidatas[0]
+        i0, i1 = normalizada.indptr[base], normalizada.indptr[base + 1]
+        iguales = [(base, escala[base])]
+        for fila in candidatas[1:]:
+            j0, j1 = normalizada.indptr[fila], normalizada.indptr[fila + 1]
+            if (np.array_equal(normalizada.indices[i0:i1], normalizada.indices[j0:j1])
+                    and np.allclose(normalizada.data[i0:i1], normalizada.data[j0:j1], rtol=1e-12, atol=0)):
+                iguales.append((fila, escala[fila]))
+        if len(iguales) > 1:
+            grupos.append(iguales)
+    return grupos
+
+
+def presolve(forma: FormaMatricial, max_pasadas=20) -> Presolve:
+    """
+    Reduce un modelo lineal antes de entregarlo al solver.
+
+    Repite, hasta que no haya cambios, las siguientes reducciones sobre los
+    datos de coeficientes:
+
+    - Variables fijas (cota inferior = superior): se sustituyen en las filas y la FO.
+    - Filas vacías: se eliminan (o prueban la infactibilidad).
+    - Filas con un solo coeficiente: se convierten en cotas de su variable.
+    - Cotas de variables enteras: se redondean hacia el interior del intervalo.
+    - Filas duplicadas (proporcionales): se conserva una con la intersección de cotas.
+    - Cotas redundantes de las filas según la actividad mínima/máxima: se
+      descartan, y las filas sin cotas se eliminan.
+    - Columnas vacías: se fijan en la cota que optimiza la FO (si es finita).
+
+    Args:
+        forma (FormaMatricial): Modelo a reducir.
+        max_pasadas (int): Máximo de pasadas.
+
+    Returns:
+        Presolve: Modelo reducido, reducciones aplicadas y datos para restaurar la solución.
+    """
+
+    A = forma.A.tocsr().astype(float)
+    A.eliminate_zeros()
+    m, n = A.shape
+    c = np.asarray(forma.c, dtype=float)
+    fila_inf, fila_sup = forma.fila_inf.astype(float).copy(), forma.fila_sup.astype(float).copy()
+    var_inf, var_sup = forma.var_inf.astype(float).copy(), forma.var_sup.astype(float).copy()
+    enteras = np.asarray(forma.enteras, dtype=bool)
+    filas = np.ones(m, dtype=bool)
+    columnas = np.ones(n, dtype=bool)
+    valores_fijos = np.full(n, np.nan)
+    reducciones = dict.fromkeys(REDUCCIONES, 0)
+    infactible = False
+    pasadas = 0
+    duplicadas_revisadas = False
+
+    def fijar(indices, valores, motivo):
+        nonlocal fila_inf, fila_sup
+        valores_fijos[indices] = valores
+        columnas[indices] = False
+        desplazamiento = A[:, indices] @ valores
+        fila_inf = fila_inf - desplazamiento
+        fila_sup = fila_sup - desplazamiento
+        reducciones[motivo] += len(indices)
+
+    def redondear_enteras():
+        var_inf[enteras] = np.ceil(var_inf[enteras] - TOLERANCIA)
+        var_sup[enteras] = np.floor(var_sup[enteras] + TOLERANCIA)
+
+    redondear_enteras()
+    while pasadas < max_pasadas and not infactible:
+        pasadas += 1
+        cambios = 0
+
+        # Variables fijas
+        idx_c = np.flatnonzero(columnas)
+        if _supera(var_inf[idx_c], var_sup[idx_c]).any():
+            infactible = True
+            break
+        fijas = idx_c[
+            np.isfinite(var_inf[idx_c])
+            & np.isclose(var_inf[idx_c], var_sup[idx_c], rtol=TOLERANCIA, atol=TOLERANCIA)
+        ]
+        if len(fijas):
+            fijar(fijas, var_inf[fijas], "variables_fijas")
+            cambios += len(fijas)
+
+        idx_f, idx_c = np.flatnonzero(filas), np.flatnonzero(columnas)
+        S = A[idx_f][:, idx_c]
+        conteos = np.diff(S.indptr)
+
+        # Filas vacías
+        vacias = conteos == 0
+        if vacias.any():
+            if (_supera(fila_inf[idx_f[vacias]], 0.0) | _supera(0.0, fila_sup[idx_f[vacias]])).any():
+                infactible = True
+                break
+            filas[idx_f[vacias]] = False
+            reducciones["filas_vacias"] += int(vacias.sum())
+            cambios += int(vacias.sum())
+
+        # Filas con un único coeficiente → cotas de la variable
+        singleton = np.flatnonzero(conteos == 1)
+        if len(singleton):
+            posiciones = S.indptr[singleton]
+            j = idx_c[S.indices[posiciones]]
+            a = S.data[posiciones]
+            inf, sup = fila_inf[idx_f[singleton]] / a, fila_sup[idx_f[singleton]] / a
+            inf, sup = np.where(a > 0, inf, sup), np.where(a > 0, sup, inf)
+            np.maximum.at(var_inf, j, inf)
+            np.minimum.at(var_sup, j, sup)
+            redondear_enteras()
+            filas[idx_f[singleton]] = False
+            reducciones["filas_singleton"] += len(singleton)
+            cambios += len(singleton)
+
+        if cambios:
+            continue
+
+        # Filas proporcionales (una sola vez, cuando el resto de reducciones se estabiliza)
+        if not duplicadas_revisadas:
+            duplicadas_revisadas = True
+            for grupo in _filas_duplicadas(S):
+                (base, escala_base), *resto = grupo
+                inf = np.array([fila_inf[idx_f[f]] / s if s > 0 else fila_sup[idx_f[f]] / s for f, s in grupo])
+                sup = np.array([fila_sup[idx_f[f]] / s if s > 0 else fila_inf[idx_f[f]] / s for f, s in grupo])
+                inf, sup = inf.max(), sup.min()
+                if escala_base > 0:
+                    fila_inf[idx_f[base]], fila_sup[idx_f[base]] = inf * escala_base, sup * escala_base
+                else:
+                    fila_inf[idx_f[base]], fila_sup[idx_f[base]] = sup * escala_base, inf * escala_base
+                filas[[idx_f[f] for f, _ in resto]] = False
+                reducciones["filas_duplicadas"] += len(resto)
+                cambios += len(resto)
+            if cambios:
+                continue
+
+        # Cotas de fila redundantes según la actividad mínima/máxima
+        minimo, maximo = _actividades(S, var_inf[idx_c], var_sup[idx_c])
+        inf, sup = fila_inf[idx_f], fila_sup[idx_f]
+        if (_supera(inf, sup) | _supera(minimo, sup) | _supera(inf, maximo)).any():
+            infactible = True
+            break
+        sup_redundante = np.isfinite(sup) & (maximo <= sup)
+        inf_redundante = np.isfinite(inf) & (minimo >= inf)
+        if sup_redundante.any() or inf_redundante.any():
+            fila_sup[idx_f[sup_redundante]] = np.inf
+            fila_inf[idx_f[inf_redundante]] = -np.inf
+            reducciones["cotas_redundantes"] += int(sup_redundante.sum() + inf_redundante.sum())
+            libres = ~np.isfinite(fila_inf[idx_f]) & ~np.isfinite(fila_sup[idx_f])
+            filas[idx_f[libres]] = False
+            reducciones["filas_redundantes"] += int(libres.sum())
+            cambios += int(libres.sum())
+        else:
+            libres = ~np.isfinite(inf) & ~np.isfinite(sup)
+            if libres.any():
+                filas[idx_f[libres]] = False
+                reducciones["filas_redundantes"] += int(libres.sum())
+                cambios += int(libres.sum())
+
+        # Columnas vacías: se fijan en la cota que optimiza la FO, si es finita
+        vacias = idx_c[S.getnnz(axis=0) == 0]
+        if len(vacias):
+            costo = -c[vacias] if forma.maximizar else c[vacias]
+            valor = np.where(costo > 0, var_inf[vacias], var_sup[vacias])
+            sin_costo = costo == 0
+            valor[sin_costo] = np.where(
+                np.isfinite(var_inf[vacias[sin_costo]]), var_inf[vacias[sin_costo]],
+                np.where(np.isfinite(var_sup[vacias[sin_costo]]), var_sup[vacias[sin_costo]], 0.0)
+            )
+            finitas = np.isfinite(valor)
+            if finitas.any():
+                fijar(vacias[finitas], valor[finitas], "columnas_vacias")
+                cambios += int(finitas.sum())
+
+        if not cambios:
+            break
+
+    idx_f, idx_c = np.flatnonzero(filas), np.flatnonzero(columnas)
+    fijas = ~columnas
+    reducida = FormaMatricial(
+        nombres_variables=[forma.nombres_variables[j] for j in idx_c],
+        nombres_restricciones=[forma.nombres_restricciones[i] for i in idx_f],
+        c=c[idx_c],
+        A=A[idx_f][:, idx_c].tocsr(),
+        fila_inf=fila_inf[idx_f],
+        fila_sup=fila_sup[idx_f],
+        var_inf=var_inf[idx_c],
+        var_sup=var_sup[idx_c],
+        maximizar=forma.maximizar,
+        constante=forma.constante + float(c[fijas] @ valores_fijos[fijas]),
+        enteras=enteras[idx_c],
+    )
+
+    return Presolve(
+        original=forma,
+        forma=reducida,
+        filas=idx_f,
+        columnas=idx_c,
+        valores_fijos=valores_fijos,
+        reducciones=reducciones,
+        infactible=infactible,
+        pasadas=pasadas,
+    )
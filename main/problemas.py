@@ -1,6 +1,109 @@
+import os
+import tempfile
 import pulp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import chain
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from scipy.optimize import linear_sum_assignment
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+from main.ingesta import leer_archivos
+from main.intercambio import escribir_modelo, leer_modelo
+from main.presolve import presolve
+from main.sensibilidad import analizar_sensibilidad
+from main.solvers import FormaMatricial, cotas_por_tipo, forma_desde_pulp, modelo_desde_forma, resolver_highs
+from main.solvers import duales_pulp, gap_registro_cbc, restricciones_de_fila, variable_pulp
+from main.solvers import resolver_transporte_modi
+
+# Solvers disponibles para Problema.resolver:
+# - "cbc": solver por defecto de PuLP (subproceso y archivos temporales)
+# - "highs": HiGHS en memoria vía scipy.optimize.linprog
+SOLVERS = ("cbc", "highs")
+
+# Solver usado cuando no se indica uno explícitamente (configurable por variable de entorno)
+SOLVER_POR_DEFECTO = os.environ.get("OPTIMIZADOR_SOLVER", "cbc")
+
+# Aplicar el presolve (ver `main.presolve`) antes de entregar el modelo al solver
+PRESOLVE_POR_DEFECTO = os.environ.get("OPTIMIZADOR_PRESOLVE", "0") == "1"
+
+# Hilos para resolver pasos o modelos independientes en paralelo
+HILOS_POR_DEFECTO = int(os.environ.get("OPTIMIZADOR_HILOS", os.cpu_count() or 1))
+
+# Matrices mínimas por proceso en Asignacion.resolver_matrices (debajo de esto no compensa el pool)
+MATRICES_POR_PROCESO = 64
+
+# Columnas opcionales con el tipo y las cotas de cada variable (de cada ruta, en Transporte)
+COLUMNAS_VARIABLE = ("Tipo_Var", "Cota_Inf", "Cota_Sup")
+
+# Valores admitidos en 'Tipo_Var' (sin distinguir mayúsculas); vacío equivale a "Continua"
+TIPOS_VARIABLE = {
+    "": "Continua", "continua": "Continua", "continuous": "Continua", "c": "Continua",
+    "entera": "Entera", "integer": "Entera", "int": "Entera", "i": "Entera", "e": "Entera",
+    "binaria": "Binaria", "binary": "Binaria", "bin": "Binaria", "b": "Binaria",
+}
+
+
+def tipos_de_variables(df: pd.DataFrame, nombres=None) -> tuple:
+    """
+    Lee el tipo y las cotas de cada fila de una tabla de variables.
+
+    Usa las columnas opcionales 'Tipo_Var' (Continua, Entera o Binaria),
+    'Cota_Inf' y 'Cota_Sup'; las celdas vacías (o las columnas ausentes)
+    equivalen a una variable continua con cotas [0, inf). Las binarias son
+    enteras con sus cotas recortadas a [0, 1].
+
+    Args:
+        df (pd.DataFrame): Una fila por variable.
+        nombres (array-like, optional): Nombre de cada fila, para los mensajes de error.
+
+    Returns:
+        tuple: (enteras, var_inf, var_sup) como np.ndarray, en el orden de las filas.
+
+    Raises:
+        ValueError: Si algún tipo no es válido, alguna cota no es numérica o la
+            cota inferior de una variable supera a la superior.
+    """
+
+    n = len(df)
+    nombres = df.index if nombres is None else pd.Index(nombres)
+
+    if "Tipo_Var" in df.columns:
+        escritos = df["Tipo_Var"].fillna("").astype(str).str.strip()
+        tipos = escritos.str.lower().map(TIPOS_VARIABLE)
+        if tipos.isna().any():
+            invalidos = pd.unique(escritos[tipos.isna()])
+            raise ValueError(
+                f"🧩 Tipo de variable desconocido: {', '.join(map(str, invalidos[:10]))}. "
+                "Opciones: Continua, Entera o Binaria."
+            )
+        tipos = tipos.to_numpy()
+    else:
+        tipos = np.full(n, "Continua", dtype=object)
+
+    cotas = []
+    for columna, vacia in (("Cota_Inf", 0.0), ("Cota_Sup", np.inf)):
+        if columna not in df.columns:
+            cotas.append(np.full(n, vacia))
+            continue
+        try:
+            cotas.append(np.array(pd.to_numeric(df[columna]).fillna(vacia), dtype=float))
+        except (TypeError, ValueError):
+            raise ValueError(f"❌ La columna '{columna}' debe contener solo números.") from None
+    var_inf, var_sup = cotas
+
+    binarias = tipos == "Binaria"
+    var_inf[binarias] = np.maximum(var_inf[binarias], 0.0)
+    var_sup[binarias] = np.minimum(var_sup[binarias], 1.0)
+
+    invertidas = var_inf > var_sup
+    if invertidas.any():
+        raise ValueError(
+            f"🧩 La cota inferior supera a la superior en: {', '.join(map(str, nombres[invertidas][:10]))}."
+        )
+    return binarias | (tipos == "Entera"), var_inf, var_sup
+
 
 class Problema:
     """
@@ -13,38 +116,295 @@ class Problema:
     Args:
         df_modelo (pd.DataFrame): DataFrame que contiene los coeficientes del modelo.
         df_restricciones (pd.DataFrame): DataFrame que contiene las restricciones del problema.
+        solver (str, optional): Solver a usar (ver `solvers`). Por defecto, SOLVER_POR_DEFECTO.
+        presolve (bool, optional): Reducir el modelo antes de resolverlo. Por defecto, PRESOLVE_POR_DEFECTO.
+        sensibilidad (bool): Agregar al resultado precios sombra, holguras, costos reducidos y rangos.
+        limite_tiempo (float, optional): Segundos máximos para el solver; al agotarse se devuelve lo encontrado.
+        gap (float, optional): Brecha relativa de optimalidad con la que el solver puede detenerse.
+        hilos (int, optional): Hilos de CBC en modelos con variables enteras. Por defecto, HILOS_POR_DEFECTO.
 
     Attributes:
         df_modelo (pd.DataFrame): Datos del modelo.
         df_restricciones (pd.DataFrame): Datos de restricciones.
         modelo (pulp.LpProblem): Modelo de optimización creado con PuLP.
         variables (dict): Diccionario con las variables de decisión.
+        solver (str): Solver elegido para resolver el modelo.
+        presolve (bool): Si se aplica el presolve al construir.
+        sensibilidad (bool): Si el resultado incluye el análisis de sensibilidad.
+        reduccion (Presolve): Resultado del presolve, o None si no se aplicó.
+        forma (FormaMatricial): Forma matricial vigente (incluye los cambios de `actualizar`).
+        registro_solver (str): Archivo donde CBC escribe su log (ver `main.ejecucion`), o None.
 
     Methods:
         crear_variables(): Crea las variables del modelo. Debe ser sobreescrito.
         construir(): Construye el modelo en PuLP. Debe ser sobreescrito.
-        resolver(): Resuelve el modelo con el solver de PuLP.
+        forma_matricial(): Devuelve el modelo en forma matricial dispersa.
+        forma_vigente(): Devuelve la forma matricial con los cambios aplicados.
+        resolver(): Resuelve el modelo con el solver elegido.
+        construir_reducido(): Aplica el presolve y construye solo el modelo reducido.
+        actualizar(): Modifica FO, RHS y restricciones del modelo ya construido.
+        analisis_parametrico(): Resuelve el modelo para una serie de RHS o coeficientes de la FO.
+        agregar_sensibilidad(): Agrega duales, holguras, costos reducidos y rangos al resultado.
+        exportar(): Exporta el modelo en formato MPS o LP.
     """
 
-    def __init__(self, modelo_df: pd.DataFrame, restricciones_df: pd.DataFrame):
+    solvers = SOLVERS
+    entradas = ("modelo", "restricciones")
+
+    def __init__(self, modelo_df: pd.DataFrame, restricciones_df: pd.DataFrame, solver: str = None,
+                 presolve: bool = None, sensibilidad: bool = False, limite_tiempo: float = None,
+                 gap: float = None, hilos: int = None):
+        solver = solver or SOLVER_POR_DEFECTO
+        if solver not in self.solvers:
+            raise ValueError(f"❌ Solver desconocido '{solver}'. Opciones: {', '.join(self.solvers)}.")
+
         self.modelo_df = modelo_df
         self.restricciones_df = restricciones_df
+        self.solver = solver
+        self.presolve = PRESOLVE_POR_DEFECTO if presolve is None else presolve
+        self.sensibilidad = sensibilidad
+        self.limite_tiempo = limite_tiempo
+        self.gap = gap
+        self.hilos = hilos
+        self.registro_solver = None
         self.variables = {}
         self.modelo = None
+        self.reduccion = None
+        self.forma = None
         self.resultado = None
 
     def crear_variables(self):
+        nombres = self.modelo_df["Variable"]
+        enteras, var_inf, var_sup = tipos_de_variables(self.modelo_df, nombres)
         self.variables = {
-            row["Variable"]: pulp.LpVariable(row["Variable"], lowBound=0)
-            for _, row in self.modelo_df.iterrows()
+            nombre: variable_pulp(nombre, inf, sup, entera)
+            for nombre, inf, sup, entera in zip(nombres, var_inf, var_sup, enteras)
         }
 
     def construir(self):
         raise NotImplementedError("Este método debe ser implementado por la subclase.")
 
+    def forma_matricial(self) -> FormaMatricial:
+        """
+        Devuelve el modelo construido en forma matricial dispersa.
+
+        Por defecto se extrae del modelo de PuLP; las subclases pueden
+        sobreescribirlo para generarla directamente desde sus datos.
+
+        Returns:
+            FormaMatricial: Modelo listo para un solver en memoria.
+
+        Raises:
+            ValueError: Si el modelo de PuLP todavía no fue construido.
+        """
+        if self.modelo is None:
+            raise ValueError("🧩 Primero construya el modelo con construir().")
+        return forma_desde_pulp(self.modelo)
+
+    def forma_vigente(self) -> FormaMatricial:
+        """Devuelve la forma matricial vigente: la de `forma_matricial()` más los cambios de `actualizar()`."""
+        if self.forma is None:
+            self.forma = self.forma_matricial()
+        return self.forma
+
+    def construir_reducido(self, nombre="Modelo_Reducido"):
+        """
+        Aplica el presolve a la forma matricial y construye solo el modelo reducido.
+
+        Con "highs" el modelo reducido se resuelve en forma matricial, por lo que
+        no se construye en PuLP.
+
+        Args:
+            nombre (str): Nombre del modelo de PuLP.
+
+        Returns:
+            Presolve: Modelo reducido y reducciones aplicadas (también en `self.reduccion`).
+        """
+        self.reduccion = presolve(self.forma_vigente())
+        if self.solver != "highs" and self.reduccion.requiere_solver():
+            self.modelo = modelo_desde_forma(self.reduccion.forma, nombre)
+        return self.reduccion
+
+    def actualizar(self, objetivo: dict = None, rhs: dict = None, agregar: dict = None, eliminar=None):
+        """
+        Modifica el modelo ya construido sin volver a construirlo.
+
+        Los cambios se aplican sobre la forma matricial vigente y sobre el modelo
+        de PuLP (solo las filas afectadas). El siguiente `resolver()` arranca desde
+        la solución anterior con "cbc"; con presolve, la reducción se recalcula.
+
+        Args:
+            objetivo (dict, optional): Nuevo coeficiente de la FO por variable.
+            rhs (dict, optional): Nuevo lado derecho por restricción. Un número reemplaza
+                los lados finitos; una tupla (inferior, superior) fija ambos.
+            agregar (dict, optional): Restricciones nuevas como {nombre: (coeficientes, tipo, rhs)},
+                con `coeficientes` = {variable: coeficiente} y `tipo` '<=', '>=' o '='.
+            eliminar (list, optional): Nombres de las restricciones a quitar.
+
+        Raises:
+            ValueError: Si el solver no admite actualizaciones o se indica una
+                variable o restricción inexistente.
+        """
+        if self.solver not in SOLVERS:
+            raise ValueError(f"❌ El solver '{self.solver}' no admite actualizaciones del modelo.")
+
+        objetivo, rhs, agregar, eliminar = objetivo or {}, rhs or {}, agregar or {}, list(eliminar or ())
+        forma = self.forma_vigente()
+        columnas = {nombre: j for j, nombre in enumerate(forma.nombres_variables)}
+        filas = {nombre: i for i, nombre in enumerate(forma.nombres_restricciones)}
+
+        desconocidas = {v for v in chain(objetivo, *(coefs for coefs, _, _ in agregar.values())) if v not in columnas}
+        if desconocidas:
+            raise ValueError(f"❌ Variables desconocidas: {', '.join(map(str, sorted(desconocidas)))}.")
+        finales = (set(filas) - set(eliminar)) | set(agregar)
+        desconocidas = [r for r in eliminar if r not in filas] + [r for r in rhs if r not in finales]
+        if desconocidas:
+            raise ValueError(f"❌ Restricciones desconocidas: {', '.join(map(str, desconocidas))}.")
+        repetidas = [r for r in agregar if r in filas and r not in eliminar]
+        if repetidas:
+            raise ValueError(f"❌ Las restricciones ya existen: {', '.join(map(str, repetidas))}.")
+
+        # Forma matricial: FO, filas eliminadas, filas nuevas y lados derechos
+        c = forma.c.astype(float)
+        for variable, coef in objetivo.items():
+            c[columnas[variable]] = coef
+
+        A, fila_inf, fila_sup = forma.A, forma.fila_inf.astype(float), forma.fila_sup.astype(float)
+        nombres = list(forma.nombres_restricciones)
+        if eliminar or agregar:
+            conservar = np.ones(len(nombres), dtype=bool)
+            conservar[[filas[r] for r in eliminar]] = False
+            nuevas = list(agregar.items())
+            datos = [(i, columnas[v], coef) for i, (_, (coefs, _, _)) in enumerate(nuevas) for v, coef in coefs.items()]
+            filas_n, columnas_n, valores_n = zip(*datos) if datos else ((), (), ())
+            inf_n, sup_n = cotas_por_tipo([tipo for _, (_, tipo, _) in nuevas], [b for _, (_, _, b) in nuevas])
+            A = sparse.vstack([
+                A.tocsr()[conservar],
+                sparse.csr_matrix((valores_n, (filas_n, columnas_n)), shape=(len(nuevas), len(columnas)))
+            ], format="csr")
+            fila_inf = np.concatenate([fila_inf[conservar], inf_n])
+            fila_sup = np.concatenate([fila_sup[conservar], sup_n])
+            nombres = [r for r, sigue in zip(nombres, conservar) if sigue] + [r for r, _ in nuevas]
+            filas = {nombre: i for i, nombre in enumerate(nombres)}
+
+        for restriccion, valor in rhs.items():
+            i = filas[restriccion]
+            if isinstance(valor, tuple):
+                fila_inf[i], fila_sup[i] = valor
+            else:
+                if np.isfinite(fila_inf[i]):
+                    fila_inf[i] = valor
+                if np.isfinite(fila_sup[i]):
+                    fila_sup[i] = valor
+
+        self.forma = replace(forma, nombres_restricciones=nombres, c=c, A=A, fila_inf=fila_inf, fila_sup=fila_sup)
+
+        if self.reduccion is not None:
+            self.construir_reducido(self.modelo.name if self.modelo is not None else "Modelo_Reducido")
+            return
+        if self.modelo is None:
+            return
+
+        # Modelo de PuLP: solo los coeficientes y filas que cambiaron
+        variables_pulp = self.modelo.variablesDict()
+        for variable, coef in objetivo.items():
+            self.modelo.objective[variables_pulp[variable]] = coef
+
+        afectadas = set(eliminar) | set(agregar) | set(rhs)
+        for restriccion in afectadas:
+            for nombre in (restriccion, f"{restriccion}_inf", f"{restriccion}_sup"):
+                self.modelo.constraints.pop(nombre, None)
+        variables = np.empty(len(self.forma.nombres_variables), dtype=object)
+        variables[:] = [variables_pulp.get(nombre) for nombre in self.forma.nombres_variables]
+        for restriccion in afectadas & set(filas):
+            for nueva in restricciones_de_fila(self.forma, filas[restriccion], variables, A):
+                self.modelo += nueva
+
+    def analisis_parametrico(self, rhs: dict = None, objetivo: dict = None, hilos: int = None) -> pd.DataFrame:
+        """
+        Resuelve el modelo para una serie de valores de RHS y/o coeficientes de la FO.
+
+        Cada parámetro recibe una secuencia de valores, todas del mismo largo (un
+        valor por paso). Los pasos se reparten en tramos consecutivos entre los
+        hilos; cada tramo construye el modelo una sola vez y avanza con
+        `actualizar`, de modo que cada paso arranca desde la solución del anterior.
+        Con el solver "modi" se usa "highs".
+
+        Args:
+            rhs (dict, optional): Valores por restricción, {restriccion: valores} (ver `actualizar`).
+            objetivo (dict, optional): Valores por variable, {variable: valores}.
+            hilos (int, optional): Hilos a usar. Por defecto, HILOS_POR_DEFECTO.
+
+        Returns:
+            pd.DataFrame: Una fila por paso con 'Paso', una columna por parámetro
+            ('RHS <restriccion>' o 'FO <variable>'), 'Estado', 'Valor óptimo' y el
+            valor de cada variable.
+
+        Raises:
+            ValueError: Si no se indica ningún parámetro o las secuencias tienen distinto largo.
+        """
+        parametros = [("RHS", nombre, valores) for nombre, valores in (rhs or {}).items()]
+        parametros += [("FO", nombre, valores) for nombre, valores in (objetivo or {}).items()]
+        if not parametros:
+            raise ValueError("❌ Indique al menos un RHS o coeficiente de la FO a variar.")
+        valores = [np.asarray(v, dtype=float).ravel() for _, _, v in parametros]
+        pasos = len(valores[0])
+        if pasos == 0 or any(len(v) != pasos for v in valores):
+            raise ValueError("❌ Todos los parámetros deben tener la misma cantidad de valores (al menos uno).")
+
+        cambios = [
+            (
+                {nombre: float(v[k]) for (tipo, nombre, _), v in zip(parametros, valores) if tipo == "FO"},
+                {nombre: float(v[k]) for (tipo, nombre, _), v in zip(parametros, valores) if tipo == "RHS"},
+            )
+            for k in range(pasos)
+        ]
+        forma = self.forma_vigente()
+        solver = self.solver if self.solver in SOLVERS else "highs"
+        hilos = max(1, min(hilos or HILOS_POR_DEFECTO, pasos))
+
+        # Los hilos de CBC en modelos enteros se reparten entre los tramos
+        hilos_solver = max(1, (self.hilos or HILOS_POR_DEFECTO) // hilos)
+
+        def resolver_tramo(tramo):
+            problema = ModeloMatricial(forma, solver=solver, presolve=self.presolve, limite_tiempo=self.limite_tiempo,
+                                       gap=self.gap, hilos=hilos_solver)
+            problema.construir()
+            resultados = []
+            for k in tramo:
+                objetivo_k, rhs_k = cambios[k]
+                problema.actualizar(objetivo=objetivo_k, rhs=rhs_k)
+                resultados.append(problema.resolver())
+            return resultados
+
+        with ThreadPoolExecutor(max_workers=hilos) as ejecutor:
+            tramos = ejecutor.map(resolver_tramo, np.array_split(np.arange(pasos), hilos))
+            resultados = [resultado for tramo in tramos for resultado in tramo]
+
+        tabla = pd.DataFrame({"Paso": np.arange(1, pasos + 1)})
+        for (tipo, nombre, _), v in zip(parametros, valores):
+            tabla[f"{tipo} {nombre}"] = v
+        tabla["Estado"] = [r["status"] for r in resultados]
+        tabla["Valor óptimo"] = pd.to_numeric([r["valor_objetivo"] for r in resultados])
+        return pd.concat([tabla, pd.DataFrame([r["solucion"] for r in resultados])], axis=1)
+
+    def exportar(self, destino=None, formato="mps"):
+        """
+        Exporta el modelo en formato MPS o LP desde su forma matricial.
+
+        Args:
+            destino (str | file, optional): Ruta o archivo abierto. Si no se indica,
+                se devuelve un BytesIO.
+            formato (str): 'mps' o 'lp'.
+
+        Returns:
+            BytesIO | None: El archivo en memoria si no se indicó `destino`.
+        """
+        return escribir_modelo(self.forma_vigente(), destino, formato, nombre=type(self).__name__)
+
     def resolver(self):
         """
-        Resuelve el modelo de optimización usando el solver de PuLP.
+        Resuelve el modelo de optimización con el solver elegido en `self.solver`.
 
         Este método aplica a problemas de:
 
@@ -52,89 +412,367 @@ class Problema:
         - Minimización
         - Transporte (formulado como PL)
 
+        Con "cbc" se usa el solver por defecto de PuLP; con "highs" el modelo se
+        resuelve en el mismo proceso, sin archivos temporales, y los valores se
+        copian a las variables de PuLP.
+
+        Si hay variables enteras o binarias el modelo se resuelve como MIP, con
+        `limite_tiempo`, `gap` y (en CBC) `hilos`. Si el solver se detiene por
+        tiempo con una solución entera, el estado es "Not Solved" y el resultado
+        trae la mejor solución encontrada.
+
+        Si se aplicó el presolve (`construir_reducido`), se resuelve solo el modelo
+        reducido (o ninguno, si el presolve lo resolvió por completo) y la solución
+        se restaura sobre las variables originales.
+
+        Con `sensibilidad`, el resultado incluye además el análisis de sensibilidad
+        (ver `agregar_sensibilidad`).
+
         Returns:
-            dict: Contiene 'status', 'valor_objetivo' y 'solucion' (diccionario de variables).
+            dict: Contiene 'status', 'valor_objetivo' y 'solucion' (diccionario de variables),
+            más 'presolve' con el resumen de la reducción si se aplicó, 'sensibilidad'
+            si se pidió y 'gap' (brecha relativa de optimalidad) en modelos enteros.
+        """
+        if self.reduccion is not None:
+            resultado = self._resolver_modelo() if self.reduccion.requiere_solver() else None
+            self.resultado = self.reduccion.restaurar(resultado)
+        else:
+            resultado = self.resultado = self._resolver_modelo()
+
+        if self.sensibilidad:
+            self.agregar_sensibilidad((resultado or {}).pop("duales", None))
+        return self.resultado
+
+    def agregar_sensibilidad(self, duales: dict = None):
+        """
+        Agrega a `self.resultado` el análisis de sensibilidad de la solución óptima.
+
+        Se calcula sobre la forma matricial vigente con `analizar_sensibilidad`;
+        los duales del solver (del modelo reducido, si hubo presolve) solo guían la
+        elección de la base en soluciones degeneradas. Los modelos con variables
+        enteras no tienen análisis de sensibilidad.
+
+        Args:
+            duales (dict, optional): 'precios' y 'costos_reducidos' del modelo resuelto.
         """
-        self.modelo.solve()
+        if self.resultado is None or self.resultado["status"] != "Optimal":
+            return
+
+        forma = self.forma_vigente()
+        if forma.mixta:
+            return
+        solucion = self.resultado["solucion"]
+        x = np.array([solucion.get(nombre) for nombre in forma.nombres_variables], dtype=float)
+        if np.isnan(x).any():
+            return
+
+        precios = costos_reducidos = None
+        if duales is not None:
+            precios, costos_reducidos = duales["precios"], duales["costos_reducidos"]
+            if self.reduccion is not None:
+                precios = np.full(len(forma.nombres_restricciones), np.nan)
+                precios[self.reduccion.filas] = duales["precios"]
+                costos_reducidos = np.full(len(forma.nombres_variables), np.nan)
+                costos_reducidos[self.reduccion.columnas] = duales["costos_reducidos"]
+
+        self.resultado["sensibilidad"] = analizar_sensibilidad(forma, x, precios, costos_reducidos)
+
+    def _resolver_modelo(self):
+        forma = self.reduccion.forma if self.reduccion is not None else None
+        if self.solver == "highs":
+            forma = forma or self.forma_vigente()
+            opciones = {} if self.limite_tiempo is None else {"time_limit": self.limite_tiempo}
+            if forma.mixta and self.gap is not None:
+                opciones["mip_rel_gap"] = self.gap
+            resultado = resolver_highs(forma, duales=self.sensibilidad, **opciones)
+            if self.modelo is not None:
+                for v in self.modelo.variables():
+                    v.varValue = resultado["solucion"].get(v.name)
+            return resultado
+
+        # Arranque en caliente desde la solución anterior (tras `actualizar`)
+        if self.resultado is not None:
+            anterior = self.resultado["solucion"]
+            for v in self.modelo.variables():
+                if anterior.get(v.name) is not None:
+                    v.setInitialValue(anterior[v.name])
+
+        # Con `registro_solver` el log de CBC va al archivo en lugar de la consola. En los
+        # modelos enteros el log se guarda siempre, para leer la brecha final.
+        mixto = self.modelo.isMIP()
+        registro = self.registro_solver
+        if registro is None and mixto:
+            descriptor, registro = tempfile.mkstemp(prefix="cbc-", suffix=".log")
+            os.close(descriptor)
+        solver = pulp.PULP_CBC_CMD(
+            warmStart=self.resultado is not None, timeLimit=self.limite_tiempo, gapRel=self.gap,
+            threads=(self.hilos or HILOS_POR_DEFECTO) if mixto else None,
+            msg=registro is None, logPath=registro
+        )
+        try:
+            self.modelo.solve(solver)
+            gap = gap_registro_cbc(registro) if mixto else None
+        finally:
+            if registro is not None and registro != self.registro_solver:
+                os.remove(registro)
+
+        status = pulp.LpStatus[self.modelo.status]
+        if mixto and self.modelo.sol_status == pulp.LpSolutionIntegerFeasible:
+            status = "Not Solved"  # detenido por tiempo con una solución entera
         solucion = {v.name: v.varValue for v in self.modelo.variables()}
-        self.resultado = {
+        resultado = {
             "solucion": solucion,
             "valor_objetivo": pulp.value(self.modelo.objective),
-            "status": pulp.LpStatus[self.modelo.status]
+            "status": status
         }
-        return self.resultado
+        if mixto:
+            resultado["gap"] = gap
+            return resultado
+        if self.sensibilidad:
+            resultado["duales"] = duales_pulp(self.modelo, forma or self.forma_vigente())
+        return resultado
     
-class Maximizacion(Problema):
+# Formato largo del modelo: una fila por coeficiente no nulo (Restriccion, Variable, Coef).
+# Las filas cuya 'Restriccion' es FILA_OBJETIVO son los coeficientes de la función objetivo.
+COLUMNAS_LARGO = {"Restriccion", "Variable", "Coef"}
+FILA_OBJETIVO = "FO"
+
+def es_formato_largo(df_modelo: pd.DataFrame) -> bool:
+    """Indica si la tabla del modelo está en formato largo (Restriccion, Variable, Coef)."""
+    return COLUMNAS_LARGO.issubset(df_modelo.columns)
+
+def matriz_desde_largo(df_modelo: pd.DataFrame, nombres_restricciones):
     """
-    Modelo de programación lineal para problemas de maximización.
+    Arma la función objetivo y la matriz de restricciones desde el formato largo.
 
-    Construye una función objetivo lineal a maximizar, sujeta a un conjunto
-    de restricciones lineales.
+    Las variables se numeran en orden de aparición y cada fila se asocia por
+    nombre a su restricción, por lo que el costo es proporcional a la cantidad
+    de coeficientes informados. Los pares repetidos se suman.
+
+    Args:
+        df_modelo (pd.DataFrame): Coeficientes con columnas 'Restriccion', 'Variable' y 'Coef'.
+        nombres_restricciones (array-like): Nombres de las restricciones, en el orden de las filas de A.
+
+    Returns:
+        tuple: (variables, c, A) con los nombres de las variables como np.ndarray,
+        `c` como np.ndarray y `A` como scipy.sparse.csr_matrix (restricciones × variables).
+
+    Raises:
+        ValueError: Si algún coeficiente refiere a una restricción que no existe.
+    """
+
+    idx_variable, variables = pd.factorize(df_modelo["Variable"])
+    coeficientes = df_modelo["Coef"].to_numpy(dtype=float)
+    restricciones = df_modelo["Restriccion"].to_numpy()
+    es_objetivo = restricciones == FILA_OBJETIVO
+
+    c = np.bincount(idx_variable[es_objetivo], weights=coeficientes[es_objetivo], minlength=len(variables))
+
+    nombres_restricciones = pd.Index(nombres_restricciones)
+    idx_restriccion = nombres_restricciones.get_indexer(restricciones[~es_objetivo])
+    if (idx_restriccion < 0).any():
+        desconocidas = pd.unique(restricciones[~es_objetivo][idx_restriccion < 0])
+        raise ValueError(
+            f"🧩 Coeficientes para restricciones no definidas: {', '.join(map(str, desconocidas[:10]))}."
+        )
+
+    A = sparse.csr_matrix(
+        (coeficientes[~es_objetivo], (idx_restriccion, idx_variable[~es_objetivo])),
+        shape=(len(nombres_restricciones), len(variables))
+    )
+    return np.asarray(variables, dtype=object), c, A
+
+class ProgramacionLineal(Problema):
+    """
+    Base común para los modelos lineales de Maximización y Minimización.
+
+    El modelo admite dos formatos:
+
+    - Ancho: columnas 'Variable', 'Coef_FO' y una columna `Coef_R#` por restricción.
+    - Largo: una fila por coeficiente no nulo con columnas 'Restriccion',
+      'Variable' y 'Coef'; los de la función objetivo usan la restricción 'FO'.
+
+    En ambos casos los coeficientes se extraen una sola vez como una matriz
+    dispersa (restricciones × variables) y la función objetivo y las
+    restricciones se construyen fila a fila sobre esa matriz, omitiendo los
+    coeficientes nulos. Las subclases solo definen el nombre del modelo y el
+    sentido de optimización.
+
+    El tipo y las cotas de cada variable se leen de las columnas opcionales
+    'Tipo_Var', 'Cota_Inf' y 'Cota_Sup' (ver `tipos_de_variables`); en formato
+    largo basta con indicarlos en una de las filas de la variable.
 
     Métodos:
+        nombres_variables(): Devuelve los nombres de las variables en orden de columna.
+        tipos_variables(): Devuelve el tipo y las cotas de cada variable.
+        matriz_coeficientes(): Devuelve el vector de la FO y la matriz de restricciones.
         construir(): Define la función objetivo y restricciones.
     """
 
+    nombre_modelo = "Modelo_Lineal"
+    sentido = pulp.LpMaximize
+
+    SENTIDOS_RESTRICCION = {
+        "<=": pulp.LpConstraintLE,
+        ">=": pulp.LpConstraintGE,
+        "=": pulp.LpConstraintEQ,
+    }
+
+    def nombres_variables(self) -> np.ndarray:
+        """
+        Devuelve los nombres de las variables, en el orden de las columnas de la matriz.
+
+        Returns:
+            np.ndarray: Nombres de las variables.
+        """
+
+        if es_formato_largo(self.modelo_df):
+            return np.asarray(pd.unique(self.modelo_df["Variable"]), dtype=object)
+        return self.modelo_df["Variable"].to_numpy()
+
+    def tipos_variables(self) -> tuple:
+        """
+        Devuelve el tipo y las cotas de las variables, en el orden de `nombres_variables()`.
+
+        Returns:
+            tuple: (enteras, var_inf, var_sup) como np.ndarray (ver `tipos_de_variables`).
+        """
+
+        nombres = self.nombres_variables()
+        df = self.modelo_df
+        if es_formato_largo(df):
+            presentes = [col for col in COLUMNAS_VARIABLE if col in df.columns]
+            if presentes:
+                df = df.groupby("Variable", sort=False)[presentes].first().reindex(nombres)
+            else:
+                df = pd.DataFrame(index=pd.RangeIndex(len(nombres)))
+        return tipos_de_variables(df, nombres)
+
+    def crear_variables(self):
+        enteras, var_inf, var_sup = self.tipos_variables()
+        self.variables = {
+            nombre: variable_pulp(nombre, inf, sup, entera)
+            for nombre, inf, sup, entera in zip(self.nombres_variables(), var_inf, var_sup, enteras)
+        }
+
+    def matriz_coeficientes(self):
+        """
+        Extrae los coeficientes del modelo en formato matricial.
+
+        En formato ancho, la restricción i-ésima de `restricciones_df` se asocia
+        a la i-ésima columna `Coef_R#` del modelo. En formato largo, cada
+        coeficiente se asocia a su restricción por nombre (ver `matriz_desde_largo`).
+
+        Returns:
+            tuple: (c, A) con `c` como np.ndarray de la función objetivo y `A`
+            como scipy.sparse.csr_matrix de forma (restricciones, variables).
+        """
+
+        if es_formato_largo(self.modelo_df):
+            _, c, A = matriz_desde_largo(self.modelo_df, self.restricciones_df["Restriccion"])
+            return c, A
+
+        columnas_restriccion = [col for col in self.modelo_df.columns if col.startswith("Coef_R")]
+        if len(columnas_restriccion) < len(self.restricciones_df):
+            raise ValueError("🧩 Cada restricción necesita su columna de coeficientes (Coef_R#) en el modelo.")
+        columnas_restriccion = columnas_restriccion[:len(self.restricciones_df)]
+
+        c = self.modelo_df["Coef_FO"].to_numpy(dtype=float)
+        coeficientes = self.modelo_df[columnas_restriccion].to_numpy(dtype=float)
+        A = sparse.csr_matrix(coeficientes.T)
+        return c, A
+
+    def forma_matricial(self) -> FormaMatricial:
+        """
+        Genera la forma matricial directamente desde la matriz de coeficientes.
+
+        Conserva las mismas variables (las que tienen algún coeficiente no nulo,
+        ordenadas por nombre) y restricciones que el modelo de PuLP.
+
+        Returns:
+            FormaMatricial: Modelo listo para un solver en memoria.
+        """
+
+        c, A = self.matriz_coeficientes()
+        A = A.tocsc()
+        nombres = self.nombres_variables()
+        enteras, var_inf, var_sup = self.tipos_variables()
+
+        validas = self.restricciones_df["Tipo"].isin(self.SENTIDOS_RESTRICCION).to_numpy()
+        columnas = np.flatnonzero((c != 0) | (A[validas].getnnz(axis=0) > 0))
+        columnas = columnas[np.argsort(nombres[columnas].astype(str), kind="stable")]
+
+        fila_inf, fila_sup = cotas_por_tipo(self.restricciones_df["Tipo"], self.restricciones_df["RHS"])
+
+        return FormaMatricial(
+            nombres_variables=nombres[columnas].tolist(),
+            nombres_restricciones=self.restricciones_df["Restriccion"].to_numpy()[validas].tolist(),
+            c=c[columnas],
+            A=A[validas][:, columnas].tocsr(),
+            fila_inf=fila_inf[validas],
+            fila_sup=fila_sup[validas],
+            var_inf=var_inf[columnas],
+            var_sup=var_sup[columnas],
+            maximizar=self.sentido == pulp.LpMaximize,
+            enteras=enteras[columnas],
+        )
+
     def construir(self):
-        self.modelo = pulp.LpProblem("Modelo_de_Maximizacion", pulp.LpMaximize)
+        if self.presolve:
+            self.construir_reducido(self.nombre_modelo)
+            return
+
+        self.modelo = pulp.LpProblem(self.nombre_modelo, self.sentido)
         self.crear_variables()
 
+        variables = np.array(list(self.variables.values()), dtype=object)
+        c, A = self.matriz_coeficientes()
+
         # Función objetivo
-        self.modelo += pulp.lpSum(
-            row["Coef_FO"] * self.variables[row["Variable"]]
-            for _, row in self.modelo_df.iterrows()
-        )
+        no_nulos = np.flatnonzero(c)
+        self.modelo += pulp.LpAffineExpression(zip(variables[no_nulos], c[no_nulos]))
 
-        # Restricciones dinámicas
-        columnas_restriccion = [col for col in self.modelo_df.columns if col.startswith("Coef_R")]
-        for i, restr in self.restricciones_df.iterrows():
-            expr = pulp.lpSum(
-                self.modelo_df[col].iloc[j] * self.variables[row["Variable"]]
-                for j, row in self.modelo_df.iterrows()
-                for col in [columnas_restriccion[i]]
-            )
+        # Restricciones: una fila dispersa por restricción
+        tipos = self.restricciones_df["Tipo"].to_numpy()
+        rhs = self.restricciones_df["RHS"].to_numpy()
+        nombres = self.restricciones_df["Restriccion"].to_numpy()
+        for i in range(A.shape[0]):
+            sentido = self.SENTIDOS_RESTRICCION.get(tipos[i])
+            if sentido is None:
+                continue
+            inicio, fin = A.indptr[i], A.indptr[i + 1]
+            expr = pulp.LpAffineExpression(zip(variables[A.indices[inicio:fin]], A.data[inicio:fin]))
+            self.modelo += pulp.LpConstraint(expr, sentido, nombres[i], rhs[i])
 
-            if restr["Tipo"] == "<=":
-                self.modelo += expr <= restr["RHS"], restr["Restriccion"]
-            elif restr["Tipo"] == ">=":
-                self.modelo += expr >= restr["RHS"], restr["Restriccion"]
-            elif restr["Tipo"] == "=":
-                self.modelo += expr == restr["RHS"], restr["Restriccion"]
 
-class Minimizacion(Problema):
+class Maximizacion(ProgramacionLineal):
     """
-    Modelo de programación lineal para problemas de minimización.
+    Modelo de programación lineal para problemas de maximización.
 
-    Construye una función objetivo lineal a minimizar, sujeta a un conjunto
+    Construye una función objetivo lineal a maximizar, sujeta a un conjunto
     de restricciones lineales.
 
     Métodos:
         construir(): Define la función objetivo y restricciones.
     """
-    def construir(self):
-        self.modelo = pulp.LpProblem("Modelo_de_Minimizacion", pulp.LpMinimize)
-        self.crear_variables()
 
-        # Función objetivo (mínima)
-        self.modelo += pulp.lpSum(
-            row["Coef_FO"] * self.variables[row["Variable"]]
-            for _, row in self.modelo_df.iterrows()
-        )
+    nombre_modelo = "Modelo_de_Maximizacion"
+    sentido = pulp.LpMaximize
 
-        # Restricciones
-        columnas_restriccion = [col for col in self.modelo_df.columns if col.startswith("Coef_R")]
-        for i, restr in self.restricciones_df.iterrows():
-            expr = pulp.lpSum(
-                self.modelo_df[columnas_restriccion[i]].iloc[j] * self.variables[row["Variable"]]
-                for j, row in self.modelo_df.iterrows()
-            )
 
-            if restr["Tipo"] == "<=":
-                self.modelo += expr <= restr["RHS"], restr["Restriccion"]
-            elif restr["Tipo"] == ">=":
-                self.modelo += expr >= restr["RHS"], restr["Restriccion"]
-            elif restr["Tipo"] == "=":
-                self.modelo += expr == restr["RHS"], restr["Restriccion"]
+class Minimizacion(ProgramacionLineal):
+    """
+    Modelo de programación lineal para problemas de minimización.
+
+    Construye una función objetivo lineal a minimizar, sujeta a un conjunto
+    de restricciones lineales.
+
+    Métodos:
+        construir(): Define la función objetivo y restricciones.
+    """
+
+    nombre_modelo = "Modelo_de_Minimizacion"
+    sentido = pulp.LpMinimize
 
 class Transporte(Problema):
     """
@@ -143,46 +781,240 @@ class Transporte(Problema):
     Toma como entrada una tabla de costos unitarios entre orígenes y destinos,
     junto con la oferta y demanda de cada nodo.
 
+    Además de los solvers generales de PL admite el solver "modi", un motor
+    propio de simplex de transporte (base inicial de Vogel + mejora MODI) que
+    trabaja directamente sobre la matriz de costos sin formular el modelo en PuLP.
+
+    Cada ruta puede indicar su tipo y sus cotas con las columnas opcionales
+    'Tipo_Var', 'Cota_Inf' y 'Cota_Sup' (ver `tipos_de_variables`).
+
     Métodos:
-        construir(): Crea las variables, restricciones de oferta/demanda y función objetivo.
+        construir(): Indexa orígenes/destinos y crea variables, restricciones de oferta/demanda y función objetivo.
+        forma_matricial(): Genera la forma matricial directamente desde la tabla de costos.
+        resolver(): Resuelve con el solver elegido, incluido "modi".
     """
 
-    def construir(self):
-        self.modelo = pulp.LpProblem("Problema_de_Transporte", pulp.LpMinimize)
+    solvers = SOLVERS + ("modi",)
+    entradas = ("costos",)
 
+    def _indexar(self):
         df = self.modelo_df  # en este caso contiene costos, oferta y demanda
 
+        # Indexación O(n) de orígenes y destinos
+        self.idx_origen, self.origenes = pd.factorize(df["Origen"])
+        self.idx_destino, self.destinos = pd.factorize(df["Destino"])
+        self.oferta_por_origen = df.dropna(subset=["Oferta"]).groupby("Origen").first()["Oferta"]
+        self.demanda_por_destino = df.dropna(subset=["Demanda"]).groupby("Destino").first()["Demanda"]
+
+    def construir(self):
+        df = self.modelo_df
+        self._indexar()
+
+        if self.solver == "modi":
+            return
+        if self.presolve:
+            self.construir_reducido("Problema_de_Transporte")
+            return
+
+        self.modelo = pulp.LpProblem("Problema_de_Transporte", pulp.LpMinimize)
+
         # Crear variables de decisión: X_origen_destino
+        enteras, var_inf, var_sup = tipos_de_variables(df, df["Origen"].astype(str) + "-" + df["Destino"].astype(str))
         self.variables = {
-            (row["Origen"], row["Destino"]): pulp.LpVariable(f"X_{row['Origen']}_{row['Destino']}", lowBound=0)
-            for _, row in df.iterrows()
+            (origen, destino): variable_pulp(f"X_{origen}_{destino}", inf, sup, entera)
+            for origen, destino, inf, sup, entera in zip(df["Origen"], df["Destino"], var_inf, var_sup, enteras)
         }
+        variables = np.empty(len(df), dtype=object)
+        variables[:] = [self.variables[par] for par in zip(df["Origen"], df["Destino"])]
 
         # Función objetivo: minimizar suma de costo * cantidad
-        self.modelo += pulp.lpSum(
-            row["Costo"] * self.variables[(row["Origen"], row["Destino"])]
-            for _, row in df.iterrows()
-        )
+        costos = df["Costo"].to_numpy(dtype=float)
+        no_nulos = np.flatnonzero(costos)
+        self.modelo += pulp.LpAffineExpression(zip(variables[no_nulos], costos[no_nulos]))
 
         # Restricción de oferta por origen
-        oferta_por_origen = df.dropna(subset=["Oferta"]).groupby("Origen").first()["Oferta"]
-        for origen, oferta in oferta_por_origen.items():
-            self.modelo += (
-                pulp.lpSum(
-                    self.variables[(origen, d)] for d in df[df["Origen"] == origen]["Destino"]
-                ) <= oferta,
-                f"Oferta_{origen}"
-            )
+        filas_por_origen = df.groupby("Origen").indices
+        for origen, oferta in self.oferta_por_origen.items():
+            expr = pulp.LpAffineExpression((v, 1) for v in variables[filas_por_origen[origen]])
+            self.modelo += pulp.LpConstraint(expr, pulp.LpConstraintLE, f"Oferta_{origen}", oferta)
 
         # Restricción de demanda por destino
-        demanda_por_destino = df.dropna(subset=["Demanda"]).groupby("Destino").first()["Demanda"]
-        for destino, demanda in demanda_por_destino.items():
-            self.modelo += (
-                pulp.lpSum(
-                    self.variables[(o, destino)] for o in df[df["Destino"] == destino]["Origen"]
-                ) >= demanda,
-                f"Demanda_{destino}"
-            )
+        filas_por_destino = df.groupby("Destino").indices
+        for destino, demanda in self.demanda_por_destino.items():
+            expr = pulp.LpAffineExpression((v, 1) for v in variables[filas_por_destino[destino]])
+            self.modelo += pulp.LpConstraint(expr, pulp.LpConstraintGE, f"Demanda_{destino}", demanda)
+
+    def forma_matricial(self) -> FormaMatricial:
+        """
+        Genera la forma matricial directamente desde la tabla de costos.
+
+        Usa las mismas variables X_origen_destino (ordenadas por nombre) y las
+        mismas restricciones de oferta y demanda que el modelo de PuLP, por lo
+        que no requiere construirlo (sirve también con el solver "modi").
+
+        Returns:
+            FormaMatricial: Modelo listo para un solver en memoria.
+        """
+
+        if not hasattr(self, "origenes"):
+            self._indexar()
+
+        df = self.modelo_df
+        nombres = np.array([
+            f"X_{origen}_{destino}".translate(pulp.LpElement.trans)
+            for origen, destino in zip(df["Origen"], df["Destino"])
+        ], dtype=object)
+        costos = df["Costo"].to_numpy(dtype=float)
+        enteras, var_inf, var_sup = tipos_de_variables(df, nombres)
+
+        # Fila de cada origen con oferta y de cada destino con demanda (-1 si no tiene)
+        num_ofertas, num_demandas = len(self.oferta_por_origen), len(self.demanda_por_destino)
+        fila_origen = np.full(len(self.origenes), -1)
+        fila_origen[self.origenes.get_indexer(self.oferta_por_origen.index)] = np.arange(num_ofertas)
+        fila_destino = np.full(len(self.destinos), -1)
+        fila_destino[self.destinos.get_indexer(self.demanda_por_destino.index)] = num_ofertas + np.arange(num_demandas)
+
+        filas = np.concatenate([fila_origen[self.idx_origen], fila_destino[self.idx_destino]])
+        columnas = np.tile(np.arange(len(df)), 2)
+        validas = filas >= 0
+        A = sparse.csc_matrix(
+            (np.ones(validas.sum()), (filas[validas], columnas[validas])),
+            shape=(num_ofertas + num_demandas, len(df))
+        )
+
+        columnas = np.flatnonzero((costos != 0) | (A.getnnz(axis=0) > 0))
+        columnas = columnas[np.argsort(nombres[columnas].astype(str), kind="stable")]
+
+        return FormaMatricial(
+            nombres_variables=nombres[columnas].tolist(),
+            nombres_restricciones=(
+                [f"Oferta_{origen}".translate(pulp.LpElement.trans) for origen in self.oferta_por_origen.index]
+                + [f"Demanda_{destino}".translate(pulp.LpElement.trans) for destino in self.demanda_por_destino.index]
+            ),
+            c=costos[columnas],
+            A=A[:, columnas].tocsr(),
+            fila_inf=np.concatenate([np.full(num_ofertas, -np.inf), self.demanda_por_destino.to_numpy(dtype=float)]),
+            fila_sup=np.concatenate([self.oferta_por_origen.to_numpy(dtype=float), np.full(num_demandas, np.inf)]),
+            var_inf=var_inf[columnas],
+            var_sup=var_sup[columnas],
+            enteras=enteras[columnas],
+        )
+
+    def resolver(self):
+        """
+        Resuelve el modelo de transporte.
+
+        Con el solver "modi" arma la matriz de costos (los pares sin fila quedan
+        prohibidos), toma como ilimitada la oferta de los orígenes sin 'Oferta' y
+        como nula la demanda de los destinos sin 'Demanda', y aplica el simplex de
+        transporte. El resto de solvers usa la formulación de PL de `Problema.resolver`.
+
+        "modi" no admite cotas por ruta; las rutas enteras se aceptan si la oferta
+        y la demanda son enteras, porque entonces la solución básica ya es entera.
+
+        Returns:
+            dict: Contiene 'status', 'valor_objetivo' y 'solucion' con las mismas
+            variables X_origen_destino que la formulación en PuLP.
+        """
+        if self.solver != "modi":
+            return super().resolver()
+
+        costos_filas = self.modelo_df["Costo"].to_numpy(dtype=float)
+        if (costos_filas < 0).any():
+            raise ValueError("❌ El solver 'modi' requiere costos no negativos.")
+        enteras, var_inf, var_sup = tipos_de_variables(self.modelo_df)
+        if (var_inf != 0).any() or np.isfinite(var_sup).any():
+            raise ValueError("❌ El solver 'modi' no admite cotas ni rutas binarias; use 'cbc' o 'highs'.")
+        cantidades = np.concatenate([self.oferta_por_origen.to_numpy(dtype=float),
+                                     self.demanda_por_destino.to_numpy(dtype=float)])
+        if enteras.any() and (cantidades != np.round(cantidades)).any():
+            raise ValueError("❌ Con rutas enteras, el solver 'modi' requiere oferta y demanda enteras.")
+
+        m, n = len(self.origenes), len(self.destinos)
+        costos = np.full((m, n), np.inf)
+        costos[self.idx_origen, self.idx_destino] = costos_filas
+
+        demanda = self.demanda_por_destino.astype(float).reindex(self.destinos).fillna(0).to_numpy()
+        oferta = self.oferta_por_origen.astype(float).reindex(self.origenes).to_numpy()
+        oferta[np.isnan(oferta)] = demanda.sum()
+
+        flujos, status = resolver_transporte_modi(costos, oferta, demanda)
+        valores = flujos[self.idx_origen, self.idx_destino]
+
+        nombres = [
+            f"X_{origen}_{destino}".translate(pulp.LpElement.trans)
+            for origen, destino in zip(self.modelo_df["Origen"], self.modelo_df["Destino"])
+        ]
+        orden = np.argsort(nombres, kind="stable")
+
+        self.resultado = {
+            "solucion": {nombres[k]: float(valores[k]) for k in orden},
+            "valor_objetivo": float(costos_filas @ valores) if status == "Optimal" else None,
+            "status": status
+        }
+        if enteras.any():
+            self.resultado["gap"] = 0.0 if status == "Optimal" else None
+        if self.sensibilidad:
+            self.agregar_sensibilidad()
+        return self.resultado
+
+
+class ModeloMatricial(Problema):
+    """
+    Modelo lineal dado directamente en forma matricial.
+
+    Permite resolver modelos generados fuera de la app (archivos MPS o LP, ver
+    `main.intercambio`) con los mismos solvers que el resto de problemas. Con
+    "highs" la forma matricial se resuelve tal cual, sin construir el modelo en
+    PuLP; con "cbc" se construye con `modelo_desde_forma`.
+
+    Args:
+        forma (FormaMatricial): Modelo a resolver.
+        solver (str, optional): Solver a usar (ver `solvers`). Por defecto, SOLVER_POR_DEFECTO.
+        presolve (bool, optional): Reducir el modelo antes de resolverlo. Por defecto, PRESOLVE_POR_DEFECTO.
+        sensibilidad (bool): Agregar al resultado el análisis de sensibilidad.
+        limite_tiempo (float, optional): Segundos máximos para el solver.
+        gap (float, optional): Brecha relativa de optimalidad con la que el solver puede detenerse.
+        hilos (int, optional): Hilos de CBC en modelos con variables enteras.
+
+    Métodos:
+        desde_archivo(): Importa el modelo desde un archivo MPS o LP.
+        construir(): Construye el modelo en PuLP (o el reducido, con presolve) si el solver lo requiere.
+    """
+
+    entradas = ()
+
+    def __init__(self, forma: FormaMatricial, solver: str = None, presolve: bool = None,
+                 sensibilidad: bool = False, limite_tiempo: float = None, gap: float = None,
+                 hilos: int = None):
+        super().__init__(pd.DataFrame(), pd.DataFrame(), solver=solver, presolve=presolve,
+                         sensibilidad=sensibilidad, limite_tiempo=limite_tiempo, gap=gap, hilos=hilos)
+        self.forma = forma
+
+    @classmethod
+    def desde_archivo(cls, origen, formato=None, solver=None, presolve=None):
+        """
+        Importa un modelo MPS o LP (ver `main.intercambio.leer_modelo`).
+
+        Args:
+            origen (str | file): Ruta o archivo abierto.
+            formato (str, optional): 'mps' o 'lp'. Por defecto se deduce del nombre del archivo.
+            solver (str, optional): Solver a usar.
+            presolve (bool, optional): Reducir el modelo antes de resolverlo.
+
+        Returns:
+            ModeloMatricial: Instancia sin construir.
+        """
+        return cls(leer_modelo(origen, formato), solver=solver, presolve=presolve)
+
+    def forma_matricial(self) -> FormaMatricial:
+        return self.forma
+
+    def construir(self):
+        if self.presolve:
+            self.construir_reducido("Modelo_Importado")
+        elif self.solver != "highs":
+            self.modelo = modelo_desde_forma(self.forma, "Modelo_Importado")
 
 
 class Asignacion:
@@ -190,36 +1022,108 @@ class Asignacion:
     Problema de asignación de recursos usando el Método Húngaro.
 
     Este modelo busca asignar recursos a tareas minimizando el costo total
-    (o maximizando la utilidad) en una matriz cuadrada.
+    (o maximizando la utilidad). Acepta dos formatos de entrada:
+
+    - Matriz (agentes × tareas), cuadrada o rectangular. Las celdas vacías (NaN)
+      indican pares prohibidos. Si la primera columna contiene etiquetas de
+      texto, se usa como índice de agentes.
+    - Formato largo de pares permitidos, con columnas 'Agente', 'Tarea' y 'Costo'.
+
+    Las matrices completas se resuelven con `linear_sum_assignment`; las que tienen
+    pares prohibidos y el formato largo se guardan como matriz dispersa y se resuelven
+    con `min_weight_full_bipartite_matching`, de modo que la memoria depende solo
+    de los pares permitidos.
 
     Args:
-        df_costos (pd.DataFrame): Matriz de costos entre agentes y tareas.
+        df_costos (pd.DataFrame): Matriz de costos entre agentes y tareas o pares permitidos.
+        maximizar (bool): Si es True, maximiza la utilidad total en lugar de minimizar el costo.
 
     Métodos:
-        construir(): Verifica formato y prepara la matriz.
+        construir(): Verifica formato y prepara la matriz (densa o dispersa).
         resolver(): Ejecuta el método Húngaro y devuelve asignaciones óptimas.
     """
 
-    def __init__(self, df_costos):
+    COLUMNAS_LARGO = {"Agente", "Tarea", "Costo"}
+    solvers = ("hungaro",)
+    entradas = ("costos",)
+
+    def __init__(self, df_costos, maximizar=False):
         self.df_costos = df_costos
+        self.maximizar = maximizar
         self.resultado = {}
 
     def construir(self):
-        self.matriz = self.df_costos.to_numpy()
-        if self.matriz.shape[0] != self.matriz.shape[1]:
-            raise ValueError("⚠️ La matriz de asignación debe ser cuadrada para el método húngaro.")
+        df = self.df_costos
+
+        if self.COLUMNAS_LARGO.issubset(df.columns):
+            # csr_matrix sumaría los costos de los pares repetidos
+            if df.duplicated(subset=["Agente", "Tarea"]).any():
+                raise ValueError("❌ Cada par Agente-Tarea debe aparecer una sola vez.")
+            idx_agente, self.agentes = pd.factorize(df["Agente"])
+            idx_tarea, self.tareas = pd.factorize(df["Tarea"])
+            self.matriz = sparse.csr_matrix(
+                (df["Costo"].to_numpy(dtype=float), (idx_agente, idx_tarea)),
+                shape=(len(self.agentes), len(self.tareas))
+            )
+            return
+
+        if len(df.columns) and not pd.api.types.is_numeric_dtype(df[df.columns[0]]):
+            df = df.set_index(df.columns[0])
+        self.agentes, self.tareas = df.index, df.columns
+        self.matriz = df.to_numpy(dtype=float)
+
+        # Pares prohibidos: pasar a formato disperso sin materializar los NaN
+        permitidos = ~np.isnan(self.matriz)
+        if not permitidos.all():
+            filas, columnas = np.nonzero(permitidos)
+            self.matriz = sparse.csr_matrix(
+                (self.matriz[filas, columnas], (filas, columnas)),
+                shape=self.matriz.shape
+            )
 
     def resolver(self):
         """
-        Ejecuta el método Húngaro (scipy.optimize.linear_sum_assignment) para resolver el problema.
+        Ejecuta el método Húngaro para resolver el problema.
+
+        Para matrices densas usa scipy.optimize.linear_sum_assignment (con
+        `maximize` si corresponde). Para matrices dispersas usa
+        scipy.sparse.csgraph.min_weight_full_bipartite_matching sobre un vector
+        de pesos desplazado a valores positivos (y con el signo invertido al
+        maximizar) que comparte los índices de la matriz original.
 
         Returns:
             dict: Contiene 'status', 'valor_objetivo' y lista de 'asignaciones' óptimas.
         """
 
-        fila, columna = linear_sum_assignment(self.matriz)
-        asignaciones = [(self.df_costos.index[i], self.df_costos.columns[j]) for i, j in zip(fila, columna)]
-        total = self.matriz[fila, columna].sum()
+        try:
+            if sparse.issparse(self.matriz):
+                datos = self.matriz.data
+                if self.maximizar:
+                    pesos = datos.max(initial=0) - datos + 1
+                else:
+                    pesos = datos - datos.min(initial=0) + 1
+                grafo = sparse.csr_matrix(
+                    (pesos, self.matriz.indices, self.matriz.indptr),
+                    shape=self.matriz.shape, copy=False
+                )
+                fila, columna = min_weight_full_bipartite_matching(grafo)
+                total = np.asarray(self.matriz[fila, columna]).ravel().sum()
+            else:
+                fila, columna = linear_sum_assignment(self.matriz, maximize=self.maximizar)
+                total = self.matriz[fila, columna].sum()
+        except ValueError:
+            # No existe una asignación completa con los pares permitidos
+            self.resultado = {
+                "status": "Infactible",
+                "valor_objetivo": None,
+                "asignaciones": []
+            }
+            return self.resultado
+
+        asignaciones = list(zip(
+            np.asarray(self.agentes)[fila].tolist(),
+            np.asarray(self.tareas)[columna].tolist()
+        ))
 
         self.resultado = {
             "status": "Óptimo",
@@ -228,4 +1132,182 @@ class Asignacion:
         }
         return self.resultado
 
+    @classmethod
+    def resolver_matrices(cls, costos, maximizar=False, procesos=None):
+        """
+        Resuelve muchas matrices de costos del mismo tamaño de una sola vez.
+
+        Las matrices se apilan en un arreglo (k × agentes × tareas) y se reparten
+        por bloques en un pool de procesos; cada proceso recorre su bloque con
+        `linear_sum_assignment` sin crear DataFrames ni listas por matriz. Los
+        pares prohibidos (NaN) se tratan como costo infinito.
+
+        Args:
+            costos (np.ndarray | list): Arreglo 3-D, o lista de DataFrames en cualquiera de
+                los formatos de `Asignacion` (todos con el mismo número de agentes y tareas).
+            maximizar (bool): Si es True, maximiza la utilidad total.
+            procesos (int, optional): Procesos a usar. Por defecto, HILOS_POR_DEFECTO, con al
+                menos MATRICES_POR_PROCESO matrices por proceso; con 1 se resuelve en el proceso actual.
+
+        Returns:
+            LoteAsignacion: Filas, columnas y totales como arreglos de NumPy.
+
+        Raises:
+            ValueError: Si las matrices no son 3-D o no tienen el mismo tamaño.
+        """
+
+        agentes = tareas = None
+        if isinstance(costos, np.ndarray):
+            arreglo = np.asarray(costos, dtype=float)
+        else:
+            matrices, agentes, tareas = [], [], []
+            for df in costos:
+                if cls.COLUMNAS_LARGO.issubset(df.columns):
+                    df = df.pivot(index="Agente", columns="Tarea", values="Costo")
+                elif len(df.columns) and not pd.api.types.is_numeric_dtype(df[df.columns[0]]):
+                    df = df.set_index(df.columns[0])
+                matrices.append(df.to_numpy(dtype=float))
+                agentes.append(df.index)
+                tareas.append(df.columns)
+            if len({m.shape for m in matrices}) > 1:
+                raise ValueError("❌ Todas las matrices de costos deben tener el mismo número de agentes y tareas.")
+            arreglo = np.stack(matrices) if matrices else np.empty((0, 0, 0))
+
+        if arreglo.ndim != 3:
+            raise ValueError("❌ Se esperaba un arreglo 3-D (matrices × agentes × tareas).")
+
+        k = len(arreglo)
+        procesos = min(procesos or HILOS_POR_DEFECTO, max(1, k // MATRICES_POR_PROCESO))
+        if procesos == 1:
+            partes = [_hungaro_bloque(arreglo, maximizar)]
+        else:
+            bloques = np.array_split(arreglo, procesos)
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                partes = list(ejecutor.map(_hungaro_bloque, bloques, [maximizar] * procesos))
+
+        filas, columnas, totales = (np.concatenate(p) for p in zip(*partes))
+        return LoteAsignacion(filas, columnas, totales, agentes, tareas)
+
+
+def _hungaro_bloque(costos, maximizar):
+    """
+    Resuelve un bloque (b × agentes × tareas) con `linear_sum_assignment`.
+
+    Returns:
+        tuple: Filas y columnas (b × min(agentes, tareas), -1 si es infactible) y totales (NaN si es infactible).
+    """
+
+    b, m, n = costos.shape
+    r = min(m, n)
+    filas = np.full((b, r), -1, dtype=np.int32)
+    columnas = np.full((b, r), -1, dtype=np.int32)
+    totales = np.full(b, np.nan)
+    prohibido = -np.inf if maximizar else np.inf
+
+    for i in range(b):
+        matriz = costos[i]
+        if np.isnan(matriz).any():
+            matriz = np.where(np.isnan(matriz), prohibido, matriz)
+        try:
+            fila, columna = linear_sum_assignment(matriz, maximize=maximizar)
+        except ValueError:
+            continue
+        filas[i], columnas[i] = fila, columna
+        totales[i] = matriz[fila, columna].sum()
+    return filas, columnas, totales
+
+
+@dataclass
+class LoteAsignacion:
+    """
+    Resultado de `Asignacion.resolver_matrices`.
+
+    Las asignaciones se guardan como índices; las etiquetas de agentes y
+    tareas se resuelven solo al pedir una matriz concreta.
+
+    Atributos:
+        filas (np.ndarray): Agente de cada asignación (k × min(agentes, tareas)), -1 si es infactible.
+        columnas (np.ndarray): Tarea de cada asignación, con la misma forma que `filas`.
+        totales (np.ndarray): Valor óptimo de cada matriz (NaN si es infactible).
+        agentes (list, optional): Etiquetas de agentes por matriz (None para arreglos: posiciones).
+        tareas (list, optional): Etiquetas de tareas por matriz.
+    """
+
+    filas: np.ndarray
+    columnas: np.ndarray
+    totales: np.ndarray
+    agentes: list = None
+    tareas: list = None
+
+    def __len__(self):
+        return len(self.totales)
+
+    @property
+    def factibles(self) -> np.ndarray:
+        """Máscara de matrices con asignación completa."""
+        return ~np.isnan(self.totales)
+
+    def asignaciones(self, i) -> list:
+        """Pares (agente, tarea) de la matriz `i`, con sus etiquetas."""
+
+        if not self.factibles[i]:
+            return []
+        fila, columna = self.filas[i], self.columnas[i]
+        if self.agentes is not None:
+            fila = np.asarray(self.agentes[i])[fila]
+            columna = np.asarray(self.tareas[i])[columna]
+        return list(zip(fila.tolist(), columna.tolist()))
+
+    def resultado(self, i) -> dict:
+        """Resultado de la matriz `i` con el mismo formato que `Asignacion.resolver`."""
+
+        if not self.factibles[i]:
+            return {"status": "Infactible", "valor_objetivo": None, "asignaciones": []}
+        return {
+            "status": "Óptimo",
+            "valor_objetivo": self.totales[i].item(),
+            "asignaciones": self.asignaciones(i)
+        }
+
+
+def crear_problema(clase_problema, datos_entrada: dict, **opciones):
+    """
+    Instancia un problema a partir de sus DataFrames de entrada.
+
+    Usa la misma convención de nombres que la interfaz y el historial:
+    'modelo' y 'restricciones' para Maximización/Minimización, y 'costos'
+    para Transporte y Asignación.
+
+    Args:
+        clase_problema (class): Clase del modelo a instanciar.
+        datos_entrada (dict): DataFrames de entrada por nombre.
+        **opciones: Opciones del constructor (por ejemplo `solver` o `maximizar`).
+
+    Returns:
+        Problema | Asignacion: Instancia sin construir.
+    """
+
+    if issubclass(clase_problema, Asignacion):
+        return clase_problema(datos_entrada["costos"], **opciones)
+    if "costos" in datos_entrada:
+        return clase_problema(datos_entrada["costos"], pd.DataFrame(), **opciones)
+    return clase_problema(datos_entrada["modelo"], datos_entrada["restricciones"], **opciones)
+
+
+def crear_problema_desde_archivos(clase_problema, archivos, **opciones):
+    """
+    Instancia un problema leyendo sus entradas desde archivos.
+
+    Acepta un libro Excel o archivos Parquet, Arrow IPC o CSV con los mismos
+    esquemas de 'modelo', 'restricciones' y 'costos' (ver `main.ingesta.leer_archivos`).
+
+    Args:
+        clase_problema (class): Clase del modelo a instanciar.
+        archivos (list): Rutas, tuplas (nombre, bytes) o archivos subidos.
+        **opciones: Opciones del constructor (por ejemplo `solver` o `maximizar`).
+
+    Returns:
+        Problema | Asignacion: Instancia sin construir.
+    """
 
+    return crear_problema(clase_problema, leer_archivos(archivos, clase_problema.entradas), **opciones)
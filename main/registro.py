@@ -0,0 +1,575 @@
+import hashlib
+import os
+import sqlite3
+import zlib
+from datetime import datetime
+
+import pandas as pd
+
+# Base de datos del historial; el CSV histórico con el mismo nombre se migra una sola vez
+RUTA_LOG = "logs/registro.db"
+
+COLUMNAS = [
+    "timestamp", "tipo", "estado", "valor_objetivo", "gap",
+    "entrada_modelo", "entrada_restricciones", "entrada_costos", "solucion", "mediciones"
+]
+
+# Columnas cuyo contenido (JSON) se guarda una sola vez en la tabla `blobs`
+COLUMNAS_CONTENIDO = ["entrada_modelo", "entrada_restricciones", "entrada_costos", "solucion"]
+COLUMNAS_ENTRADA = COLUMNAS_CONTENIDO[:3]
+
+# Columnas livianas para listar el historial (sin los JSON de entrada/solución)
+COLUMNAS_RESUMEN = ["id", "timestamp", "tipo", "estado", "valor_objetivo", "gap"]
+
+# Versión del esquema (PRAGMA user_version):
+# 0: JSON en línea en cada registro; 1: referencias a `blobs` y hash de la entrada;
+# 2: brecha de optimalidad de los modelos enteros; 3: tiempos por fase y tamaño del modelo
+VERSION_ESQUEMA = 3
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS ejecuciones (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    estado TEXT,
+    valor_objetivo REAL,
+    gap REAL,
+    entrada_modelo TEXT,
+    entrada_restricciones TEXT,
+    entrada_costos TEXT,
+    solucion TEXT,
+    mediciones TEXT,
+    hash_entrada TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ejecuciones_timestamp ON ejecuciones (timestamp);
+CREATE INDEX IF NOT EXISTS idx_ejecuciones_tipo ON ejecuciones (tipo, timestamp);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    datos BLOB NOT NULL,
+    tamano INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS migraciones (
+    nombre TEXT PRIMARY KEY,
+    fecha TEXT NOT NULL
+);
+"""
+
+
+def rutas_log(ruta=RUTA_LOG):
+    """
+    Devuelve la ruta de la base SQLite y la del CSV histórico asociado.
+
+    Acepta tanto la ruta de la base (`.db`) como la del antiguo CSV, para que
+    las llamadas que usaban `logs/registro.csv` sigan funcionando.
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        tuple: (ruta_db, ruta_csv)
+    """
+
+    base = os.path.splitext(ruta)[0]
+    return base + ".db", base + ".csv"
+
+
+def conectar(ruta=RUTA_LOG) -> sqlite3.Connection:
+    """
+    Abre la base del historial, creando el esquema y migrando el CSV si hace falta.
+
+    La base usa modo WAL, de modo que varias sesiones pueden escribir y leer a
+    la vez sin bloquearse entre sí y cada registro es un simple INSERT.
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        sqlite3.Connection: Conexión lista para usar.
+    """
+
+    ruta_db, ruta_csv = rutas_log(ruta)
+    os.makedirs(os.path.dirname(ruta_db) or ".", exist_ok=True)
+
+    conexion = sqlite3.connect(ruta_db, timeout=30)
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    conexion.executescript(ESQUEMA)
+    actualizar_esquema(conexion)
+    migrar_csv(conexion, ruta_csv)
+    return conexion
+
+
+def guardar_blob(conexion: sqlite3.Connection, texto: str):
+    """
+    Guarda un contenido en el almacén direccionado por contenido.
+
+    El contenido se identifica por su SHA-256 y se guarda comprimido con zlib una
+    única vez: los registros posteriores con el mismo contenido solo guardan la
+    referencia.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión a la base del historial.
+        texto (str): Contenido a guardar (por ejemplo, un DataFrame en JSON).
+
+    Returns:
+        str | None: Hash del contenido, o None si está vacío.
+    """
+
+    if texto is None or texto == "" or (isinstance(texto, float) and pd.isna(texto)):
+        return None
+    datos = str(texto).encode()
+    clave = hashlib.sha256(datos).hexdigest()
+    conexion.execute(
+        "INSERT OR IGNORE INTO blobs (hash, datos, tamano) VALUES (?, ?, ?)",
+        (clave, zlib.compress(datos), len(datos))
+    )
+    return clave
+
+
+def leer_blobs(conexion: sqlite3.Connection, claves) -> dict:
+    """
+    Recupera y descomprime varios contenidos del almacén.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión a la base del historial.
+        claves (iterable): Hashes a recuperar (se ignoran los vacíos).
+
+    Returns:
+        dict: Hash → texto original.
+    """
+
+    claves = [c for c in set(claves) if c]
+    contenidos = {}
+    for inicio in range(0, len(claves), 500):
+        bloque = claves[inicio:inicio + 500]
+        filas = conexion.execute(
+            f"SELECT hash, datos FROM blobs WHERE hash IN ({', '.join('?' * len(bloque))})", bloque
+        )
+        contenidos.update((clave, zlib.decompress(datos).decode()) for clave, datos in filas)
+    return contenidos
+
+
+def hash_entrada(claves_entrada):
+    """
+    Combina los hashes de las entradas de una ejecución en un único identificador.
+
+    Dos ejecuciones con el mismo `hash_entrada` recibieron exactamente los mismos datos.
+
+    Args:
+        claves_entrada (list): Hashes de modelo, restricciones y costos (o None).
+
+    Returns:
+        str | None
+    """
+
+    if not any(claves_entrada):
+        return None
+    return hashlib.sha256("|".join(c or "" for c in claves_entrada).encode()).hexdigest()
+
+
+def _preparar_fila(conexion: sqlite3.Connection, log: dict) -> list:
+    """Convierte un registro en la fila a insertar, guardando sus contenidos como blobs."""
+
+    fila = {col: log.get(col, "") for col in COLUMNAS}
+    for col in ("valor_objetivo", "gap"):
+        valor = fila[col]
+        fila[col] = None if valor is None or valor == "" or pd.isna(valor) else float(valor)
+    fila["mediciones"] = fila["mediciones"] or None
+    for col in COLUMNAS_CONTENIDO:
+        fila[col] = guardar_blob(conexion, fila[col])
+    fila["hash_entrada"] = hash_entrada([fila[col] for col in COLUMNAS_ENTRADA])
+    return [fila[col] for col in COLUMNAS + ["hash_entrada"]]
+
+
+def _insertar(conexion: sqlite3.Connection, logs) -> int:
+    """Inserta registros (dentro de la transacción en curso) y devuelve el último id."""
+
+    cursor = None
+    for log in logs:
+        cursor = conexion.execute(
+            f"INSERT INTO ejecuciones ({', '.join(COLUMNAS)}, hash_entrada) "
+            f"VALUES ({', '.join('?' * (len(COLUMNAS) + 1))})",
+            _preparar_fila(conexion, log)
+        )
+    return cursor.lastrowid if cursor else None
+
+
+def actualizar_esquema(conexion: sqlite3.Connection):
+    """
+    Lleva una base creada con una versión anterior al esquema actual.
+
+    De la versión 0 a la 1 agrega la columna `hash_entrada` y mueve los JSON que
+    estaban en línea en cada registro al almacén de blobs, por bloques y dentro
+    de una transacción exclusiva; al terminar compacta la base con VACUUM. De la
+    1 a la 2 agrega la columna `gap` y de la 2 a la 3 la columna `mediciones`
+    (vacías en los registros anteriores).
+
+    Args:
+        conexion (sqlite3.Connection): Conexión a la base del historial.
+
+    Returns:
+        None
+    """
+
+    if conexion.execute("PRAGMA user_version").fetchone()[0] >= VERSION_ESQUEMA:
+        return
+
+    migrados = 0
+    conexion.execute("BEGIN IMMEDIATE")
+    try:
+        version = conexion.execute("PRAGMA user_version").fetchone()[0]
+        if version < VERSION_ESQUEMA:
+            columnas = {fila[1] for fila in conexion.execute("PRAGMA table_info(ejecuciones)")}
+            if "hash_entrada" not in columnas:
+                conexion.execute("ALTER TABLE ejecuciones ADD COLUMN hash_entrada TEXT")
+            if "gap" not in columnas:
+                conexion.execute("ALTER TABLE ejecuciones ADD COLUMN gap REAL")
+            if "mediciones" not in columnas:
+                conexion.execute("ALTER TABLE ejecuciones ADD COLUMN mediciones TEXT")
+
+            ultimo_id = 0
+            while version < 1:
+                filas = conexion.execute(
+                    f"SELECT id, {', '.join(COLUMNAS_CONTENIDO)} FROM ejecuciones "
+                    "WHERE id > ? ORDER BY id LIMIT 5000",
+                    (ultimo_id,)
+                ).fetchall()
+                if not filas:
+                    break
+                actualizaciones = []
+                for id_ejecucion, *contenidos in filas:
+                    claves = [guardar_blob(conexion, texto) for texto in contenidos]
+                    actualizaciones.append(claves + [hash_entrada(claves[:3]), id_ejecucion])
+                conexion.executemany(
+                    f"UPDATE ejecuciones SET {', '.join(f'{col} = ?' for col in COLUMNAS_CONTENIDO)}, "
+                    "hash_entrada = ? WHERE id = ?",
+                    actualizaciones
+                )
+                ultimo_id = filas[-1][0]
+                migrados += len(filas)
+
+            conexion.execute("CREATE INDEX IF NOT EXISTS idx_ejecuciones_entrada ON ejecuciones (hash_entrada)")
+            conexion.execute(f"PRAGMA user_version = {VERSION_ESQUEMA}")
+        conexion.execute("COMMIT")
+    except Exception:
+        conexion.execute("ROLLBACK")
+        raise
+
+    # Recuperar el espacio de los JSON que estaban repetidos en cada registro
+    if migrados:
+        conexion.execute("VACUUM")
+
+
+def migrar_csv(conexion: sqlite3.Connection, ruta_csv: str):
+    """
+    Importa una única vez los registros del antiguo historial CSV.
+
+    La migración se hace por bloques dentro de una transacción exclusiva y se
+    marca en la tabla `migraciones`, por lo que es segura aunque varias sesiones
+    abran la base al mismo tiempo.
+
+    Args:
+        conexion (sqlite3.Connection): Conexión a la base del historial.
+        ruta_csv (str): Ruta del CSV histórico.
+
+    Returns:
+        None
+    """
+
+    nombre = f"csv:{os.path.basename(ruta_csv)}"
+    if not os.path.exists(ruta_csv):
+        return
+    if conexion.execute("SELECT 1 FROM migraciones WHERE nombre = ?", (nombre,)).fetchone():
+        return
+
+    conexion.execute("BEGIN IMMEDIATE")
+    try:
+        if conexion.execute("SELECT 1 FROM migraciones WHERE nombre = ?", (nombre,)).fetchone() is None:
+            for bloque in pd.read_csv(ruta_csv, chunksize=10_000, dtype=str, keep_default_na=False):
+                bloque = bloque.reindex(columns=COLUMNAS, fill_value="")
+                bloque["valor_objetivo"] = pd.to_numeric(bloque["valor_objetivo"], errors="coerce")
+                _insertar(conexion, bloque.to_dict("records"))
+            conexion.execute(
+                "INSERT INTO migraciones (nombre, fecha) VALUES (?, ?)",
+                (nombre, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            )
+        conexion.execute("COMMIT")
+    except Exception:
+        conexion.execute("ROLLBACK")
+        raise
+
+
+def insertar_ejecucion(log: dict, ruta=RUTA_LOG) -> int:
+    """
+    Agrega un registro al historial.
+
+    Las entradas y la solución se guardan en el almacén de blobs (una sola vez
+    por contenido) y el registro solo guarda sus hashes.
+
+    Args:
+        log (dict): Registro con las claves de `COLUMNAS`.
+        ruta (str): Ruta del historial.
+
+    Returns:
+        int: Identificador del registro insertado.
+    """
+
+    conexion = conectar(ruta)
+    try:
+        with conexion:
+            return _insertar(conexion, [log])
+    finally:
+        conexion.close()
+
+
+def actualizar_mediciones(id_ejecucion, mediciones: str, ruta=RUTA_LOG):
+    """
+    Reemplaza las mediciones de un registro ya insertado.
+
+    Permite guardar la duración de la propia inserción, que solo se conoce
+    después de agregar el registro.
+
+    Args:
+        id_ejecucion (int): Identificador del registro.
+        mediciones (str): Mediciones como JSON (ver `Medicion.a_dict`).
+        ruta (str): Ruta del historial.
+    """
+
+    conexion = conectar(ruta)
+    try:
+        with conexion:
+            conexion.execute(
+                "UPDATE ejecuciones SET mediciones = ? WHERE id = ?",
+                (mediciones or None, int(id_ejecucion))
+            )
+    finally:
+        conexion.close()
+
+
+def _expandir_contenidos(conexion: sqlite3.Connection, df: pd.DataFrame) -> pd.DataFrame:
+    """Reemplaza los hashes de las columnas de contenido por el texto original."""
+
+    columnas = [col for col in COLUMNAS_CONTENIDO if col in df.columns]
+    contenidos = leer_blobs(conexion, pd.unique(df[columnas].to_numpy().ravel()))
+    for col in columnas:
+        df[col] = df[col].map(contenidos).fillna("")
+    return df
+
+
+def leer_ejecuciones(ruta=RUTA_LOG) -> pd.DataFrame:
+    """
+    Lee el historial completo como DataFrame, con las entradas y soluciones en JSON.
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        pd.DataFrame: Registros con las columnas de `COLUMNAS` (más `id` y `hash_entrada`).
+    """
+
+    conexion = conectar(ruta)
+    try:
+        df = pd.read_sql_query(
+            f"SELECT id, {', '.join(COLUMNAS)}, hash_entrada FROM ejecuciones ORDER BY id",
+            conexion
+        )
+        return _expandir_contenidos(conexion, df)
+    finally:
+        conexion.close()
+
+
+def _filtros_sql(tipo=None, desde=None, hasta=None):
+    """
+    Arma la cláusula WHERE para filtrar por tipo y rango de fechas (inclusive).
+
+    Los timestamps se guardan como 'YYYY-MM-DD HH:MM:SS', por lo que el rango se
+    resuelve con comparaciones de texto sobre el índice de `timestamp`.
+
+    Returns:
+        tuple: (cláusula_where, parámetros)
+    """
+
+    condiciones, parametros = [], []
+    if tipo:
+        condiciones.append("tipo = ?")
+        parametros.append(tipo)
+    if desde:
+        condiciones.append("timestamp >= ?")
+        parametros.append(str(desde))
+    if hasta:
+        condiciones.append("timestamp < ?")
+        parametros.append((pd.Timestamp(hasta) + pd.Timedelta(days=1)).strftime("%Y-%m-%d"))
+    where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ""
+    return where, parametros
+
+
+def consultar_ejecuciones(ruta=RUTA_LOG, tipo=None, desde=None, hasta=None,
+                          limite=50, desplazamiento=0) -> pd.DataFrame:
+    """
+    Devuelve una página del historial, de la ejecución más reciente a la más antigua.
+
+    Solo lee las columnas de resumen; las entradas y la solución (JSON) se
+    cargan bajo demanda con `obtener_ejecucion`.
+
+    Args:
+        ruta (str): Ruta del historial.
+        tipo (str, optional): Tipo de problema a filtrar.
+        desde (date | str, optional): Fecha inicial (inclusive).
+        hasta (date | str, optional): Fecha final (inclusive).
+        limite (int): Cantidad de registros por página.
+        desplazamiento (int): Registros a saltar (página × límite).
+
+    Returns:
+        pd.DataFrame: Registros con las columnas de `COLUMNAS_RESUMEN`.
+    """
+
+    where, parametros = _filtros_sql(tipo, desde, hasta)
+    conexion = conectar(ruta)
+    try:
+        return pd.read_sql_query(
+            f"SELECT {', '.join(COLUMNAS_RESUMEN)} FROM ejecuciones {where} "
+            "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+            conexion,
+            params=parametros + [int(limite), int(desplazamiento)]
+        )
+    finally:
+        conexion.close()
+
+
+def contar_ejecuciones(ruta=RUTA_LOG, tipo=None, desde=None, hasta=None) -> int:
+    """
+    Cuenta los registros que cumplen los filtros.
+
+    Args:
+        ruta (str): Ruta del historial.
+        tipo (str, optional): Tipo de problema a filtrar.
+        desde (date | str, optional): Fecha inicial (inclusive).
+        hasta (date | str, optional): Fecha final (inclusive).
+
+    Returns:
+        int
+    """
+
+    where, parametros = _filtros_sql(tipo, desde, hasta)
+    conexion = conectar(ruta)
+    try:
+        return conexion.execute(f"SELECT COUNT(*) FROM ejecuciones {where}", parametros).fetchone()[0]
+    finally:
+        conexion.close()
+
+
+def tipos_registrados(ruta=RUTA_LOG) -> list:
+    """
+    Lista los tipos de problema presentes en el historial (usando el índice de `tipo`).
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        list
+    """
+
+    conexion = conectar(ruta)
+    try:
+        return [fila[0] for fila in conexion.execute("SELECT tipo FROM ejecuciones GROUP BY tipo")]
+    finally:
+        conexion.close()
+
+
+def obtener_ejecucion(id_ejecucion, ruta=RUTA_LOG) -> dict:
+    """
+    Carga un registro completo, incluidas las entradas y la solución.
+
+    Args:
+        id_ejecucion (int): Identificador del registro.
+        ruta (str): Ruta del historial.
+
+    Returns:
+        dict | None: Registro con todas sus columnas, o None si no existe.
+    """
+
+    conexion = conectar(ruta)
+    try:
+        df = pd.read_sql_query(
+            f"SELECT id, {', '.join(COLUMNAS)}, hash_entrada FROM ejecuciones WHERE id = ?",
+            conexion,
+            params=(int(id_ejecucion),)
+        )
+        if df.empty:
+            return None
+        return _expandir_contenidos(conexion, df).iloc[0].to_dict()
+    finally:
+        conexion.close()
+
+
+def ejecuciones_misma_entrada(id_ejecucion, ruta=RUTA_LOG, limite=20) -> pd.DataFrame:
+    """
+    Busca otras ejecuciones que recibieron exactamente la misma entrada.
+
+    Args:
+        id_ejecucion (int): Identificador del registro de referencia.
+        ruta (str): Ruta del historial.
+        limite (int): Cantidad máxima de registros a devolver.
+
+    Returns:
+        pd.DataFrame: Registros con las columnas de `COLUMNAS_RESUMEN`, del más reciente al más antiguo.
+    """
+
+    conexion = conectar(ruta)
+    try:
+        return pd.read_sql_query(
+            f"SELECT {', '.join('e.' + col for col in COLUMNAS_RESUMEN)} FROM ejecuciones e "
+            "JOIN ejecuciones ref ON ref.id = ? AND e.hash_entrada = ref.hash_entrada "
+            "WHERE e.id != ref.id ORDER BY e.timestamp DESC, e.id DESC LIMIT ?",
+            conexion,
+            params=(int(id_ejecucion), int(limite))
+        )
+    finally:
+        conexion.close()
+
+
+def estadisticas_almacenamiento(ruta=RUTA_LOG) -> dict:
+    """
+    Resume cuánto ocupan los contenidos guardados frente a su tamaño sin deduplicar.
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        dict: 'blobs', 'bytes_guardados' (comprimidos), 'bytes_originales' (una copia
+        por contenido) y 'bytes_referenciados' (lo que ocuparían guardados en cada registro).
+    """
+
+    conexion = conectar(ruta)
+    try:
+        blobs, guardados, originales = conexion.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(datos)), 0), COALESCE(SUM(tamano), 0) FROM blobs"
+        ).fetchone()
+        referenciados = sum(
+            conexion.execute(
+                f"SELECT COALESCE(SUM(b.tamano), 0) FROM ejecuciones e JOIN blobs b ON b.hash = e.{col}"
+            ).fetchone()[0]
+            for col in COLUMNAS_CONTENIDO
+        )
+        return {
+            "blobs": blobs,
+            "bytes_guardados": guardados,
+            "bytes_originales": originales,
+            "bytes_referenciados": referenciados,
+        }
+    finally:
+        conexion.close()
+
+
+def existe_historial(ruta=RUTA_LOG) -> bool:
+    """
+    Indica si hay un historial guardado (base SQLite o CSV pendiente de migrar).
+
+    Args:
+        ruta (str): Ruta del historial.
+
+    Returns:
+        bool
+    """
+
+    return any(os.path.exists(r) for r in rutas_log(ruta))
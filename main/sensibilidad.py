@@ -0,0 +1,212 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+from main.solvers import FormaMatricial
+
+# Tolerancia (relativa) para decidir si un valor está en su cota
+TOLERANCIA = 1e-7
+
+# Filas máximas para calcular rangos: cada fila o variable básica requiere resolver con la base
+LIMITE_RANGOS = 5000
+
+# Columnas que se resuelven juntas con la factorización de la base
+TAMANO_BLOQUE = 256
+
+
+def _en_cotas(valores, inf, sup):
+    """Máscaras de valores en su cota inferior y en su cota superior."""
+    escala = TOLERANCIA * np.maximum(1.0, np.abs(valores))
+    with np.errstate(invalid="ignore"):
+        return np.abs(valores - inf) <= escala, np.abs(valores - sup) <= escala
+
+
+def _base(en_inf, en_sup, guia, n):
+    """
+    Elige las columnas básicas de [A, -I] a partir de la solución.
+
+    Son básicas las variables y filas estrictamente entre sus cotas. Si la
+    solución es degenerada se completa con columnas en su cota cuyo dual es
+    nulo (primero filas, luego variables) y, después, con las de dual
+    desconocido (NaN).
+
+    Returns:
+        np.ndarray | None: Índices de las columnas básicas, o None si no se puede formar la base.
+    """
+
+    m = len(en_inf) - n
+    basicas = np.flatnonzero(~(en_inf | en_sup))
+    faltan = m - len(basicas)
+    if faltan < 0:
+        return None
+    if faltan == 0:
+        return basicas
+
+    en_cota = np.flatnonzero(en_inf | en_sup)
+    dual = np.abs(guia[en_cota])
+    es_variable = en_cota < n
+    prioridad = np.where(dual <= TOLERANCIA, 0, np.where(np.isnan(dual), 2, 4)) + es_variable
+    orden = np.argsort(prioridad, kind="stable")
+    candidatas = en_cota[orden][prioridad[orden] < 4]
+    if len(candidatas) < faltan:
+        return None
+    return np.sort(np.concatenate([basicas, candidatas[:faltan]]))
+
+
+def _rango_razones(valores, inf, sup, direccion):
+    """
+    Paso máximo hacia abajo y hacia arriba de `valores + δ·direccion` sin salir de [inf, sup].
+
+    Trabaja por columnas: `direccion` es (filas × columnas) y el resultado, un par de vectores.
+    """
+
+    valores, inf, sup = valores[:, None], inf[:, None], sup[:, None]
+    positiva, negativa = direccion > TOLERANCIA, direccion < -TOLERANCIA
+    with np.errstate(divide="ignore", invalid="ignore"):
+        hasta_sup = (sup - valores) / direccion
+        hasta_inf = (inf - valores) / direccion
+    subir = np.where(positiva, hasta_sup, np.where(negativa, hasta_inf, np.inf))
+    bajar = np.where(positiva, hasta_inf, np.where(negativa, hasta_sup, -np.inf))
+    return np.nanmax(bajar, axis=0, initial=-np.inf), np.nanmin(subir, axis=0, initial=np.inf)
+
+
+def analizar_sensibilidad(forma: FormaMatricial, x, precios=None, costos_reducidos=None,
+                          limite_rangos=LIMITE_RANGOS) -> dict:
+    """
+    Calcula precios sombra, holguras, costos reducidos y rangos de la FO y del RHS.
+
+    La base óptima se deduce de la solución (ver `_base`); los duales del solver,
+    si se indican, solo deciden qué columnas completan la base en soluciones
+    degeneradas. Precios sombra y costos reducidos salen de un único sistema
+    `Bᵀ·y = c_B`, y los rangos se calculan por bloques de columnas con la
+    factorización LU de la base. Si la base no se puede formar, se informan los
+    duales del solver y los rangos quedan en NaN.
+
+    Args:
+        forma (FormaMatricial): Modelo resuelto.
+        x (np.ndarray): Solución óptima, en el orden de `forma.nombres_variables`.
+        precios (np.ndarray, optional): Duales de las filas según el solver (NaN si se desconocen).
+        costos_reducidos (np.ndarray, optional): Costos reducidos según el solver.
+        limite_rangos (int): Los rangos se calculan solo si el modelo tiene a lo sumo estas filas.
+
+    Returns:
+        dict: DataFrames 'variables' (Variable, Valor, Costo reducido, Coef FO, FO mínimo,
+        FO máximo) y 'restricciones' (Restriccion, Actividad, Holgura, Precio sombra, RHS,
+        RHS mínimo, RHS máximo).
+    """
+
+    A = forma.A.tocsr()
+    m, n = A.shape
+    x = np.asarray(x, dtype=float)
+    signo = -1.0 if forma.maximizar else 1.0
+
+    actividad = A @ x
+    holgura = np.minimum(forma.fila_sup - actividad, actividad - forma.fila_inf)
+    rhs = np.where(np.isfinite(forma.fila_sup), forma.fila_sup, forma.fila_inf)
+
+    # Columnas de [A, -I]: variables y luego una variable lógica por fila (su actividad)
+    z = np.concatenate([x, actividad])
+    inf = np.concatenate([forma.var_inf, forma.fila_inf])
+    sup = np.concatenate([forma.var_sup, forma.fila_sup])
+    en_inf, en_sup = _en_cotas(z, inf, sup)
+    rhs = np.where(en_inf[n:] & ~en_sup[n:], forma.fila_inf, rhs)
+
+    guia = np.concatenate([
+        np.full(n, np.nan) if costos_reducidos is None else np.asarray(costos_reducidos, dtype=float),
+        np.full(m, np.nan) if precios is None else np.asarray(precios, dtype=float),
+    ])
+    precio = guia[n:].copy()
+    reducido = guia[:n].copy()
+    fo_min, fo_max = np.full(n, np.nan), np.full(n, np.nan)
+    rhs_min, rhs_max = np.full(m, np.nan), np.full(m, np.nan)
+
+    basicas = _base(en_inf, en_sup, guia, n)
+    lu = None
+    if basicas is not None:
+        M = sparse.hstack([A, -sparse.identity(m, format="csr")], format="csc")
+        try:
+            lu = splu(M[:, basicas].tocsc())
+        except RuntimeError:
+            lu = None
+
+    if lu is not None:
+        # Duales en forma de minimización: Bᵀ·y = c_B y d = c - Mᵀ·y
+        costo = np.concatenate([signo * forma.c, np.zeros(m)])
+        y = lu.solve(costo[basicas], trans="T")
+        d = costo - M.T @ y
+        d[basicas] = 0.0
+        precio, reducido = signo * y, signo * d[:n]
+
+        es_basica = np.zeros(n + m, dtype=bool)
+        es_basica[basicas] = True
+
+        # Filas no activas: el RHS puede moverse hasta la actividad sin cambiar la base
+        holgadas = np.flatnonzero(es_basica[n:])
+        por_sup = rhs[holgadas] == forma.fila_sup[holgadas]
+        rhs_min[holgadas] = np.where(por_sup, actividad[holgadas], -np.inf)
+        rhs_max[holgadas] = np.where(por_sup, np.inf, actividad[holgadas])
+
+        # Variables no básicas: el costo puede empeorar sin límite y mejorar hasta su costo reducido
+        no_basicas = np.flatnonzero(~es_basica[:n])
+        costo_min = costo[no_basicas] - d[no_basicas]
+        abajo = np.where(en_inf[no_basicas] & ~en_sup[no_basicas], costo_min, -np.inf)
+        arriba = np.where(en_sup[no_basicas] & ~en_inf[no_basicas], costo_min, np.inf)
+        fo_min[no_basicas], fo_max[no_basicas] = abajo, arriba
+
+        if m <= limite_rangos:
+            z_b, inf_b, sup_b = z[basicas], inf[basicas], sup[basicas]
+
+            # RHS de filas activas: z_B + δ·B⁻¹·e_i debe seguir dentro de sus cotas
+            activas = np.flatnonzero(~es_basica[n:])
+            for inicio in range(0, len(activas), TAMANO_BLOQUE):
+                filas = activas[inicio:inicio + TAMANO_BLOQUE]
+                E = np.zeros((m, len(filas)))
+                E[filas, np.arange(len(filas))] = 1.0
+                bajar, subir = _rango_razones(z_b, inf_b, sup_b, lu.solve(E))
+                rhs_min[filas], rhs_max[filas] = rhs[filas] + bajar, rhs[filas] + subir
+
+            # Costo de variables básicas: d_N - δ·α_N debe conservar el signo de los costos reducidos
+            no_basicas_z = np.flatnonzero(~es_basica)
+            N = M[:, no_basicas_z]
+            d_n = d[no_basicas_z]
+            solo_inf = en_inf[no_basicas_z] & ~en_sup[no_basicas_z]
+            solo_sup = en_sup[no_basicas_z] & ~en_inf[no_basicas_z]
+            posiciones = np.flatnonzero(basicas < n)
+            for inicio in range(0, len(posiciones), TAMANO_BLOQUE):
+                bloque = posiciones[inicio:inicio + TAMANO_BLOQUE]
+                E = np.zeros((m, len(bloque)))
+                E[bloque, np.arange(len(bloque))] = 1.0
+                alfa = np.asarray(N.T @ lu.solve(E, trans="T"))
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    razon = d_n[:, None] / alfa
+                positiva, negativa = alfa > TOLERANCIA, alfa < -TOLERANCIA
+                tope = (solo_inf[:, None] & positiva) | (solo_sup[:, None] & negativa)
+                piso = (solo_inf[:, None] & negativa) | (solo_sup[:, None] & positiva)
+                subir = np.where(tope, razon, np.inf).min(axis=0, initial=np.inf)
+                bajar = np.where(piso, razon, -np.inf).max(axis=0, initial=-np.inf)
+                columnas = basicas[bloque]
+                fo_min[columnas], fo_max[columnas] = costo[columnas] + bajar, costo[columnas] + subir
+
+        # Rangos de la FO en el sentido original del modelo
+        if forma.maximizar:
+            fo_min, fo_max = -fo_max, -fo_min
+
+    variables = pd.DataFrame({
+        "Variable": forma.nombres_variables,
+        "Valor": x,
+        "Costo reducido": reducido,
+        "Coef FO": forma.c,
+        "FO mínimo": fo_min,
+        "FO máximo": fo_max,
+    })
+    restricciones = pd.DataFrame({
+        "Restriccion": forma.nombres_restricciones,
+        "Actividad": actividad,
+        "Holgura": holgura,
+        "Precio sombra": precio,
+        "RHS": rhs,
+        "RHS mínimo": rhs_min,
+        "RHS máximo": rhs_max,
+    })
+    return {"variables": variables, "restricciones": restricciones}
@@ -0,0 +1,673 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pulp
+from dataclasses import dataclass
+from scipy import sparse
+from scipy.optimize import linprog
+
+# Estados de scipy.optimize.linprog traducidos a los nombres de pulp.LpStatus
+ESTADOS_HIGHS = {
+    0: "Optimal",
+    1: "Not Solved",
+    2: "Infeasible",
+    3: "Unbounded",
+    4: "Undefined",
+}
+
+# Líneas del resumen final de CBC con el valor de la mejor solución y la mejor cota
+_VALOR_CBC = re.compile(r"^Objective value:\s+(\S+)", re.MULTILINE)
+_COTA_CBC = re.compile(r"^(?:Upper|Lower) bound:\s+(\S+)", re.MULTILINE)
+
+# Bytes finales del log de CBC en los que se busca el resumen
+FINAL_REGISTRO = 64 * 1024
+
+
+@dataclass
+class FormaMatricial:
+    """
+    Representación matricial y dispersa de un modelo lineal.
+
+    Cada restricción se expresa como un intervalo `fila_inf <= A·x <= fila_sup`
+    (con ±inf para los lados abiertos) y cada variable como
+    `var_inf <= x <= var_sup`, que es la forma que consumen los solvers en memoria.
+    Las variables marcadas en `enteras` solo toman valores enteros (las binarias
+    son enteras con cotas [0, 1]).
+
+    Attributes:
+        nombres_variables (list): Nombres de las variables, en el orden de las columnas de A.
+        nombres_restricciones (list): Nombres de las restricciones, en el orden de las filas de A.
+        c (np.ndarray): Coeficientes de la función objetivo.
+        A (scipy.sparse.csr_matrix): Matriz de restricciones (restricciones × variables).
+        fila_inf (np.ndarray): Cota inferior de cada restricción.
+        fila_sup (np.ndarray): Cota superior de cada restricción.
+        var_inf (np.ndarray): Cota inferior de cada variable.
+        var_sup (np.ndarray): Cota superior de cada variable.
+        maximizar (bool): True si el modelo maximiza la función objetivo.
+        constante (float): Término constante de la función objetivo.
+        enteras (np.ndarray): Indica, por variable, si es entera.
+    """
+
+    nombres_variables: list
+    nombres_restricciones: list
+    c: np.ndarray
+    A: sparse.csr_matrix
+    fila_inf: np.ndarray
+    fila_sup: np.ndarray
+    var_inf: np.ndarray = None
+    var_sup: np.ndarray = None
+    maximizar: bool = False
+    constante: float = 0.0
+    enteras: np.ndarray = None
+
+    def __post_init__(self):
+        n = len(self.nombres_variables)
+        if self.var_inf is None:
+            self.var_inf = np.zeros(n)
+        if self.var_sup is None:
+            self.var_sup = np.full(n, np.inf)
+        if self.enteras is None:
+            self.enteras = np.zeros(n, dtype=bool)
+
+    @property
+    def mixta(self) -> bool:
+        """Indica si el modelo tiene variables enteras (se resuelve como MIP)."""
+        return bool(self.enteras.any())
+
+
+def variable_pulp(nombre, inf=0.0, sup=np.inf, entera=False) -> pulp.LpVariable:
+    """
+    Crea una variable de PuLP con cotas (±inf para los lados abiertos) y tipo.
+
+    Args:
+        nombre (str): Nombre de la variable.
+        inf (float): Cota inferior.
+        sup (float): Cota superior.
+        entera (bool): Si la variable solo toma valores enteros.
+
+    Returns:
+        pulp.LpVariable: Variable lista para usar en un modelo.
+    """
+
+    return pulp.LpVariable(
+        nombre,
+        lowBound=None if np.isinf(inf) else float(inf),
+        upBound=None if np.isinf(sup) else float(sup),
+        cat=pulp.LpInteger if entera else pulp.LpContinuous
+    )
+
+
+def gap_relativo(valor, cota):
+    """
+    Brecha relativa entre la mejor solución y la mejor cota, |valor - cota| / |valor|.
+
+    Returns:
+        float | None: La brecha, o None si falta alguno de los dos valores.
+    """
+
+    if valor is None or cota is None or not np.isfinite(valor) or not np.isfinite(cota):
+        return None
+    return abs(valor - cota) / max(abs(valor), 1e-10)
+
+
+def gap_registro_cbc(ruta) -> float:
+    """
+    Lee la brecha de optimalidad del resumen final de un log de CBC.
+
+    CBC informa la cota solo si se detuvo antes de probar la optimalidad (por
+    límite de tiempo o por alcanzar el gap pedido); si no la informa y encontró
+    la solución óptima, la brecha es 0.
+
+    Args:
+        ruta (str): Archivo con el log de CBC.
+
+    Returns:
+        float | None: La brecha relativa, o None si CBC no encontró ninguna solución.
+    """
+
+    try:
+        with open(ruta, "rb") as f:
+            f.seek(max(0, os.path.getsize(ruta) - FINAL_REGISTRO))
+            texto = f.read().decode("utf-8", errors="replace")
+    except OSError:
+        return None
+
+    valor, cota = _VALOR_CBC.search(texto), _COTA_CBC.search(texto)
+    if valor is None:
+        return None
+    if cota is None:
+        return 0.0 if "Optimal solution found" in texto else None
+    return gap_relativo(float(valor.group(1)), float(cota.group(1)))
+
+
+def cotas_por_tipo(tipos, rhs):
+    """
+    Convierte operadores ('<=', '>=', '=') y RHS en cotas inferior/superior por fila.
+
+    Args:
+        tipos (array-like): Operador de cada restricción.
+        rhs (array-like): Lado derecho de cada restricción.
+
+    Returns:
+        tuple: (fila_inf, fila_sup) como np.ndarray.
+    """
+
+    tipos = np.asarray(tipos)
+    rhs = np.asarray(rhs, dtype=float)
+    fila_inf = np.where(np.isin(tipos, (">=", "=")), rhs, -np.inf)
+    fila_sup = np.where(np.isin(tipos, ("<=", "=")), rhs, np.inf)
+    return fila_inf, fila_sup
+
+
+def forma_desde_pulp(modelo: pulp.LpProblem) -> FormaMatricial:
+    """
+    Extrae la forma matricial de cualquier modelo construido con PuLP.
+
+    Args:
+        modelo (pulp.LpProblem): Modelo ya construido.
+
+    Returns:
+        FormaMatricial: Datos del modelo listos para un solver en memoria.
+    """
+
+    variables = modelo.variables()
+    indice = {v.name: j for j, v in enumerate(variables)}
+
+    c = np.zeros(len(variables))
+    constante = 0.0
+    if modelo.objective is not None:
+        for v, coef in modelo.objective.items():
+            c[indice[v.name]] = coef
+        constante = modelo.objective.constant
+
+    filas, columnas, valores = [], [], []
+    fila_inf, fila_sup = [], []
+    for i, restriccion in enumerate(modelo.constraints.values()):
+        for v, coef in restriccion.items():
+            filas.append(i)
+            columnas.append(indice[v.name])
+            valores.append(coef)
+        rhs = -restriccion.constant
+        fila_inf.append(rhs if restriccion.sense != pulp.LpConstraintLE else -np.inf)
+        fila_sup.append(rhs if restriccion.sense != pulp.LpConstraintGE else np.inf)
+
+    A = sparse.csr_matrix(
+        (valores, (filas, columnas)),
+        shape=(len(modelo.constraints), len(variables))
+    )
+
+    return FormaMatricial(
+        nombres_variables=[v.name for v in variables],
+        nombres_restricciones=list(modelo.constraints),
+        c=c,
+        A=A,
+        fila_inf=np.array(fila_inf, dtype=float),
+        fila_sup=np.array(fila_sup, dtype=float),
+        var_inf=np.array([-np.inf if v.lowBound is None else v.lowBound for v in variables], dtype=float),
+        var_sup=np.array([np.inf if v.upBound is None else v.upBound for v in variables], dtype=float),
+        maximizar=modelo.sense == pulp.LpMaximize,
+        constante=constante,
+        enteras=np.array([v.cat == pulp.LpInteger for v in variables], dtype=bool),
+    )
+
+
+def _resolver_sin_variables(forma: FormaMatricial, duales=False) -> dict:
+    """
+    Resuelve un modelo sin columnas (por ejemplo, con todos los coeficientes en cero).
+
+    `linprog` no admite un vector de costos vacío: cada fila vale 0, por lo que
+    el modelo es óptimo (con valor igual a la constante de la FO) si todas las
+    filas admiten el 0 e infactible en otro caso.
+    """
+
+    factible = bool(np.all((forma.fila_inf <= 0) & (forma.fila_sup >= 0)))
+    resultado = {
+        "solucion": {},
+        "valor_objetivo": float(forma.constante) if factible else None,
+        "status": "Optimal" if factible else "Infeasible",
+    }
+    if forma.mixta:
+        resultado["gap"] = 0.0 if factible else None
+    elif duales and factible:
+        resultado["duales"] = {
+            "precios": np.zeros(len(forma.nombres_restricciones)),
+            "costos_reducidos": np.zeros(0),
+        }
+    return resultado
+
+
+def resolver_highs(forma: FormaMatricial, duales=False, **opciones) -> dict:
+    """
+    Resuelve una forma matricial en el propio proceso con HiGHS (scipy.optimize.linprog).
+
+    No lanza subprocesos ni escribe archivos temporales. Las filas con cota
+    inferior se pasan como `-A·x <= -fila_inf` y las de igualdad como `A_eq`.
+    Si el modelo tiene variables enteras se resuelve como MIP (branch and
+    bound de HiGHS) y no hay duales.
+
+    Args:
+        forma (FormaMatricial): Modelo a resolver.
+        duales (bool): Si es True, agrega 'duales' con los precios de las filas y
+            los costos reducidos (ver `duales_pulp`).
+        **opciones: Opciones adicionales para `linprog` (por ejemplo `time_limit`
+            o `mip_rel_gap`).
+
+    Returns:
+        dict: Contiene 'status', 'valor_objetivo' y 'solucion' (diccionario de variables),
+        con los mismos nombres de estado que PuLP, más 'gap' (brecha relativa de la
+        solución entera) si el modelo es MIP.
+    """
+
+    if not len(forma.nombres_variables):
+        return _resolver_sin_variables(forma, duales)
+
+    igualdad = forma.fila_inf == forma.fila_sup
+    con_sup = ~igualdad & np.isfinite(forma.fila_sup)
+    con_inf = ~igualdad & np.isfinite(forma.fila_inf)
+
+    A_ub = sparse.vstack([forma.A[con_sup], -forma.A[con_inf]], format="csr")
+    b_ub = np.concatenate([forma.fila_sup[con_sup], -forma.fila_inf[con_inf]])
+
+    signo = -1.0 if forma.maximizar else 1.0
+    res = linprog(
+        signo * forma.c,
+        A_ub=A_ub if A_ub.shape[0] else None,
+        b_ub=b_ub if A_ub.shape[0] else None,
+        A_eq=forma.A[igualdad] if igualdad.any() else None,
+        b_eq=forma.fila_inf[igualdad] if igualdad.any() else None,
+        bounds=np.column_stack([forma.var_inf, forma.var_sup]),
+        method="highs",
+        integrality=forma.enteras.astype(int) if forma.mixta else None,
+        options=opciones or None,
+    )
+
+    if res.x is not None:
+        solucion = dict(zip(forma.nombres_variables, res.x.tolist()))
+        valor_objetivo = float(forma.c @ res.x) + forma.constante
+    else:
+        solucion = dict.fromkeys(forma.nombres_variables)
+        valor_objetivo = None
+
+    resultado = {
+        "solucion": solucion,
+        "valor_objetivo": valor_objetivo,
+        "status": ESTADOS_HIGHS.get(res.status, "Undefined")
+    }
+    if forma.mixta:
+        gap = getattr(res, "mip_gap", None)
+        resultado["gap"] = float(gap) if res.x is not None and gap is not None and np.isfinite(gap) else None
+        return resultado
+
+    if duales and res.x is not None:
+        # Las marginales de linprog son de la minimización de signo·c; se llevan al sentido original
+        k = int(con_sup.sum())
+        desigualdad = res.ineqlin.marginals if A_ub.shape[0] else np.zeros(0)
+        precios = np.zeros(len(forma.nombres_restricciones))
+        precios[con_sup] += signo * desigualdad[:k]
+        precios[con_inf] -= signo * desigualdad[k:]
+        if igualdad.any():
+            precios[igualdad] = signo * res.eqlin.marginals
+        resultado["duales"] = {
+            "precios": precios,
+            "costos_reducidos": signo * (res.lower.marginals + res.upper.marginals),
+        }
+    return resultado
+
+
+def duales_pulp(modelo: pulp.LpProblem, forma: FormaMatricial) -> dict:
+    """
+    Lee los precios sombra y costos reducidos de un modelo de PuLP ya resuelto.
+
+    Se alinean por nombre con las filas y variables de `forma` (el modelo debe
+    provenir de ella); las filas con rango (`_inf`/`_sup`) suman ambos precios y
+    lo que no está en el modelo queda en NaN.
+
+    Returns:
+        dict: 'precios' (por fila) y 'costos_reducidos' (por variable) como np.ndarray.
+    """
+
+    pi = pd.Series({nombre: r.pi for nombre, r in modelo.constraints.items()}, dtype=float)
+    dj = pd.Series({v.name: v.dj for v in modelo.variables()}, dtype=float)
+
+    nombres = pd.Index(forma.nombres_restricciones).astype(str)
+    precios = pi.reindex(nombres).to_numpy()
+    rango = pi.reindex(nombres + "_inf").to_numpy() + pi.reindex(nombres + "_sup").to_numpy()
+    precios = np.where(np.isnan(precios), rango, precios)
+
+    return {
+        "precios": precios,
+        "costos_reducidos": dj.reindex(forma.nombres_variables).to_numpy(),
+    }
+
+
+def _base_inicial_vogel(costos, oferta, demanda):
+    """
+    Calcula una solución básica factible inicial con el método de aproximación de Vogel.
+
+    Cada asignación elimina exactamente una fila o columna (la última elimina
+    ambas), de modo que la base resultante tiene m + n - 1 celdas y forma un árbol.
+
+    Returns:
+        tuple: (flujos, celdas_basicas) con la matriz de envíos y la lista de celdas (i, j).
+    """
+
+    m, n = costos.shape
+    oferta = oferta.astype(float).copy()
+    demanda = demanda.astype(float).copy()
+    flujos = np.zeros((m, n))
+    filas_activas = np.ones(m, dtype=bool)
+    columnas_activas = np.ones(n, dtype=bool)
+    basicas = []
+
+    while True:
+        sub = costos[np.ix_(filas_activas, columnas_activas)]
+        idx_filas = np.flatnonzero(filas_activas)
+        idx_columnas = np.flatnonzero(columnas_activas)
+
+        # Penalización: diferencia entre los dos menores costos de cada línea
+        if sub.shape[1] > 1:
+            dos_menores = np.partition(sub, 1, axis=1)[:, :2]
+            pen_filas = dos_menores[:, 1] - dos_menores[:, 0]
+        else:
+            pen_filas = sub[:, 0].copy()
+        if sub.shape[0] > 1:
+            dos_menores = np.partition(sub, 1, axis=0)[:2, :]
+            pen_columnas = dos_menores[1, :] - dos_menores[0, :]
+        else:
+            pen_columnas = sub[0, :].copy()
+
+        if pen_filas.max() >= pen_columnas.max():
+            fila = int(np.argmax(pen_filas))
+            columna = int(np.argmin(sub[fila]))
+        else:
+            columna = int(np.argmax(pen_columnas))
+            fila = int(np.argmin(sub[:, columna]))
+        i, j = idx_filas[fila], idx_columnas[columna]
+
+        cantidad = min(oferta[i], demanda[j])
+        flujos[i, j] = cantidad
+        oferta[i] -= cantidad
+        demanda[j] -= cantidad
+        basicas.append((i, j))
+
+        if len(idx_filas) == 1 and len(idx_columnas) == 1:
+            break
+        if len(idx_columnas) == 1 or (oferta[i] <= demanda[j] and len(idx_filas) > 1):
+            filas_activas[i] = False
+        else:
+            columnas_activas[j] = False
+
+    return flujos, basicas
+
+
+def _recorrer_arbol(basicas, m, n, raiz):
+    """
+    Recorre en anchura el árbol de la base (nodos 0..m-1 filas, m..m+n-1 columnas).
+
+    Returns:
+        tuple: (orden, padre, profundidad) con el orden de visita, el nodo padre
+        y la profundidad de cada nodo.
+    """
+
+    adyacencia = [[] for _ in range(m + n)]
+    for i, j in basicas:
+        adyacencia[i].append(m + j)
+        adyacencia[m + j].append(i)
+
+    padre = [-1] * (m + n)
+    profundidad = [0] * (m + n)
+    padre[raiz] = raiz
+    orden = [raiz]
+    for nodo in orden:
+        for vecino in adyacencia[nodo]:
+            if padre[vecino] == -1:
+                padre[vecino] = nodo
+                profundidad[vecino] = profundidad[nodo] + 1
+                orden.append(vecino)
+    return orden, padre, profundidad
+
+
+def resolver_transporte_modi(costos, oferta, demanda, max_iteraciones=None):
+    """
+    Resuelve un problema de transporte con el método simplex de transporte (Vogel + MODI).
+
+    Explota la estructura bipartita: la base es un árbol de m + n - 1 celdas, los
+    potenciales u/v se calculan recorriéndolo y cada pivote mueve flujo a lo largo
+    del único ciclo que cierra la celda entrante. Los arcos inexistentes se marcan
+    con costo `np.inf` y se penalizan con una gran M; si la solución óptima usa
+    alguno, el problema es infactible.
+
+    Args:
+        costos (np.ndarray): Matriz de costos (orígenes × destinos), no negativos.
+        oferta (np.ndarray): Oferta de cada origen.
+        demanda (np.ndarray): Demanda de cada destino.
+        max_iteraciones (int, optional): Límite de pivotes MODI.
+
+    Returns:
+        tuple: (flujos, status) con la matriz de envíos óptima y el estado
+        ("Optimal", "Infeasible" o "Not Solved").
+    """
+
+    costos = np.asarray(costos, dtype=float)
+    oferta = np.asarray(oferta, dtype=float)
+    demanda = np.asarray(demanda, dtype=float)
+    m, n = costos.shape
+
+    if oferta.sum() < demanda.sum() - 1e-9 * max(1.0, demanda.sum()):
+        return np.zeros((m, n)), "Infeasible"
+
+    # Arcos prohibidos con una gran M y destino ficticio para el exceso de oferta
+    prohibidos = ~np.isfinite(costos)
+    costo_max = np.abs(costos[~prohibidos]).max(initial=0.0)
+    gran_m = (costo_max + 1.0) * (m + n + 1) * 10
+    costos = np.where(prohibidos, gran_m, costos)
+    exceso = oferta.sum() - demanda.sum()
+    costos = np.hstack([costos, np.zeros((m, 1))])
+    demanda = np.append(demanda, max(exceso, 0.0))
+    n_total = n + 1
+
+    flujos, basicas = _base_inicial_vogel(costos, oferta, demanda)
+    en_base = np.zeros((m, n_total), dtype=bool)
+    for i, j in basicas:
+        en_base[i, j] = True
+
+    tolerancia = 1e-9 * max(1.0, gran_m)
+    max_iteraciones = max_iteraciones or 50 * (m + n_total) + 1000
+    status = "Not Solved"
+
+    for _ in range(max_iteraciones):
+        # Potenciales: u_i + v_j = c_ij en las celdas básicas
+        orden, padre, profundidad = _recorrer_arbol(basicas, m, n_total, raiz=0)
+        u = np.zeros(m)
+        v = np.zeros(n_total)
+        for nodo in orden[1:]:
+            p = padre[nodo]
+            if nodo >= m:
+                v[nodo - m] = costos[p, nodo - m] - u[p]
+            else:
+                u[nodo] = costos[nodo, p - m] - v[p - m]
+
+        reducidos = costos - u[:, None] - v[None, :]
+        reducidos[en_base] = 0.0
+        entrada = np.unravel_index(np.argmin(reducidos), reducidos.shape)
+        if reducidos[entrada] >= -tolerancia:
+            status = "Optimal"
+            break
+
+        # Ciclo: camino en el árbol desde la columna entrante hasta la fila entrante
+        i_e, j_e = int(entrada[0]), int(entrada[1])
+        a, b = m + j_e, i_e
+        desde_columna, desde_fila = [a], [b]
+        while a != b:
+            if profundidad[a] >= profundidad[b]:
+                a = padre[a]
+                desde_columna.append(a)
+            else:
+                b = padre[b]
+                desde_fila.append(b)
+        camino = desde_columna + desde_fila[-2::-1]
+        ciclo = [
+            (p, q - m) if q >= m else (q, p - m)
+            for p, q in zip(camino[1:], camino[:-1])
+        ]
+
+        # Las celdas en posiciones pares del camino pierden flujo
+        salientes = ciclo[0::2]
+        cantidades = np.array([flujos[c] for c in salientes])
+        k = int(np.argmin(cantidades))
+        theta = cantidades[k]
+
+        flujos[i_e, j_e] += theta
+        for pos, celda in enumerate(ciclo):
+            flujos[celda] += -theta if pos % 2 == 0 else theta
+
+        salida = salientes[k]
+        flujos[salida] = 0.0
+        en_base[salida] = False
+        en_base[i_e, j_e] = True
+        basicas.remove(salida)
+        basicas.append((i_e, j_e))
+
+    flujos = flujos[:, :n]
+    if status == "Optimal" and (flujos[prohibidos] > tolerancia).any():
+        status = "Infeasible"
+    return flujos, status
+
+
+def modelo_desde_forma(forma: FormaMatricial, nombre="Modelo") -> pulp.LpProblem:
+    """
+    Construye un modelo de PuLP a partir de una forma matricial.
+
+    Es la operación inversa de `forma_desde_pulp`. Las restricciones con ambos
+    lados finitos y distintos se agregan como dos restricciones con los sufijos
+    `_inf` y `_sup`; las filas sin cotas finitas se omiten.
+
+    Args:
+        forma (FormaMatricial): Modelo en forma matricial.
+        nombre (str): Nombre del modelo de PuLP.
+
+    Returns:
+        pulp.LpProblem: Modelo listo para resolver con los solvers de PuLP.
+    """
+
+    modelo = pulp.LpProblem(nombre, pulp.LpMaximize if forma.maximizar else pulp.LpMinimize)
+
+    variables = np.empty(len(forma.nombres_variables), dtype=object)
+    variables[:] = [
+        variable_pulp(variable, inf, sup, entera)
+        for variable, inf, sup, entera in zip(forma.nombres_variables, forma.var_inf, forma.var_sup, forma.enteras)
+    ]
+
+    no_nulos = np.flatnonzero(forma.c)
+    modelo += pulp.LpAffineExpression(zip(variables[no_nulos], forma.c[no_nulos]), constant=forma.constante)
+
+    A = forma.A.tocsr()
+    for i in range(A.shape[0]):
+        for restriccion in restricciones_de_fila(forma, i, variables, A):
+            modelo += restriccion
+    return modelo
+
+
+def restricciones_de_fila(forma: FormaMatricial, i, variables, A=None) -> list:
+    """
+    Convierte la fila `i` de una forma matricial en restricciones de PuLP.
+
+    Las filas con ambos lados finitos y distintos dan dos restricciones
+    (`_inf` y `_sup`); las filas sin cotas finitas, ninguna.
+
+    Args:
+        forma (FormaMatricial): Modelo en forma matricial.
+        i (int): Índice de la fila.
+        variables (np.ndarray): Variables de PuLP en el orden de las columnas de A.
+        A (scipy.sparse.csr_matrix, optional): `forma.A` ya convertida a CSR.
+
+    Returns:
+        list: Restricciones de PuLP (pulp.LpConstraint).
+    """
+
+    A = forma.A.tocsr() if A is None else A
+    restriccion = forma.nombres_restricciones[i]
+    inf, sup = forma.fila_inf[i], forma.fila_sup[i]
+    inicio, fin = A.indptr[i], A.indptr[i + 1]
+    expr = pulp.LpAffineExpression(zip(variables[A.indices[inicio:fin]], A.data[inicio:fin]))
+    if inf == sup:
+        return [pulp.LpConstraint(expr, pulp.LpConstraintEQ, restriccion, float(sup))]
+    if np.isfinite(inf) and np.isfinite(sup):
+        return [
+            pulp.LpConstraint(expr, pulp.LpConstraintGE, f"{restriccion}_inf", float(inf)),
+            pulp.LpConstraint(expr.copy(), pulp.LpConstraintLE, f"{restriccion}_sup", float(sup)),
+        ]
+    if np.isfinite(sup):
+        return [pulp.LpConstraint(expr, pulp.LpConstraintLE, restriccion, float(sup))]
+    if np.isfinite(inf):
+        return [pulp.LpConstraint(expr, pulp.LpConstraintGE, restriccion, float(inf))]
+    return []
+
+
+def diferencias_forma(anterior: FormaMatricial, nueva: FormaMatricial):
+    """
+    Calcula los cambios que llevan de `anterior` a `nueva` (ver `Problema.actualizar`).
+
+    Solo se admiten cambios en la función objetivo y en las restricciones; si
+    difieren las variables, sus cotas, sus tipos o el sentido del modelo, hay
+    que construirlo de nuevo.
+
+    Args:
+        anterior (FormaMatricial): Modelo ya resuelto.
+        nueva (FormaMatricial): Modelo editado.
+
+    Returns:
+        dict | None: Argumentos 'objetivo', 'rhs', 'agregar' y 'eliminar' (vacíos
+        si no hay cambios), o None si el modelo no se puede actualizar en su lugar.
+    """
+
+    if (anterior.nombres_variables != nueva.nombres_variables
+            or anterior.maximizar != nueva.maximizar
+            or anterior.constante != nueva.constante
+            or not np.array_equal(anterior.var_inf, nueva.var_inf)
+            or not np.array_equal(anterior.var_sup, nueva.var_sup)
+            or not np.array_equal(anterior.enteras, nueva.enteras)):
+        return None
+
+    nombres = np.asarray(anterior.nombres_variables, dtype=object)
+    distintos = np.flatnonzero(anterior.c != nueva.c)
+    objetivo = dict(zip(nombres[distintos].tolist(), nueva.c[distintos].tolist()))
+
+    fila_anterior = {nombre: i for i, nombre in enumerate(anterior.nombres_restricciones)}
+    comunes = [(fila_anterior[nombre], i) for i, nombre in enumerate(nueva.nombres_restricciones)
+               if nombre in fila_anterior]
+    ant, nue = (np.array(indices, dtype=int) for indices in zip(*comunes)) if comunes else (np.empty(0, int),) * 2
+
+    diferencia = (anterior.A.tocsr()[ant] - nueva.A.tocsr()[nue]).tocsr()
+    diferencia.eliminate_zeros()
+    coeficientes_distintos = np.diff(diferencia.indptr) > 0
+    cotas_distintas = (anterior.fila_inf[ant] != nueva.fila_inf[nue]) | (anterior.fila_sup[ant] != nueva.fila_sup[nue])
+
+    reemplazar = nue[coeficientes_distintos]
+    nuevas = np.setdiff1d(np.arange(len(nueva.nombres_restricciones)), nue)
+    eliminar = [anterior.nombres_restricciones[i] for i in np.setdiff1d(np.arange(len(anterior.nombres_restricciones)), ant)]
+    eliminar += [nueva.nombres_restricciones[i] for i in reemplazar]
+
+    rhs = {
+        nueva.nombres_restricciones[i]: (float(nueva.fila_inf[i]), float(nueva.fila_sup[i]))
+        for i in nue[cotas_distintas & ~coeficientes_distintos]
+    }
+    agregar = {}
+    A = nueva.A.tocsr()
+    for i in np.concatenate([reemplazar, nuevas]):
+        nombre = nueva.nombres_restricciones[i]
+        inicio, fin = A.indptr[i], A.indptr[i + 1]
+        coeficientes = dict(zip(nombres[A.indices[inicio:fin]].tolist(), A.data[inicio:fin].tolist()))
+        inf, sup = float(nueva.fila_inf[i]), float(nueva.fila_sup[i])
+        if inf == sup:
+            agregar[nombre] = (coeficientes, "=", sup)
+        elif np.isfinite(sup):
+            agregar[nombre] = (coeficientes, "<=", sup)
+            if np.isfinite(inf):
+                rhs[nombre] = (inf, sup)  # fila con rango
+        else:
+            agregar[nombre] = (coeficientes, ">=", inf)
+
+    return {"objetivo": objetivo, "rhs": rhs, "agregar": agregar, "eliminar": eliminar}
@@ -1,8 +1,12 @@
+import json
+import numpy as np
 import pandas as pd
 import streamlit as st
+from contextlib import nullcontext
 from io import BytesIO
-import os
 from datetime import datetime
+from main.problemas import FILA_OBJETIVO, es_formato_largo, matriz_desde_largo
+from main.registro import RUTA_LOG, actualizar_mediciones, insertar_ejecucion
 
 
 def mostrar_ejemplo_excel(ruta_archivo, hojas: dict, titulo: str):
@@ -122,20 +126,30 @@ def exportar_excel(df1, df2, nombre1="modelo", nombre2="restricciones") -> Bytes
     output.seek(0)
     return output
 
-def plantilla_modelo(v=2, r=2):
+def plantilla_modelo(v=2, r=2, largo=False):
     """
     Genera una plantilla de DataFrame para la carga manual del modelo.
 
     Args:
         v (int): Número de variables.
         r (int): Número de restricciones.
+        largo (bool): Si es True, genera el formato largo (Restriccion, Variable, Coef)
+            con una fila por variable en la FO y en cada restricción.
 
     Returns:
         pd.DataFrame: Plantilla con columnas para coeficientes de FO y restricciones.
     """
 
+    variables = [f"X{i+1}" for i in range(v)]
+    if largo:
+        return pd.DataFrame({
+            "Restriccion": [FILA_OBJETIVO] * v + [f"R{j+1}" for j in range(r) for _ in variables],
+            "Variable": variables * (r + 1),
+            "Coef": [0] * (v * (r + 1))
+        })
+
     data = {
-        "Variable": [f"X{i+1}" for i in range(v)],
+        "Variable": variables,
         "Coef_FO": [0] * v
     }
     for j in range(r):
@@ -143,6 +157,58 @@ def plantilla_modelo(v=2, r=2):
 
     return pd.DataFrame(data)
 
+def modelo_a_largo(df_modelo: pd.DataFrame, df_restricciones: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Convierte un modelo en formato ancho (Coef_FO, Coef_R#) al formato largo.
+
+    Solo se conservan los coeficientes no nulos: primero los de la función
+    objetivo (Restriccion = 'FO') y luego los de cada restricción en orden.
+    Las variables sin ningún coeficiente no nulo no aparecen en el resultado
+    (tampoco forman parte del modelo resuelto).
+
+    Args:
+        df_modelo (pd.DataFrame): Modelo en formato ancho.
+        df_restricciones (pd.DataFrame, optional): Restricciones, para tomar sus nombres.
+            Si no se indica, se usa el sufijo de cada columna (`Coef_R1` → 'R1').
+
+    Returns:
+        pd.DataFrame: Columnas 'Restriccion', 'Variable' y 'Coef'.
+    """
+
+    columnas = [col for col in df_modelo.columns if col.startswith("Coef_R")]
+    if df_restricciones is not None:
+        columnas = columnas[:len(df_restricciones)]
+        nombres = df_restricciones["Restriccion"].tolist()[:len(columnas)]
+    else:
+        nombres = [col[len("Coef_"):] for col in columnas]
+
+    valores = df_modelo[["Coef_FO", *columnas]].fillna(0).to_numpy(dtype=float).T
+    fila, variable = np.nonzero(valores)
+
+    return pd.DataFrame({
+        "Restriccion": np.array([FILA_OBJETIVO, *nombres], dtype=object)[fila],
+        "Variable": df_modelo["Variable"].to_numpy()[variable],
+        "Coef": valores[fila, variable]
+    })
+
+def modelo_a_ancho(df_modelo: pd.DataFrame, df_restricciones: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convierte un modelo en formato largo (Restriccion, Variable, Coef) al formato ancho.
+
+    La columna `Coef_R#` i-ésima corresponde a la i-ésima fila de `df_restricciones`,
+    como espera el formato ancho. Los coeficientes ausentes quedan en cero.
+
+    Args:
+        df_modelo (pd.DataFrame): Modelo en formato largo.
+        df_restricciones (pd.DataFrame): Restricciones del modelo.
+
+    Returns:
+        pd.DataFrame: Columnas 'Variable', 'Coef_FO' y `Coef_R1` … `Coef_R{n}`.
+    """
+
+    variables, c, A = matriz_desde_largo(df_modelo, df_restricciones["Restriccion"])
+    coeficientes = pd.DataFrame(A.T.toarray(), columns=[f"Coef_R{j+1}" for j in range(A.shape[0])])
+    return pd.concat([pd.DataFrame({"Variable": variables, "Coef_FO": c}), coeficientes], axis=1)
 
 def plantilla_restricciones(r=2):
     """
@@ -165,6 +231,9 @@ def validar_datos_manual(df_modelo: pd.DataFrame, df_restricciones: pd.DataFrame
     """
     Valida que los datos del modelo y restricciones cargados manualmente sean correctos.
 
+    El modelo puede venir en formato ancho (Variable, Coef_FO, Coef_R#) o largo
+    (Restriccion, Variable, Coef).
+
     Checks:
     - Columnas esperadas
     - Tipos numéricos
@@ -177,7 +246,42 @@ def validar_datos_manual(df_modelo: pd.DataFrame, df_restricciones: pd.DataFrame
     Raises:
         ValueError: Si alguna estructura no es válida o hay tipos no numéricos.
     """
-    
+
+    largo = es_formato_largo(df_modelo)
+    if largo:
+        _validar_modelo_largo(df_modelo)
+    else:
+        _validar_modelo_ancho(df_modelo)
+
+    if df_restricciones is not None:
+        if not {"Restriccion", "Tipo", "RHS"}.issubset(df_restricciones.columns):
+            raise ValueError("🧩 La tabla de restricciones debe tener las columnas: 'Restriccion', 'Tipo' y 'RHS'.")
+
+        df_restricciones["RHS"] = df_restricciones["RHS"].fillna(0)
+        try:
+            df_restricciones["RHS"] = pd.to_numeric(df_restricciones["RHS"])
+        except:
+            raise ValueError("❌ La columna 'RHS' debe contener solo números.")
+
+        if not df_restricciones["Tipo"].isin({"<=", ">=", "="}).all():
+            raise ValueError("❌ La columna 'Tipo' debe contener solo: <=, >= o =.")
+
+        if largo:
+            nombres = df_restricciones["Restriccion"]
+            if nombres.duplicated().any() or (nombres == FILA_OBJETIVO).any():
+                raise ValueError(
+                    f"❌ Cada restricción debe tener un nombre único y distinto de '{FILA_OBJETIVO}'."
+                )
+            referidas = df_modelo["Restriccion"][df_modelo["Restriccion"] != FILA_OBJETIVO]
+            desconocidas = referidas[~referidas.isin(nombres)].unique()
+            if len(desconocidas):
+                raise ValueError(
+                    f"🧩 Coeficientes para restricciones no definidas: {', '.join(map(str, desconocidas[:10]))}."
+                )
+
+def _validar_modelo_ancho(df_modelo: pd.DataFrame):
+    """Valida el modelo en formato ancho (Variable, Coef_FO, Coef_R#)."""
+
     if "Variable" not in df_modelo.columns or "Coef_FO" not in df_modelo.columns:
         raise ValueError("🧩 La tabla debe incluir las columnas: 'Variable' y 'Coef_FO'.")
 
@@ -195,19 +299,21 @@ def validar_datos_manual(df_modelo: pd.DataFrame, df_restricciones: pd.DataFrame
         except:
             raise ValueError(f"❌ La columna '{col}' debe contener solo valores numéricos.")
 
-    if df_restricciones is not None:
-        if not {"Restriccion", "Tipo", "RHS"}.issubset(df_restricciones.columns):
-            raise ValueError("🧩 La tabla de restricciones debe tener las columnas: 'Restriccion', 'Tipo' y 'RHS'.")
+def _validar_modelo_largo(df_modelo: pd.DataFrame):
+    """Valida el modelo en formato largo (Restriccion, Variable, Coef)."""
 
-        df_restricciones["RHS"] = df_restricciones["RHS"].fillna(0)
-        try:
-            df_restricciones["RHS"] = pd.to_numeric(df_restricciones["RHS"])
-        except:
-            raise ValueError("❌ La columna 'RHS' debe contener solo números.")
+    if df_modelo[["Restriccion", "Variable"]].isna().any().any():
+        raise ValueError("❌ Cada coeficiente debe indicar su 'Restriccion' y su 'Variable'.")
+
+    df_modelo["Coef"] = df_modelo["Coef"].fillna(0)
+    try:
+        df_modelo["Coef"] = pd.to_numeric(df_modelo["Coef"])
+    except:
+        raise ValueError("❌ La columna 'Coef' debe contener solo valores numéricos.")
+
+    if df_modelo.duplicated(subset=["Restriccion", "Variable"]).any():
+        raise ValueError("❌ Cada par Restriccion-Variable debe aparecer una sola vez.")
 
-        if not df_restricciones["Tipo"].isin({"<=", ">=", "="}).all():
-            raise ValueError("❌ La columna 'Tipo' debe contener solo: <=, >= o =.")
-        
 def validar_datos_transporte(df_costos: pd.DataFrame):
     """
     Valida los datos cargados para un problema de transporte.
@@ -240,140 +346,293 @@ def validar_datos_transporte(df_costos: pd.DataFrame):
     
 def validar_datos_asignacion(df: pd.DataFrame):
     """
-    Valida una matriz de asignación para el método húngaro.
+    Valida los datos de un problema de asignación.
 
-    La matriz debe ser cuadrada y numérica.
+    Acepta una matriz de costos (cuadrada o rectangular, con celdas vacías para los
+    pares prohibidos y, opcionalmente, una primera columna con los nombres de los
+    agentes) o una tabla de pares permitidos con columnas 'Agente', 'Tarea' y 'Costo'.
 
     Args:
-        df (pd.DataFrame): Matriz de costos entre agentes y tareas.
+        df (pd.DataFrame): Matriz de costos entre agentes y tareas o pares permitidos.
 
     Raises:
-        ValueError: Si la matriz no es cuadrada o contiene valores no numéricos.
+        ValueError: Si la tabla está vacía, contiene valores no numéricos o pares repetidos.
     """
 
-    if df.shape[0] != df.shape[1]:
-        raise ValueError("❌ La matriz debe ser cuadrada.")
-    if not all(df.dtypes.apply(lambda t: pd.api.types.is_numeric_dtype(t))):
+    if {"Agente", "Tarea", "Costo"}.issubset(df.columns):
+        if df.empty:
+            raise ValueError("❌ Debes indicar al menos un par Agente-Tarea permitido.")
+        try:
+            df["Costo"] = pd.to_numeric(df["Costo"])
+        except:
+            raise ValueError("❌ La columna 'Costo' debe contener solo números.")
+        if df.duplicated(subset=["Agente", "Tarea"]).any():
+            raise ValueError("❌ Cada par Agente-Tarea debe aparecer una sola vez.")
+        return
+
+    valores = df
+    if len(df.columns) and not pd.api.types.is_numeric_dtype(df[df.columns[0]]):
+        valores = df.iloc[:, 1:]
+
+    if valores.shape[0] == 0 or valores.shape[1] == 0:
+        raise ValueError("❌ La matriz debe tener al menos un agente y una tarea.")
+    if not all(valores.dtypes.apply(lambda t: pd.api.types.is_numeric_dtype(t))):
         raise ValueError("❌ Todos los valores deben ser numéricos.")
     
-def exportar_resultado_excel(resultado: dict, datos_entrada: dict = None, grafico_img=None) -> BytesIO:
+# Filas (solución + entradas) a partir de las cuales la exportación a Excel usa hojas de solo escritura
+FILAS_EXPORTACION_STREAMING = 20_000
+
+# Hojas de entrada que se agregan al Excel de resultados
+HOJAS_ENTRADA = {
+    "modelo": "Entrada - Modelo",
+    "restricciones": "Entrada - Restricciones",
+    "costos": "Entrada - Costos",
+}
+
+def tabla_resultado(resultado: dict, omitir_ceros=False) -> pd.DataFrame:
+    """
+    Convierte la solución de un resultado en una tabla.
+
+    Args:
+        resultado (dict): Resultado del modelo ('solucion' o 'asignaciones').
+        omitir_ceros (bool): Si es True, descarta las variables con valor cero.
+
+    Returns:
+        pd.DataFrame: Columnas Variable/Valor, o Agente/Tarea para asignaciones.
+    """
+
+    if "solucion" in resultado:
+        solucion = resultado["solucion"]
+        df = pd.DataFrame({
+            "Variable": list(solucion.keys()),
+            "Valor": pd.to_numeric(pd.Series(list(solucion.values()), dtype=object), errors="coerce")
+        })
+        if omitir_ceros:
+            df = df[df["Valor"].fillna(0) != 0].reset_index(drop=True)
+        return df
+    if "asignaciones" in resultado:
+        return pd.DataFrame(resultado["asignaciones"], columns=["Agente", "Tarea"])
+    return pd.DataFrame()
+
+def _filas_hoja(df: pd.DataFrame, tamano_bloque=10_000):
+    """
+    Genera el encabezado y las filas de un DataFrame por bloques, con NaN como
+    celdas vacías e infinitos como "inf"/"-inf", igual que `DataFrame.to_excel`
+    (openpyxl los escribiría como celdas vacías).
+    """
+
+    yield [str(c) for c in df.columns]
+    for inicio in range(0, len(df), tamano_bloque):
+        bloque = df.iloc[inicio:inicio + tamano_bloque].astype(object)
+        bloque = bloque.where(bloque.notna(), None)
+        bloque = bloque.mask(bloque.isin([np.inf]), "inf").mask(bloque.isin([-np.inf]), "-inf")
+        yield from bloque.itertuples(index=False, name=None)
+
+def exportar_resultado_excel(resultado: dict, datos_entrada: dict = None, grafico_img=None,
+                             omitir_ceros=False, incluir_entradas=True, streaming=None) -> BytesIO:
     """
     Exporta los resultados del modelo a un archivo Excel, incluyendo datos originales y gráfico opcional.
 
     Crea un archivo con varias hojas:
     - Resumen del resultado
     - Solución o asignaciones
+    - Análisis de sensibilidad (si el resultado lo incluye)
     - Datos de entrada (modelo, restricciones, costos)
     - Imagen del gráfico (si se provee)
 
+    En modo streaming el libro se escribe con hojas de solo escritura de openpyxl:
+    las filas se vuelcan a medida que se generan, sin mantener un objeto por
+    celda, por lo que la memoria no crece con el tamaño del modelo.
+
     Args:
         resultado (dict): Diccionario con claves como 'status', 'valor_objetivo', 'solucion', etc.
         datos_entrada (dict, optional): Diccionario con DataFrames de entrada.
         grafico_img (BytesIO, optional): Imagen en memoria (PNG) con la visualización gráfica.
+        omitir_ceros (bool): Si es True, no escribe las variables con valor cero.
+        incluir_entradas (bool): Si es False, no copia los datos de entrada al archivo.
+        streaming (bool, optional): Fuerza (True) o desactiva (False) el modo streaming.
+            Por defecto se activa a partir de `FILAS_EXPORTACION_STREAMING` filas.
 
     Returns:
         BytesIO: Archivo Excel en memoria listo para ser descargado.
     """
 
+    resumen = pd.DataFrame({
+        "Estado": [resultado.get("status", "")],
+        "Valor óptimo": [resultado.get("valor_objetivo", "")]
+    })
+    df_resultado = tabla_resultado(resultado, omitir_ceros)
+    hoja_resultado = "Asignaciones" if "asignaciones" in resultado else "Solución"
+
+    hojas = [("Resumen", resumen)]
+    if "solucion" in resultado or "asignaciones" in resultado:
+        hojas.append((hoja_resultado, df_resultado))
+    if "sensibilidad" in resultado:
+        hojas += [
+            ("Sensibilidad - Variables", resultado["sensibilidad"]["variables"]),
+            ("Sensibilidad - Restricciones", resultado["sensibilidad"]["restricciones"]),
+        ]
+    if datos_entrada and incluir_entradas:
+        hojas += [(HOJAS_ENTRADA[clave], datos_entrada[clave]) for clave in HOJAS_ENTRADA if clave in datos_entrada]
+
+    if streaming is None:
+        streaming = sum(len(df) for _, df in hojas) >= FILAS_EXPORTACION_STREAMING
+
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        # Hoja 1: resumen del resultado
-        resumen = pd.DataFrame({
-            "Estado": [resultado.get("status", "")],
-            "Valor óptimo": [resultado.get("valor_objetivo", "")]
-        })
-        resumen.to_excel(writer, sheet_name="Resumen", index=False)
+    if streaming:
+        from openpyxl import Workbook
+
+        libro = Workbook(write_only=True)
+        for nombre, df in hojas:
+            hoja = libro.create_sheet(nombre)
+            for fila in _filas_hoja(df):
+                hoja.append(fila)
+        if grafico_img:
+            _agregar_grafico(libro.create_sheet("Gráfico"), grafico_img)
+        libro.save(output)
+    else:
+        with pd.ExcelWriter(output, engine='openpyxl') as writer:
+            for nombre, df in hojas:
+                df.to_excel(writer, sheet_name=nombre, index=False)
+            if grafico_img:
+                # Acceder al workbook abierto
+                _agregar_grafico(writer.book.create_sheet("Gráfico"), grafico_img)
 
-        # Hoja 2: resultados detallados
-        if "solucion" in resultado:
-            df_sol = pd.DataFrame(resultado["solucion"].items(), columns=["Variable", "Valor"])
-            df_sol.to_excel(writer, sheet_name="Solución", index=False)
-        elif "asignaciones" in resultado:
-            df_asig = pd.DataFrame(resultado["asignaciones"], columns=["Agente", "Tarea"])
-            df_asig.to_excel(writer, sheet_name="Asignaciones", index=False)
-
-        # Hoja 3+: datos de entrada (opcional)
-        if datos_entrada:
-            if "modelo" in datos_entrada:
-                datos_entrada["modelo"].to_excel(writer, sheet_name="Entrada - Modelo", index=False)
-            if "restricciones" in datos_entrada:
-                datos_entrada["restricciones"].to_excel(writer, sheet_name="Entrada - Restricciones", index=False)
-            if "costos" in datos_entrada:
-                datos_entrada["costos"].to_excel(writer, sheet_name="Entrada - Costos", index=False)
+    output.seek(0)
+    return output
 
-        if grafico_img:
-            from openpyxl.drawing.image import Image
-            from openpyxl.utils import get_column_letter
+def _agregar_grafico(hoja, grafico_img):
+    """Inserta la imagen del gráfico en una hoja de Excel."""
 
-            # Acceder al workbook abierto
-            ws = writer.book.create_sheet("Gráfico")
-            img = Image(grafico_img)
-            img.width = 600
-            img.height = 400
-            ws.add_image(img, "B2")
+    from openpyxl.drawing.image import Image
 
+    grafico_img.seek(0)
+    img = Image(grafico_img)
+    img.width = 600
+    img.height = 400
+    hoja.add_image(img, "B2")
+
+def exportar_resultado_csv(resultado: dict, omitir_ceros=False) -> BytesIO:
+    """
+    Exporta la solución del modelo a CSV.
+
+    El estado y el valor óptimo no forman parte de la tabla; se escriben como
+    líneas de comentario (`#`) al comienzo del archivo. La tabla se escribe por
+    bloques, sin armar el texto completo en memoria.
+
+    Args:
+        resultado (dict): Resultado del modelo.
+        omitir_ceros (bool): Si es True, no escribe las variables con valor cero.
+
+    Returns:
+        BytesIO: Archivo CSV (UTF-8) en memoria.
+    """
 
+    import io
+
+    output = BytesIO()
+    texto = io.TextIOWrapper(output, encoding="utf-8", newline="")
+    texto.write(f"# Estado: {resultado.get('status', '')}\n")
+    texto.write(f"# Valor óptimo: {resultado.get('valor_objetivo', '')}\n")
+    tabla_resultado(resultado, omitir_ceros).to_csv(texto, index=False, chunksize=50_000)
+    texto.flush()
+    texto.detach()
     output.seek(0)
     return output
 
-def registrar_log(tipo_problema, resultado: dict, datos_entrada: dict, ruta="logs/registro.csv"):
+def exportar_resultado_parquet(resultado: dict, omitir_ceros=False) -> BytesIO:
+    """
+    Exporta la solución del modelo a Parquet.
+
+    El estado y el valor óptimo se guardan en los metadatos del archivo
+    (claves `status` y `valor_objetivo`).
+
+    Args:
+        resultado (dict): Resultado del modelo.
+        omitir_ceros (bool): Si es True, no escribe las variables con valor cero.
+
+    Returns:
+        BytesIO: Archivo Parquet en memoria.
     """
-    Registra los datos de una ejecución del modelo en un archivo CSV de historial.
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    tabla = pa.Table.from_pandas(tabla_resultado(resultado, omitir_ceros), preserve_index=False)
+    tabla = tabla.replace_schema_metadata({
+        **(tabla.schema.metadata or {}),
+        b"status": str(resultado.get("status", "")).encode(),
+        b"valor_objetivo": str(resultado.get("valor_objetivo", "")).encode(),
+    })
+
+    output = BytesIO()
+    pq.write_table(tabla, output, row_group_size=100_000)
+    output.seek(0)
+    return output
+
+def registrar_log(tipo_problema, resultado: dict, datos_entrada: dict, ruta=RUTA_LOG, medicion=None):
+    """
+    Registra los datos de una ejecución del modelo en el historial.
+
+    El historial es una base SQLite en modo WAL (ver `main.registro`): cada
+    ejecución se agrega con un único INSERT, sin releer ni reescribir los
+    registros anteriores, y varias sesiones pueden registrar a la vez. Si existe
+    un `registro.csv` antiguo junto a la base, se migra automáticamente la
+    primera vez.
 
     Cada registro incluye:
     - Fecha y hora
     - Tipo de problema
     - Estado de la solución
     - Valor óptimo
+    - Brecha de optimalidad (modelos con variables enteras)
     - Datos de entrada (como JSON)
     - Solución encontrada
+    - Tiempos por fase y tamaño del modelo (como JSON), si se indica `medicion`
 
     Args:
         tipo_problema (str): Nombre del tipo de modelo resuelto.
         resultado (dict): Resultado del modelo con solución.
         datos_entrada (dict): Diccionario con los DataFrames originales.
-        ruta (str): Ruta al archivo CSV donde se acumulan los registros.
+        ruta (str): Ruta al historial (también se acepta la del antiguo CSV).
+        medicion (Medicion, optional): Mediciones de la ejecución (ver `main.medicion`). La
+            preparación y la inserción del registro se agregan como la fase "registro", que
+            se guarda en el mismo registro una vez terminada la inserción.
 
     Returns:
         None
     """
 
-    os.makedirs(os.path.dirname(ruta), exist_ok=True)
-
-    log = {
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "tipo": tipo_problema,
-        "estado": resultado.get("status", ""),
-        "valor_objetivo": resultado.get("valor_objetivo", ""),
-        "entrada_modelo": "",
-        "entrada_restricciones": "",
-        "entrada_costos": "",
-        "solucion": ""
-    }
-
-    if "modelo" in datos_entrada:
-        log["entrada_modelo"] = datos_entrada["modelo"].to_json()
-    if "restricciones" in datos_entrada:
-        log["entrada_restricciones"] = datos_entrada["restricciones"].to_json()
-    if "costos" in datos_entrada:
-        log["entrada_costos"] = datos_entrada["costos"].to_json()
-
-    if "solucion" in resultado:
-        log["solucion"] = pd.Series(resultado["solucion"]).to_json()
-    elif "asignaciones" in resultado:
-        log["solucion"] = pd.DataFrame(resultado["asignaciones"]).to_json()
-
-    df_log = pd.DataFrame([log])
-
-    # Adjuntar si existe, crear si no
-    if os.path.exists(ruta):
-        df_existente = pd.read_csv(ruta)
-        df_log = pd.concat([df_existente, df_log], ignore_index=True)
-
-    df_log.to_csv(ruta, index=False)
-
-
-
+    with medicion.fase("registro") if medicion is not None else nullcontext():
+        log = {
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "tipo": tipo_problema,
+            "estado": resultado.get("status", ""),
+            "valor_objetivo": resultado.get("valor_objetivo", ""),
+            "gap": resultado.get("gap", ""),
+            "entrada_modelo": "",
+            "entrada_restricciones": "",
+            "entrada_costos": "",
+            "solucion": "",
+            "mediciones": ""
+        }
+
+        if "modelo" in datos_entrada:
+            log["entrada_modelo"] = datos_entrada["modelo"].to_json()
+        if "restricciones" in datos_entrada:
+            log["entrada_restricciones"] = datos_entrada["restricciones"].to_json()
+        if "costos" in datos_entrada:
+            log["entrada_costos"] = datos_entrada["costos"].to_json()
 
+        if "solucion" in resultado:
+            log["solucion"] = pd.Series(resultado["solucion"]).to_json()
+        elif "asignaciones" in resultado:
+            log["solucion"] = pd.DataFrame(resultado["asignaciones"]).to_json()
 
+        if medicion is not None:
+            log["mediciones"] = json.dumps(medicion.a_dict())
+        id_ejecucion = insertar_ejecucion(log, ruta)
 
+    # La fase "registro" termina después de la inserción: se agrega al registro ya guardado
+    if medicion is not None:
+        actualizar_mediciones(id_ejecucion, json.dumps(medicion.a_dict()), ruta)
@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 from io import BytesIO
+from main.medicion import Medicion
 
 def mostrar_resultados(resultado: dict):
     """
@@ -23,13 +24,61 @@ def mostrar_resultados(resultado: dict):
 
     st.success(f"Estado del modelo: {resultado['status']}")
     
-    st.markdown("### 🔍 Variables de decisión:")
-    df_sol = pd.DataFrame(resultado["solucion"].items(), columns=["Variable", "Valor"])
-    st.table(df_sol)
+    if "asignaciones" in resultado:
+        st.markdown("### 🧮 Asignaciones óptimas:")
+        df_asig = pd.DataFrame(resultado["asignaciones"], columns=["Agente", "Tarea"])
+        st.table(df_asig)
+    else:
+        st.markdown("### 🔍 Variables de decisión:")
+        df_sol = pd.DataFrame(resultado["solucion"].items(), columns=["Variable", "Valor"])
+        st.table(df_sol)
 
     st.markdown(f"### 📈 Valor óptimo de la función objetivo: `{resultado['valor_objetivo']}`")
+    if resultado.get("gap") is not None:
+        st.caption(f"🎯 Brecha de optimalidad (gap): {resultado['gap']:.4%}")
+
+    if "presolve" in resultado:
+        resumen = resultado["presolve"]
+        (r0, r1), (v0, v1), (c0, c1) = resumen["restricciones"], resumen["variables"], resumen["coeficientes"]
+        aplicadas = ", ".join(f"{tipo.replace('_', ' ')}: {n}" for tipo, n in resumen["reducciones"].items() if n)
+        st.caption(
+            f"🧹 Presolve: {r0} → {r1} restricciones, {v0} → {v1} variables, {c0} → {c1} coeficientes"
+            + (f" ({aplicadas})" if aplicadas else "")
+        )
+
+    if "sensibilidad" in resultado:
+        st.markdown("### 📐 Análisis de sensibilidad")
+        st.markdown("**Variables** (costo reducido y rango de su coeficiente en la FO)")
+        st.dataframe(resultado["sensibilidad"]["variables"], hide_index=True)
+        st.markdown("**Restricciones** (holgura, precio sombra y rango del RHS)")
+        st.dataframe(resultado["sensibilidad"]["restricciones"], hide_index=True)
+
+def mostrar_mediciones(mediciones: dict):
+    """
+    Muestra el desglose de tiempo, CPU y memoria por fase de la ejecución y el tamaño del modelo.
+
+    Args:
+        mediciones (dict): Mediciones de la ejecución (ver `main.medicion.Medicion.a_dict`).
+
+    Returns:
+        None
+    """
 
-def graficar_solucion_lineal(df_modelo, df_restricciones, resultado, tipo="Maximización"):
+    if not mediciones or not mediciones.get("fases"):
+        return
+
+    with st.expander("⏱️ Tiempos por fase"):
+        tamano = mediciones.get("tamano")
+        if tamano:
+            st.caption(
+                f"📏 Modelo: {tamano['variables']} variables · {tamano['restricciones']} restricciones · "
+                f"{tamano['no_nulos']} coeficientes no nulos"
+            )
+        tabla = Medicion.tabla(mediciones)
+        st.dataframe(tabla.dropna(axis=1, how="all"), hide_index=True, use_container_width=True)
+        st.caption(f"Total: {tabla['Segundos'].sum():.3f} s · CPU: {tabla['CPU (s)'].sum():.3f} s")
+
+def graficar_solucion_lineal(df_modelo, df_restricciones, resultado, tipo="Maximización", mostrar=True):
     """
     Genera y muestra una visualización gráfica para modelos lineales de 2 variables.
 
@@ -45,6 +94,7 @@ def graficar_solucion_lineal(df_modelo, df_restricciones, resultado, tipo="Maxim
         df_restricciones (pd.DataFrame): RHS y operadores de las restricciones.
         resultado (dict): Resultado resuelto del modelo.
         tipo (str): Tipo de modelo ('Maximización' o 'Minimización') para el título del gráfico.
+        mostrar (bool): Si es False, solo genera la imagen (por ejemplo, para guardarla en la sesión).
 
     Returns:
         BytesIO: Objeto con la imagen del gráfico en formato PNG (para exportar), o None.
@@ -98,13 +148,44 @@ def graficar_solucion_lineal(df_modelo, df_restricciones, resultado, tipo="Maxim
     ax.legend()
     ax.grid(True)
 
-    st.pyplot(fig)
-
     # Mostrar en Streamlit
-    st.pyplot(fig)
+    if mostrar:
+        st.pyplot(fig)
 
     # Retornar imagen en memoria
     buffer = BytesIO()
     fig.savefig(buffer, format='png')
+    plt.close(fig)
+    buffer.seek(0)
+    return buffer
+
+def graficar_parametrico(df_parametrico, parametro=None):
+    """
+    Grafica el valor óptimo en función del parámetro de un análisis paramétrico.
+
+    Args:
+        df_parametrico (pd.DataFrame): Resultado de `Problema.analisis_parametrico`.
+        parametro (str, optional): Columna del eje X ('RHS <restriccion>' o 'FO <variable>').
+            Por defecto, el primer parámetro variado.
+
+    Returns:
+        BytesIO: Imagen PNG del gráfico.
+    """
+
+    if parametro is None:
+        parametro = next(col for col in df_parametrico.columns if col.startswith(("RHS ", "FO ")))
+
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.plot(df_parametrico[parametro], df_parametrico["Valor óptimo"], marker="o", markersize=3)
+    ax.set_xlabel(parametro)
+    ax.set_ylabel("Valor óptimo")
+    ax.set_title("Análisis paramétrico")
+    ax.grid(True)
+
+    st.pyplot(fig)
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png")
+    plt.close(fig)
     buffer.seek(0)
     return buffer
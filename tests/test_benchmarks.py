@@ -0,0 +1,53 @@
+import pandas as pd
+import pytest
+from benchmarks.ejecutor import FASES, comparar_resultados, ejecutar_benchmark, guardar_resultados, leer_resultados
+from benchmarks.generadores import generar_asignacion, generar_lp, generar_transporte
+from main.problemas import Asignacion, Maximizacion, Minimizacion, Transporte
+
+@pytest.mark.parametrize("clase", [Maximizacion, Minimizacion])
+@pytest.mark.parametrize("densidad", [1.0, 0.1])
+def test_lp_generado_factible_y_reproducible(clase, densidad):
+    df_modelo, df_restricciones = generar_lp(2000, semilla=3, maximizar=clase is Maximizacion, densidad=densidad)
+    assert df_modelo.equals(generar_lp(2000, semilla=3, maximizar=clase is Maximizacion, densidad=densidad)[0])
+    assert ("Coef" in df_modelo.columns) == (densidad < 1)
+
+    problema = clase(df_modelo, df_restricciones, solver="highs")
+    problema.construir()
+    assert problema.resolver()["status"] == "Optimal"
+    assert 1000 <= problema.forma_vigente().A.nnz <= 2000
+
+def test_transporte_y_asignacion_generados():
+    df_costos = generar_transporte(1000, semilla=1)
+    assert df_costos["Oferta"].sum() == df_costos["Demanda"].sum()
+    resultado = Transporte(df_costos, pd.DataFrame(), solver="modi")
+    resultado.construir()
+    assert resultado.resolver()["status"] == "Optimal"
+
+    for densidad in (1.0, 0.2):
+        problema = Asignacion(generar_asignacion(1000, semilla=1, densidad=densidad))
+        problema.construir()
+        assert problema.resolver()["status"] == "Óptimo"
+
+    with pytest.raises(ValueError):
+        generar_asignacion(100, densidad=0)
+
+def test_benchmark_guarda_y_compara(tmp_path):
+    tabla = ejecutar_benchmark(escalas=[10, 200], backends=["highs", "hungaro"], version="actual")
+
+    assert len(tabla) == 4 * 2
+    assert tabla["error"].isna().all()
+    assert tabla[[f"{fase}_s" for fase in FASES]].notna().all().all()
+    assert (tabla["total_s"] > 0).all()
+
+    for extension in ("json", "csv"):
+        ruta = tmp_path / f"resultados.{extension}"
+        guardar_resultados(tabla, ruta)
+        leida = leer_resultados(ruta)
+        assert leida["valor_objetivo"].tolist() == pytest.approx(tabla["valor_objetivo"].tolist())
+
+    comparacion = comparar_resultados(tabla, tabla)
+    assert len(comparacion) == 8
+    assert comparacion["total_s_cociente"].tolist() == pytest.approx([1.0] * 8)
+
+    with pytest.raises(ValueError):
+        ejecutar_benchmark(problemas=["Programación cuadrática"])
@@ -0,0 +1,55 @@
+import pandas as pd
+from main.cache import CacheResultados, clave_problema
+from main.problemas import Maximizacion, Minimizacion
+
+def _datos():
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2"],
+        "Coef_FO": [40, 30],
+        "Coef_R1": [2, 1]
+    })
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1"],
+        "Tipo": ["<="],
+        "RHS": [100]
+    })
+    return {"modelo": df_modelo, "restricciones": df_restricciones}
+
+def test_clave_estable_y_normalizada():
+    datos = _datos()
+    otros = _datos()
+    otros["modelo"]["Coef_FO"] = otros["modelo"]["Coef_FO"].astype(float)
+
+    assert clave_problema(Maximizacion, datos, {"solver": "cbc"}) == clave_problema(Maximizacion, otros, {"solver": "cbc"})
+    assert clave_problema(Maximizacion, datos, {"solver": "cbc"}) != clave_problema(Minimizacion, datos, {"solver": "cbc"})
+    assert clave_problema(Maximizacion, datos, {"solver": "cbc"}) != clave_problema(Maximizacion, datos, {"solver": "highs"})
+
+    otros["restricciones"].loc[0, "RHS"] = 90
+    assert clave_problema(Maximizacion, datos) != clave_problema(Maximizacion, otros)
+
+def test_cache_lru_y_contadores():
+    cache = CacheResultados(max_entradas=2)
+    cache.guardar("a", {"status": "Optimal"})
+    cache.guardar("b", {"status": "Optimal"})
+    assert cache.obtener("a") == {"status": "Optimal"}
+    cache.guardar("c", {"status": "Optimal"})
+
+    assert cache.obtener("b") is None
+    assert cache.obtener("a") is not None
+    assert (cache.aciertos, cache.fallos) == (2, 1)
+
+def test_cache_persistente(tmp_path):
+    CacheResultados(directorio=str(tmp_path)).guardar("a", {"status": "Optimal", "valor_objetivo": 5.0})
+
+    cache = CacheResultados(directorio=str(tmp_path))
+    assert cache.obtener("a") == {"status": "Optimal", "valor_objetivo": 5.0}
+    assert cache.aciertos == 1
+
+def test_cache_ignora_resultados_no_definitivos(tmp_path):
+    cache = CacheResultados(directorio=str(tmp_path))
+    assert not cache.guardar("a", {"status": "Not Solved", "valor_objetivo": 4.0, "gap": 0.2})
+    assert not cache.guardar("b", {"status": "Undefined", "valor_objetivo": None})
+    assert cache.guardar("c", {"status": "Infactible", "valor_objetivo": None, "asignaciones": []})
+
+    assert cache.obtener("a") is None and cache.obtener("b") is None
+    assert len(cache) == 1 and [p.name for p in tmp_path.iterdir()] == ["c.pkl"]
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+from main.ejecucion import EjecucionSegundoPlano, progreso_cbc
+from main.problemas import Maximizacion
+from main.utils import generar_ejemplo_maximizacion
+
+def _esperar(ejecucion, segundos=60):
+    limite = time.monotonic() + segundos
+    while not ejecucion.consultar():
+        assert time.monotonic() < limite
+        time.sleep(0.05)
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+def test_ejecucion_en_segundo_plano_igual_que_resolver(solver):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones, solver=solver, limite_tiempo=30, gap=0.01)
+    problema.construir()
+    esperado = problema.resolver()
+
+    ejecucion = EjecucionSegundoPlano(
+        Maximizacion, {"modelo": df_modelo, "restricciones": df_restricciones},
+        solver=solver, limite_tiempo=30, gap=0.01
+    )
+    _esperar(ejecucion)
+
+    assert ejecucion.error is None
+    assert ejecucion.maximizar
+    assert ejecucion.resultado["valor_objetivo"] == pytest.approx(esperado["valor_objetivo"])
+    assert ejecucion.progreso()["segundos"] == ejecucion.segundos
+    assert [f["fase"] for f in ejecucion.mediciones["fases"]] == ["construccion", "resolucion"]
+    assert ejecucion.mediciones["tamano"]["no_nulos"] == 4
+
+def test_cancelar_y_errores_del_modelo():
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    ejecucion = EjecucionSegundoPlano(Maximizacion, {"modelo": df_modelo, "restricciones": df_restricciones})
+    ejecucion.cancelar()
+    assert ejecucion.consultar()
+    assert ejecucion.resultado is None and "cancelada" in ejecucion.error
+
+    ejecucion = EjecucionSegundoPlano(Maximizacion, {"modelo": df_modelo.drop(columns="Coef_FO"),
+                                                     "restricciones": df_restricciones})
+    _esperar(ejecucion)
+    assert ejecucion.resultado is None and "Coef_FO" in ejecucion.error
+
+def test_progreso_cbc():
+    log = """Cbc0012I Integer solution of -1183 found by DiveCoefficient after 0 iterations and 0 nodes (0.00 seconds)
+Cbc0010I After 0 nodes, 1 on tree, 1e+50 best solution, best possible -1334.0588 (0.05 seconds)
+Cbc0010I After 100 nodes, 12 on tree, -1229 best solution, best possible -1320.5 (0.15 seconds)
+Cbc0012I Integer solution of -1247 found by rounding after 331 iterations and 1 nodes (0.20 seconds)
+"""
+    assert progreso_cbc(log, maximizar=True) == {"incumbente": 1247, "cota": 1320.5, "nodos": 100}
+    assert progreso_cbc(log.splitlines()[1])["cota"] == -1334.0588
+    assert "incumbente" not in progreso_cbc(log.splitlines()[1])
+    assert progreso_cbc("Clp0006I 0  Obj 0 Primal inf 10 (3)\nClp0006I 25  Obj 12.5\n") == {"iteraciones": 25}
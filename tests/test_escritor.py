@@ -0,0 +1,33 @@
+import threading
+import pytest
+from main.escritor import EscritorSegundoPlano
+
+def test_escritor_devuelve_resultados_y_reporta_fallos():
+    escritor = EscritorSegundoPlano(max_tareas=2)
+
+    def fallar():
+        raise OSError("disco lleno")
+
+    ok = escritor.enviar(sum, [1, 2, 3])
+    error = escritor.enviar(fallar, descripcion="exportación")
+    assert ok.result(timeout=5) == 6
+    with pytest.raises(OSError):
+        error.result(timeout=5)
+    assert [desc for _, desc, _ in escritor.errores] == ["exportación"]
+    escritor.cerrar()
+
+def test_cerrar_procesa_tareas_pendientes():
+    escritor = EscritorSegundoPlano(max_tareas=8)
+    liberar = threading.Event()
+    escritos = []
+
+    escritor.enviar(liberar.wait)
+    futuros = [escritor.enviar(escritos.append, i) for i in range(5)]
+    assert not any(f.done() for f in futuros)
+
+    liberar.set()
+    escritor.cerrar(timeout=5)
+    assert escritos == list(range(5))
+    assert all(f.done() for f in futuros)
+    with pytest.raises(RuntimeError):
+        escritor.enviar(print)
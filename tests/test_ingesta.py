@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+from main.ingesta import hash_contenido, leer_libro
+from main.utils import exportar_excel, generar_ejemplo_maximizacion
+
+def test_leer_libro_igual_a_read_excel():
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    df_restricciones.loc[1, "RHS"] = None
+    contenido = exportar_excel(df_modelo, df_restricciones).getvalue()
+
+    tablas = leer_libro(contenido, ["modelo", "restricciones"])
+    for hoja, tabla in tablas.items():
+        pd.testing.assert_frame_equal(tabla, pd.read_excel(pd.io.common.BytesIO(contenido), sheet_name=hoja))
+    assert hash_contenido(contenido) == hash_contenido(bytes(contenido))
+
+def test_leer_libro_columnas_de_texto_y_hojas_faltantes():
+    df_costos = pd.DataFrame({"Origen": [1, 2], "Destino": ["D1", "D2"], "Costo": [3, 4]})
+    contenido = exportar_excel(df_costos, pd.DataFrame({"x": [1]}), "costos", "otra").getvalue()
+
+    tablas = leer_libro(contenido, ["costos"])
+    assert list(tablas) == ["costos"]
+    assert tablas["costos"]["Origen"].tolist() == ["1", "2"]
+
+    with pytest.raises(ValueError, match="restricciones"):
+        leer_libro(contenido, ["costos", "restricciones"])
+
+def test_leer_archivos_columnares(tmp_path):
+    from main.problemas import Maximizacion, Transporte, crear_problema_desde_archivos
+    from main.utils import generar_ejemplo_transporte
+
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    df_modelo.to_parquet(tmp_path / "modelo.parquet")
+    df_restricciones.to_feather(tmp_path / "restricciones.arrow")
+    problema = crear_problema_desde_archivos(
+        Maximizacion, [tmp_path / "modelo.parquet", tmp_path / "restricciones.arrow"], solver="highs"
+    )
+    pd.testing.assert_frame_equal(problema.modelo_df, df_modelo)
+    problema.construir()
+    assert problema.resolver()["valor_objetivo"] == pytest.approx(1200)
+
+    df_costos = generar_ejemplo_transporte()
+    df_costos.to_csv(tmp_path / "mis_costos.csv", index=False)
+    problema = crear_problema_desde_archivos(Transporte, [tmp_path / "mis_costos.csv"])
+    pd.testing.assert_frame_equal(problema.modelo_df, df_costos, check_dtype=False)
+
+    with pytest.raises(ValueError, match="restricciones"):
+        crear_problema_desde_archivos(Maximizacion, [tmp_path / "modelo.parquet"])
@@ -0,0 +1,151 @@
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import pytest
+from main.intercambio import escribir_lp, escribir_mps, leer_lp, leer_modelo, leer_mps
+from main.problemas import Maximizacion, ModeloMatricial, Transporte
+from main.utils import generar_ejemplo_maximizacion, generar_ejemplo_transporte
+
+@pytest.mark.parametrize("formato", ["mps", "lp"])
+def test_exportar_e_importar_resuelve_igual(formato, tmp_path):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones, solver="highs")
+    problema.construir()
+    esperado = problema.resolver()
+
+    ruta = tmp_path / f"modelo.{formato}.gz"
+    problema.exportar(ruta, formato=formato)
+
+    for solver in ("highs", "cbc"):
+        importado = ModeloMatricial.desde_archivo(ruta, solver=solver)
+        importado.construir()
+        resultado = importado.resolver()
+        assert resultado["status"] == "Optimal"
+        assert resultado["valor_objetivo"] == pytest.approx(esperado["valor_objetivo"])
+        assert resultado["solucion"] == pytest.approx(esperado["solucion"])
+
+def test_transporte_exporta_sin_construir():
+    problema = Transporte(generar_ejemplo_transporte(), pd.DataFrame(), solver="modi")
+    forma = leer_mps(problema.exportar())
+
+    assert forma.nombres_variables == ["X_O1_D1", "X_O1_D2", "X_O2_D1", "X_O2_D2"]
+    assert forma.nombres_restricciones == ["Oferta_O1", "Oferta_O2", "Demanda_D1", "Demanda_D2"]
+    assert forma.A.nnz == 8
+
+    pl = Transporte(generar_ejemplo_transporte(), pd.DataFrame(), solver="highs")
+    pl.construir()
+    assert ModeloMatricial(forma, solver="highs").resolver()["valor_objetivo"] == pytest.approx(
+        pl.resolver()["valor_objetivo"]
+    )
+
+def test_leer_lp_rangos_cotas_y_constantes():
+    texto = b"""\\ Modelo de prueba
+Maximize
+ obj: 3 x + 2 y - z + 5
+Subject To
+ c1: x + y
+   + z <= 10
+ -2 <= x - y <= 4
+ c3: 2 x + 1 >= 3
+Bounds
+ y <= 6
+ -inf <= z <= 2
+ w free
+Binaries
+ b
+End
+"""
+    forma = leer_lp(BytesIO(texto))
+
+    assert forma.maximizar
+    assert forma.constante == 5
+    assert forma.nombres_variables == ["x", "y", "z", "w", "b"]
+    assert forma.nombres_restricciones == ["c1", "R2", "c3"]
+    assert forma.c.tolist() == [3, 2, -1, 0, 0]
+    assert forma.A.toarray().tolist() == [[1, 1, 1, 0, 0], [1, -1, 0, 0, 0], [2, 0, 0, 0, 0]]
+    assert forma.fila_inf.tolist() == [-np.inf, -2, 2]
+    assert forma.fila_sup.tolist() == [10, 4, np.inf]
+    assert forma.var_inf.tolist() == [0, 0, -np.inf, -np.inf, 0]
+    assert forma.var_sup.tolist() == [np.inf, 6, 2, np.inf, 1]
+
+    copia = leer_mps(escribir_mps(forma))
+    assert copia.maximizar and copia.constante == 5
+    assert copia.nombres_restricciones == forma.nombres_restricciones
+    assert copia.fila_inf.tolist() == forma.fila_inf.tolist()
+    assert copia.fila_sup.tolist() == forma.fila_sup.tolist()
+    assert copia.var_inf.tolist() == forma.var_inf.tolist()
+    assert copia.var_sup.tolist() == forma.var_sup.tolist()
+    assert (copia.A != forma.A).nnz == 0
+
+    copia = leer_lp(escribir_lp(forma))
+    assert copia.nombres_restricciones == ["c1", "R2_inf", "R2_sup", "c3"]
+    assert copia.var_inf.tolist() == forma.var_inf.tolist()
+
+def test_leer_mps_rangos_y_cotas_clasicas():
+    texto = b"""NAME          PRUEBA
+ROWS
+ N  COSTO
+ E  R1
+ G  R2
+ N  LIBRE
+COLUMNS
+    X1  COSTO  1  R1  1
+    X1  LIBRE  9
+    X2  COSTO  2  R2  1
+RHS
+    RHS  R1  4  R2  1
+RANGES
+    RNG  R1  -3
+BOUNDS
+ UP BND  X1  -1
+ LO BND  X2  -5
+ UP BND  X2  -2
+ENDATA
+"""
+    forma = leer_modelo(BytesIO(texto), formato="mps")
+
+    assert not forma.maximizar
+    assert forma.nombres_restricciones == ["R1", "R2"]
+    assert forma.fila_inf.tolist() == [1, 1]
+    assert forma.fila_sup.tolist() == [4, np.inf]
+    assert forma.var_inf.tolist() == [-np.inf, -5]
+    assert forma.var_sup.tolist() == [-1, -2]
+
+    with pytest.raises(ValueError, match="formato"):
+        leer_modelo(BytesIO(texto))
+
+@pytest.mark.parametrize("formato", ["mps", "lp"])
+def test_variables_enteras_y_binarias(formato):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    df_modelo["Tipo_Var"] = ["Entera", "Binaria"] + ["Continua"] * (len(df_modelo) - 2)
+    problema = Maximizacion(df_modelo, df_restricciones, solver="highs")
+    forma = problema.forma_vigente()
+
+    importada = leer_modelo(problema.exportar(formato=formato), formato=formato)
+    orden = [importada.nombres_variables.index(v) for v in forma.nombres_variables]
+    assert importada.enteras[orden].tolist() == forma.enteras.tolist()
+    assert importada.var_sup[orden].tolist() == forma.var_sup.tolist()
+
+@pytest.mark.parametrize("variable", ["X-1", "1A", "x[1]", ".5x", "inf", "end"])
+def test_nombres_que_lp_no_puede_leer(variable):
+    df_modelo = pd.DataFrame({"Variable": [variable, "Peso(kg)"], "Coef_FO": [3, 2], "Coef_R1": [1, 1]})
+    df_restricciones = pd.DataFrame({"Restriccion": ["R1"], "Tipo": ["<="], "RHS": [4]})
+    forma = Maximizacion(df_modelo, df_restricciones).forma_matricial()
+
+    with pytest.raises(ValueError, match="formato LP"):
+        escribir_lp(forma)
+
+    # MPS conserva el nombre y los coeficientes
+    importada = leer_mps(escribir_mps(forma))
+    assert dict(zip(importada.nombres_variables, importada.c)) == {variable: 3, "Peso(kg)": 2}
+
+def test_nombres_validos_en_lp_ida_y_vuelta():
+    df_modelo = pd.DataFrame({"Variable": ["Peso(kg)", "x.1", "_y"], "Coef_FO": [3, 2, 1], "Coef_R1": [1, 1, 1]})
+    df_restricciones = pd.DataFrame({"Restriccion": ["Capacidad#1"], "Tipo": ["<="], "RHS": [4]})
+    forma = Maximizacion(df_modelo, df_restricciones).forma_matricial()
+
+    importada = leer_lp(escribir_lp(forma))
+    assert dict(zip(importada.nombres_variables, importada.c)) == {"Peso(kg)": 3, "x.1": 2, "_y": 1}
+    assert importada.nombres_restricciones == ["Capacidad#1"]
+    assert importada.A.toarray().tolist() == [[1, 1, 1]]
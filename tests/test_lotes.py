@@ -0,0 +1,46 @@
+import pandas as pd
+import pytest
+from main.lotes import escenarios_desde_carpeta, resolver_lote, tabla_lote
+from main.problemas import Asignacion, Maximizacion, Transporte
+from main.utils import generar_ejemplo_maximizacion, generar_ejemplo_transporte
+
+def escenarios_maximizacion(cantidad):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    for i in range(cantidad):
+        restricciones = df_restricciones.copy()
+        restricciones.loc[1, "RHS"] = 20 * (i + 1)
+        yield {"modelo": df_modelo, "restricciones": restricciones}
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_lote_en_paralelo_con_errores(procesos):
+    escenarios = list(escenarios_maximizacion(5))
+    escenarios.append({"modelo": pd.DataFrame({"Variable": ["X1"]}), "restricciones": pd.DataFrame()})
+
+    resultados = list(resolver_lote(Maximizacion, escenarios, procesos=procesos, solver="highs"))
+    tabla = tabla_lote(resultados, incluir_solucion=True)
+
+    assert tabla["Escenario"].tolist() == list(range(6))
+    assert tabla["Estado"].tolist() == ["Optimal"] * 5 + ["Error"]
+    assert tabla["Valor óptimo"].tolist()[:5] == pytest.approx([300, 600, 900, 1200, 1500])
+    assert tabla["Error"].isna().tolist() == [True] * 5 + [False]
+    assert {"X1", "X2"} <= set(tabla.columns)
+    medido = next(r for r in resultados if r["escenario"] == 0)["mediciones"]
+    assert [f["fase"] for f in medido["fases"]] == ["construccion", "resolucion"]
+    assert medido["tamano"] == {"variables": 2, "restricciones": 2, "no_nulos": 4}
+
+def test_lote_desde_carpeta(tmp_path):
+    costos = generar_ejemplo_transporte()
+    for i, costo in enumerate([1, 2, 3]):
+        escenario = costos.assign(Costo=costos["Costo"] * costo)
+        with pd.ExcelWriter(tmp_path / f"escenario_{i}.xlsx") as writer:
+            escenario.to_excel(writer, sheet_name="costos", index=False)
+    (tmp_path / "notas.txt").write_text("no es un escenario")
+
+    assert [nombre for nombre, _ in escenarios_desde_carpeta(tmp_path)] == ["escenario_0", "escenario_1", "escenario_2"]
+    tabla = tabla_lote(resolver_lote(Transporte, str(tmp_path), procesos=2, solver="modi"))
+    assert tabla["Valor óptimo"].tolist() == pytest.approx([1120, 2240, 3360])
+
+    matrices = [("A", pd.DataFrame([[4, 1], [2, 3]])), ("B", pd.DataFrame([[1, 9], [9, 1]]))]
+    tabla = tabla_lote(resolver_lote(Asignacion, matrices, procesos=1), incluir_solucion=True)
+    assert tabla["Valor óptimo"].tolist() == [3, 2]
+    assert tabla["Asignaciones"].tolist() == [2, 2]
@@ -0,0 +1,95 @@
+import json
+import time
+import tracemalloc
+
+import pandas as pd
+import pytest
+from main.medicion import Medicion, tamano_modelo
+from main.problemas import Asignacion, Maximizacion
+from main.registro import leer_ejecuciones
+from main import utils
+from main.utils import generar_ejemplo_maximizacion, registrar_log
+
+def test_fases_anidadas_con_memoria():
+    medicion = Medicion(memoria=True)
+    with medicion.fase("externa"):
+        with medicion.fase("interna"):
+            datos = bytearray(8 * 2**20)
+            del datos
+
+    interna, externa = medicion.fases
+    assert (interna["fase"], externa["fase"]) == ("interna", "externa")
+    assert interna["memoria_pico"] >= 8 * 2**20
+    assert externa["memoria_pico"] >= interna["memoria_pico"]
+    assert externa["segundos"] >= interna["segundos"] >= 0
+    assert not tracemalloc.is_tracing()
+
+def test_decorador_y_fases_con_error():
+    medicion = Medicion(memoria=False)
+
+    @medicion.medir("calculo")
+    def calcular(n):
+        return sum(range(n))
+
+    assert calcular(1000) == 499500
+    with pytest.raises(ValueError):
+        with medicion.fase("fallida"):
+            raise ValueError("❌ error")
+
+    assert [f["fase"] for f in medicion.fases] == ["calculo", "fallida"]
+    assert medicion.fases[0]["memoria_pico"] is None
+    tabla = Medicion.tabla(medicion.a_dict())
+    assert tabla.columns.tolist() == ["Fase", "Segundos", "CPU (s)", "Memoria pico (MB)", "Memoria del proceso (MB)"]
+    assert tabla["Memoria pico (MB)"].isna().all()
+
+@pytest.mark.parametrize("presolve", [False, True])
+def test_tamano_del_modelo(presolve):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones, solver="highs", presolve=presolve)
+    assert tamano_modelo(problema) == {}
+    problema.construir()
+    assert tamano_modelo(problema) == {"variables": 2, "restricciones": 2, "no_nulos": 4}
+
+    asignacion = Asignacion(pd.DataFrame([[4, 1, None], [2, 3, 5]]))
+    asignacion.construir()
+    assert tamano_modelo(asignacion) == {"variables": 5, "restricciones": 5, "no_nulos": 10}
+
+def test_mediciones_en_el_historial(tmp_path):
+    ruta = str(tmp_path / "registro.db")
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones)
+
+    medicion = Medicion()
+    with medicion.fase("construccion"):
+        problema.construir()
+    with medicion.fase("resolucion"):
+        resultado = problema.resolver()
+    medicion.medir_modelo(problema)
+    registrar_log("Maximización", resultado, {"modelo": df_modelo, "restricciones": df_restricciones},
+                  ruta=ruta, medicion=medicion)
+
+    guardado = json.loads(leer_ejecuciones(ruta).loc[0, "mediciones"])
+    assert [f["fase"] for f in guardado["fases"]] == ["construccion", "resolucion", "registro"]
+    assert guardado["tamano"]["variables"] == 2
+
+def test_fase_registro_incluye_la_insercion(tmp_path, monkeypatch):
+    ruta = str(tmp_path / "registro.db")
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones)
+    problema.construir()
+    resultado = problema.resolver()
+
+    insertar = utils.insertar_ejecucion
+    def insertar_lento(log, ruta):
+        time.sleep(0.2)
+        return insertar(log, ruta)
+    monkeypatch.setattr(utils, "insertar_ejecucion", insertar_lento)
+
+    medicion = Medicion()
+    registrar_log("Maximización", resultado, {"modelo": df_modelo, "restricciones": df_restricciones},
+                  ruta=ruta, medicion=medicion)
+
+    guardado = json.loads(leer_ejecuciones(ruta).loc[0, "mediciones"])
+    assert guardado == json.loads(json.dumps(medicion.a_dict()))
+    (registro,) = guardado["fases"]
+    assert registro["fase"] == "registro" and registro["segundos"] >= 0.2
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from main.presolve import presolve
+from main.problemas import Maximizacion, ModeloMatricial, Transporte
+from main.solvers import FormaMatricial
+from main.utils import generar_ejemplo_maximizacion, generar_ejemplo_transporte
+
+def forma_con_reducciones():
+    # x1..x4 >= 0; R_vacia sin coeficientes, R_fija fija x3 = 2, R_dup = 2 * R1,
+    # R_holgada nunca activa (x4 <= 1 por cota) y x4 solo aparece en ella.
+    A = sparse.csr_matrix(np.array([
+        [1, 1, 0, 0],   # R1: x1 + x2 <= 4
+        [0, 0, 0, 0],   # R_vacia: 0 <= 5
+        [0, 0, 3, 0],   # R_fija: 3 x3 = 6
+        [2, 2, 0, 0],   # R_dup: 2 x1 + 2 x2 <= 6
+        [1, 0, 1, 0],   # R2: x1 + x3 <= 5
+        [0, 0, 0, 1],   # R_holgada: x4 <= 10
+    ], dtype=float))
+    return FormaMatricial(
+        nombres_variables=["x1", "x2", "x3", "x4"],
+        nombres_restricciones=["R1", "R_vacia", "R_fija", "R_dup", "R2", "R_holgada"],
+        c=np.array([3.0, 2.0, 1.0, 0.0]),
+        A=A,
+        fila_inf=np.array([-np.inf, -np.inf, 6, -np.inf, -np.inf, -np.inf]),
+        fila_sup=np.array([4, 5, 6, 6, 5, 10.0]),
+        var_inf=np.zeros(4),
+        var_sup=np.array([np.inf, np.inf, np.inf, 1.0]),
+        maximizar=True,
+    )
+
+def test_presolve_reduce_y_restaura():
+    forma = forma_con_reducciones()
+    reduccion = presolve(forma)
+    resumen = reduccion.resumen()
+
+    assert reduccion.reducciones["filas_vacias"] == 1
+    # R_fija, R_holgada y R2 (singleton una vez fijada x3)
+    assert reduccion.reducciones["filas_singleton"] == 3
+    assert reduccion.reducciones["filas_duplicadas"] == 1
+    assert reduccion.reducciones["variables_fijas"] == 1
+    assert resumen["restricciones"][0] == 6 and resumen["restricciones"][1] <= 2
+    assert resumen["variables"][0] == 4 and resumen["variables"][1] < 4
+
+    for solver in ("highs", "cbc"):
+        esperado = ModeloMatricial(forma, solver=solver, presolve=False)
+        esperado.construir()
+        esperado = esperado.resolver()
+        problema = ModeloMatricial(forma, solver=solver, presolve=True)
+        problema.construir()
+        resultado = problema.resolver()
+
+        assert resultado["status"] == "Optimal"
+        assert resultado["valor_objetivo"] == pytest.approx(esperado["valor_objetivo"])
+        assert resultado["solucion"]["x3"] == pytest.approx(2)
+        assert resultado["presolve"] == resumen
+
+def test_presolve_detecta_infactibilidad():
+    forma = forma_con_reducciones()
+    forma.fila_inf[0] = 7  # x1 + x2 >= 7 contradice 2 x1 + 2 x2 <= 6
+
+    problema = ModeloMatricial(forma, solver="highs", presolve=True)
+    problema.construir()
+    resultado = problema.resolver()
+
+    assert problema.reduccion.infactible
+    assert resultado["status"] == "Infeasible"
+    assert resultado["valor_objetivo"] is None
+
+@pytest.mark.parametrize("solver", ["highs", "cbc"])
+def test_presolve_en_problemas_de_la_app(solver):
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    datos = [
+        (Maximizacion, (df_modelo, df_restricciones)),
+        (Transporte, (generar_ejemplo_transporte(), None)),
+    ]
+    for clase, args in datos:
+        resultados = []
+        for usar in (False, True):
+            problema = clase(*args, solver=solver, presolve=usar)
+            problema.construir()
+            resultados.append(problema.resolver())
+        sin, con = resultados
+        assert con["status"] == sin["status"] == "Optimal"
+        assert con["valor_objetivo"] == pytest.approx(sin["valor_objetivo"])
+        assert set(con["solucion"]) == set(sin["solucion"])
+        assert "presolve" in con
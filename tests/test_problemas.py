@@ -53,3 +53,357 @@ def test_resolucion_minimizacion():
 
     # Opcional: verificar el valor mínimo esperado
     assert resultado["valor_objetivo"] == 30  # (X1=0, X2=6) o (X1=6, X2=0)
+def test_matriz_coeficientes_omite_ceros():
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2", "X3"],
+        "Coef_FO": [3, 0, 2],
+        "Coef_R1": [1, 0, 4],
+        "Coef_R2": [0, 2, 0]
+    })
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1", "R2"],
+        "Tipo": ["<=", ">="],
+        "RHS": [10, 1]
+    })
+
+    problema = Maximizacion(df_modelo, df_restricciones)
+    c, A = problema.matriz_coeficientes()
+
+    assert list(c) == [3, 0, 2]
+    assert A.shape == (2, 3)
+    assert A.nnz == 3
+    assert A.toarray().tolist() == [[1, 0, 4], [0, 2, 0]]
+
+    problema.construir()
+    assert set(problema.modelo.constraints) == {"R1", "R2"}
+    assert {v.name: c for v, c in problema.modelo.constraints["R1"].items()} == {"X1": 1, "X3": 4}
+
+def test_resolucion_highs_igual_que_cbc():
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2"],
+        "Coef_FO": [2, 3],
+        "Coef_R1": [5, 10],
+        "Coef_R2": [4, 3],
+        "Coef_R3": [0.5, 0]
+    })
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1", "R2", "R3"],
+        "Tipo": [">=", ">=", ">="],
+        "RHS": [90, 48, 1.5]
+    })
+
+    resultados = {}
+    for solver in ("cbc", "highs"):
+        problema = Minimizacion(df_modelo, df_restricciones, solver=solver)
+        problema.construir()
+        resultados[solver] = problema.resolver()
+
+    assert resultados["highs"]["status"] == "Optimal"
+    assert resultados["highs"]["solucion"].keys() == resultados["cbc"]["solucion"].keys()
+    assert resultados["highs"]["valor_objetivo"] == pytest.approx(resultados["cbc"]["valor_objetivo"], abs=1e-4)
+
+@pytest.mark.parametrize("sensibilidad", [False, True])
+def test_highs_modelo_con_coeficientes_en_cero(sensibilidad):
+    df_modelo = pd.DataFrame({"Variable": ["X1", "X2"], "Coef_FO": [0, 0], "Coef_R1": [0, 0]})
+    for tipo, rhs, estado in (("<=", 0, "Optimal"), (">=", 5, "Infeasible")):
+        df_restricciones = pd.DataFrame({"Restriccion": ["R1"], "Tipo": [tipo], "RHS": [rhs]})
+        problema = Maximizacion(df_modelo, df_restricciones, solver="highs", sensibilidad=sensibilidad)
+        problema.construir()
+        resultado = problema.resolver()
+        assert resultado["status"] == estado
+        assert resultado["valor_objetivo"] == (0.0 if estado == "Optimal" else None)
+
+def test_solver_desconocido():
+    with pytest.raises(ValueError):
+        Maximizacion(pd.DataFrame(), pd.DataFrame(), solver="gurobi")
+
+def test_transporte_modi_igual_que_pl():
+    from main.problemas import Transporte
+    from main.utils import generar_ejemplo_transporte
+
+    df = generar_ejemplo_transporte()
+
+    pl = Transporte(df, pd.DataFrame(), solver="highs")
+    pl.construir()
+    resultado_pl = pl.resolver()
+
+    modi = Transporte(df, pd.DataFrame(), solver="modi")
+    modi.construir()
+    resultado_modi = modi.resolver()
+
+    assert modi.modelo is None
+    assert resultado_modi["status"] == "Optimal"
+    assert resultado_modi["solucion"].keys() == resultado_pl["solucion"].keys()
+    assert resultado_modi["valor_objetivo"] == pytest.approx(resultado_pl["valor_objetivo"])
+
+def test_transporte_modi_infactible():
+    from main.problemas import Transporte
+
+    df = pd.DataFrame({
+        "Origen": ["O1", "O2"],
+        "Destino": ["D1", "D2"],
+        "Costo": [1, 1],
+        "Oferta": [10, 10],
+        "Demanda": [20, 5]
+    })
+
+    problema = Transporte(df, pd.DataFrame(), solver="modi")
+    problema.construir()
+    assert problema.resolver()["status"] == "Infeasible"
+
+def test_asignacion_rectangular_y_maximizacion():
+    from main.problemas import Asignacion
+
+    df = pd.DataFrame(
+        [[4, 1, 3], [2, 6, 5]],
+        index=["A1", "A2"],
+        columns=["T1", "T2", "T3"]
+    )
+
+    problema = Asignacion(df)
+    problema.construir()
+    resultado = problema.resolver()
+    assert resultado["valor_objetivo"] == 3
+    assert sorted(resultado["asignaciones"]) == [("A1", "T2"), ("A2", "T1")]
+
+    problema = Asignacion(df, maximizar=True)
+    problema.construir()
+    assert problema.resolver()["valor_objetivo"] == 10
+
+def test_asignacion_pares_permitidos():
+    from main.problemas import Asignacion
+
+    df = pd.DataFrame({
+        "Agente": ["A1", "A1", "A2", "A3"],
+        "Tarea": ["T1", "T2", "T1", "T2"],
+        "Costo": [0, 2, 1, 5]
+    })
+
+    problema = Asignacion(df)
+    problema.construir()
+    resultado = problema.resolver()
+
+    assert problema.matriz.nnz == 4
+    assert resultado["status"] == "Óptimo"
+    assert resultado["valor_objetivo"] == 3
+    assert sorted(resultado["asignaciones"]) == [("A1", "T2"), ("A2", "T1")]
+
+def test_asignacion_pares_repetidos():
+    from main.problemas import Asignacion
+
+    df = pd.DataFrame({
+        "Agente": ["A", "A", "B", "B", "A"],
+        "Tarea": ["T1", "T2", "T1", "T2", "T1"],
+        "Costo": [5, 1, 1, 5, 7]
+    })
+
+    with pytest.raises(ValueError, match="una sola vez"):
+        Asignacion(df).construir()
+
+def test_asignacion_sin_asignacion_completa():
+    from main.problemas import Asignacion
+
+    # Ninguna tarea puede cubrir a la vez a los dos agentes
+    df = pd.DataFrame([[1, None], [2, None]], index=["A1", "A2"], columns=["T1", "T2"])
+
+    problema = Asignacion(df)
+    problema.construir()
+    assert problema.resolver()["status"] == "Infactible"
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_asignacion_resolver_matrices_igual_que_una_a_una(procesos, monkeypatch):
+    import numpy as np
+    from main import problemas
+    from main.problemas import Asignacion
+
+    monkeypatch.setattr(problemas, "MATRICES_POR_PROCESO", 2)
+    rng = np.random.default_rng(0)
+    costos = rng.integers(1, 20, size=(6, 3, 4)).astype(float)
+    costos[4, :, 1:] = np.nan  # sin asignación completa
+
+    for maximizar in (False, True):
+        lote = Asignacion.resolver_matrices(costos, maximizar=maximizar, procesos=procesos)
+        assert len(lote) == 6 and lote.filas.shape == (6, 3)
+        assert lote.factibles.tolist() == [True] * 4 + [False, True]
+        for i in range(6):
+            problema = Asignacion(pd.DataFrame(costos[i]), maximizar=maximizar)
+            problema.construir()
+            assert lote.resultado(i) == problema.resolver()
+
+    # DataFrames: etiquetas resueltas solo al pedir cada matriz
+    df = pd.DataFrame([[4, 1, 3], [2, 6, 5]], index=["A1", "A2"], columns=["T1", "T2", "T3"])
+    largo = pd.DataFrame({
+        "Agente": ["B1", "B1", "B2", "B2"],
+        "Tarea": ["T1", "T2", "T1", "T3"],
+        "Costo": [1, 2, 3, 3]
+    })
+    lote = Asignacion.resolver_matrices([df, df * 2, largo])
+    assert lote.totales.tolist() == [3, 6, 4]
+    assert sorted(lote.asignaciones(1)) == [("A1", "T2"), ("A2", "T1")]
+    assert sorted(lote.asignaciones(2)) == [("B1", "T1"), ("B2", "T3")]
+
+    with pytest.raises(ValueError, match="mismo número"):
+        Asignacion.resolver_matrices([df, largo.iloc[:3]])
+
+def test_formato_largo_igual_que_ancho():
+    from main.utils import generar_ejemplo_minimizacion, modelo_a_ancho, modelo_a_largo
+
+    df_modelo, df_restricciones = generar_ejemplo_minimizacion()
+    df_largo = modelo_a_largo(df_modelo, df_restricciones)
+
+    # Solo se guardan los coeficientes no nulos (Coef_R3 de X2 es 0)
+    assert len(df_largo) == 7
+    assert df_largo.iloc[0].tolist() == ["FO", "X1", 2.0]
+
+    resultados = {}
+    for nombre, df in (("ancho", df_modelo), ("largo", df_largo)):
+        for solver in ("cbc", "highs"):
+            problema = Minimizacion(df, df_restricciones, solver=solver)
+            problema.construir()
+            resultados[nombre, solver] = problema.resolver()
+
+    for solver in ("cbc", "highs"):
+        assert resultados["largo", solver]["solucion"] == pytest.approx(resultados["ancho", solver]["solucion"])
+        assert resultados["largo", solver]["valor_objetivo"] == pytest.approx(resultados["ancho", solver]["valor_objetivo"])
+
+    pd.testing.assert_frame_equal(modelo_a_ancho(df_largo, df_restricciones), df_modelo, check_dtype=False)
+
+def test_formato_largo_restriccion_desconocida():
+    df_largo = pd.DataFrame({"Restriccion": ["FO", "R9"], "Variable": ["X1", "X1"], "Coef": [1, 1]})
+    df_restricciones = pd.DataFrame({"Restriccion": ["R1"], "Tipo": ["<="], "RHS": [1]})
+
+    with pytest.raises(ValueError, match="R9"):
+        Maximizacion(df_largo, df_restricciones).matriz_coeficientes()
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+@pytest.mark.parametrize("presolve", [False, True])
+def test_actualizar_igual_que_reconstruir(solver, presolve):
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2"],
+        "Coef_FO": [40, 30],
+        "Coef_R1": [2, 1],
+        "Coef_R2": [3, 2]
+    })
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1", "R2"],
+        "Tipo": ["<=", "<="],
+        "RHS": [100, 80]
+    })
+
+    problema = Maximizacion(df_modelo, df_restricciones, solver=solver, presolve=presolve)
+    problema.construir()
+    problema.resolver()
+    problema.actualizar(objetivo={"X1": 10}, rhs={"R1": 60}, agregar={"R3": ({"X1": 1, "X2": 1}, "<=", 25)})
+    actualizado = problema.resolver()
+
+    df_modelo["Coef_FO"] = [10, 30]
+    df_modelo["Coef_R3"] = [1, 1]
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1", "R2", "R3"],
+        "Tipo": ["<=", "<=", "<="],
+        "RHS": [60, 80, 25]
+    })
+    nuevo = Maximizacion(df_modelo, df_restricciones, solver=solver)
+    nuevo.construir()
+    esperado = nuevo.resolver()
+
+    assert actualizado["status"] == "Optimal"
+    assert actualizado["valor_objetivo"] == pytest.approx(esperado["valor_objetivo"])
+    assert actualizado["solucion"] == pytest.approx(esperado["solucion"])
+
+    problema.actualizar(eliminar=["R3"])
+    assert problema.resolver()["valor_objetivo"] == pytest.approx(1200)  # X2 = 40 por R2
+
+    with pytest.raises(ValueError, match="desconocidas"):
+        problema.actualizar(rhs={"R9": 1})
+
+def test_diferencias_forma():
+    from main.solvers import diferencias_forma
+
+    df_modelo = pd.DataFrame({"Variable": ["X1", "X2"], "Coef_FO": [2, 3], "Coef_R1": [1, 1], "Coef_R2": [1, 0]})
+    df_restricciones = pd.DataFrame({"Restriccion": ["R1", "R2"], "Tipo": ["<=", ">="], "RHS": [10, 1]})
+    anterior = Minimizacion(df_modelo, df_restricciones).forma_matricial()
+
+    df_modelo["Coef_FO"] = [2, 4]
+    df_modelo["Coef_R2"] = [1, 2]
+    df_restricciones["RHS"] = [12, 1]
+    cambios = diferencias_forma(anterior, Minimizacion(df_modelo, df_restricciones).forma_matricial())
+
+    assert cambios == {
+        "objetivo": {"X2": 4.0},
+        "rhs": {"R1": (-float("inf"), 12.0)},
+        "agregar": {"R2": ({"X1": 1.0, "X2": 2.0}, ">=", 1.0)},
+        "eliminar": ["R2"],
+    }
+
+    df_modelo["Coef_R1"] = [0, 0]
+    df_modelo["Coef_R2"] = [0, 1]
+    df_modelo["Coef_FO"] = [0, 1]
+    assert diferencias_forma(anterior, Minimizacion(df_modelo, df_restricciones).forma_matricial()) is None
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+def test_analisis_parametrico_igual_que_resolver_cada_paso(solver):
+    import numpy as np
+    from main.problemas import Transporte
+    from main.utils import generar_ejemplo_maximizacion, generar_ejemplo_transporte
+
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    capacidades = np.linspace(50, 500, 7)
+    tabla = Maximizacion(df_modelo, df_restricciones, solver=solver).analisis_parametrico(
+        rhs={"R2": capacidades}, hilos=3
+    )
+
+    assert list(tabla.columns[:4]) == ["Paso", "RHS R2", "Estado", "Valor óptimo"]
+    assert len(tabla) == 7
+    for fila, rhs in zip(tabla.itertuples(index=False), capacidades):
+        restricciones = df_restricciones.copy()
+        restricciones.loc[restricciones["Restriccion"] == "R2", "RHS"] = rhs
+        problema = Maximizacion(df_modelo, restricciones, solver=solver)
+        problema.construir()
+        assert fila[3] == pytest.approx(problema.resolver()["valor_objetivo"])
+
+    tabla = Transporte(generar_ejemplo_transporte(), None, solver="modi").analisis_parametrico(
+        objetivo={"X_O1_D1": [1, 50]}
+    )
+    assert (tabla["Estado"] == "Optimal").all()
+    assert tabla["Valor óptimo"].is_monotonic_increasing
+
+    with pytest.raises(ValueError, match="misma cantidad"):
+        Maximizacion(df_modelo, df_restricciones).analisis_parametrico(rhs={"R1": [1, 2]}, objetivo={"X1": [1]})
+
+@pytest.mark.parametrize("presolve", [False, True])
+def test_variables_enteras_y_binarias(presolve):
+    # Mochila: las enteras tienen cota superior 3 y la binaria recorta su cota a 1
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2", "X3", "X4"],
+        "Coef_FO": [10, 13, 7, 4],
+        "Coef_R1": [3, 4, 2, 1.5],
+        "Tipo_Var": ["Entera", "entera", "Binaria", None],
+        "Cota_Sup": [3, 3, 5, None],
+    })
+    df_restricciones = pd.DataFrame({"Restriccion": ["R1"], "Tipo": ["<="], "RHS": [10.5]})
+
+    resultados = {}
+    for solver in ("cbc", "highs"):
+        problema = Maximizacion(df_modelo, df_restricciones, solver=solver, presolve=presolve,
+                                sensibilidad=True, gap=0, hilos=2)
+        problema.construir()
+        resultados[solver] = problema.resolver()
+
+    for resultado in resultados.values():
+        solucion = resultado["solucion"]
+        assert resultado["status"] == "Optimal"
+        assert resultado["gap"] == pytest.approx(0, abs=1e-9)
+        assert "sensibilidad" not in resultado
+        assert all(solucion[v] == pytest.approx(round(solucion[v]), abs=1e-6) for v in ("X1", "X2", "X3"))
+        assert solucion["X3"] <= 1 + 1e-6
+    assert resultados["highs"]["valor_objetivo"] == pytest.approx(resultados["cbc"]["valor_objetivo"], abs=1e-6)
+    # La relajación continua es estrictamente mejor
+    relajado = Maximizacion(df_modelo.drop(columns="Tipo_Var"), df_restricciones, solver="highs")
+    relajado.construir()
+    assert resultados["cbc"]["valor_objetivo"] < relajado.resolver()["valor_objetivo"] - 1e-6
+
+    with pytest.raises(ValueError, match="Tipo de variable"):
+        Maximizacion(df_modelo.assign(Tipo_Var="Real"), df_restricciones).construir()
+    with pytest.raises(ValueError, match="cota inferior"):
+        Maximizacion(df_modelo.assign(Cota_Inf=4), df_restricciones).construir()
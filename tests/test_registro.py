@@ -0,0 +1,124 @@
+import threading
+import pandas as pd
+from main.registro import leer_ejecuciones, rutas_log
+from main.utils import registrar_log
+
+def _resultado():
+    return {"status": "Optimal", "valor_objetivo": 500.0, "solucion": {"X1": 0.0, "X2": 100.0}}
+
+def _datos():
+    return {
+        "modelo": pd.DataFrame({"Variable": ["X1", "X2"], "Coef_FO": [7, 5], "Coef_R1": [4, 2]}),
+        "restricciones": pd.DataFrame({"Restriccion": ["R1"], "Tipo": ["<="], "RHS": [240]})
+    }
+
+def test_registrar_log_agrega_registros(tmp_path):
+    ruta = str(tmp_path / "registro.db")
+    registrar_log("Maximización", _resultado(), _datos(), ruta=ruta)
+    registrar_log("Minimización", {**_resultado(), "gap": 0.01}, _datos(), ruta=ruta)
+
+    df = leer_ejecuciones(ruta)
+    assert df["tipo"].tolist() == ["Maximización", "Minimización"]
+    assert df["valor_objetivo"].tolist() == [500.0, 500.0]
+    assert pd.isna(df.loc[0, "gap"])
+    assert df.loc[0, "mediciones"] is None and df.loc[1, "gap"] == 0.01
+    assert pd.read_json(pd.io.common.StringIO(df.loc[0, "entrada_modelo"]))["Variable"].tolist() == ["X1", "X2"]
+
+def test_migracion_csv_una_sola_vez(tmp_path):
+    ruta_db, ruta_csv = rutas_log(str(tmp_path / "registro.db"))
+    pd.DataFrame([{
+        "timestamp": "2025-07-10 23:42:39", "tipo": "Maximización", "estado": "Optimal",
+        "valor_objetivo": 500.0, "entrada_modelo": "{}", "entrada_restricciones": "{}",
+        "entrada_costos": "", "solucion": "{}"
+    }]).to_csv(ruta_csv, index=False)
+
+    registrar_log("Minimización", _resultado(), _datos(), ruta=ruta_db)
+    registrar_log("Minimización", _resultado(), _datos(), ruta=ruta_db)
+
+    df = leer_ejecuciones(ruta_db)
+    assert df["timestamp"].iloc[0] == "2025-07-10 23:42:39"
+    assert len(df) == 3
+
+def test_registros_concurrentes(tmp_path):
+    ruta = str(tmp_path / "registro.db")
+
+    def registrar():
+        for _ in range(10):
+            registrar_log("Transporte", _resultado(), {}, ruta=ruta)
+
+    hilos = [threading.Thread(target=registrar) for _ in range(4)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    assert len(leer_ejecuciones(ruta)) == 40
+
+def test_consulta_paginada_y_filtrada(tmp_path):
+    from main.registro import consultar_ejecuciones, contar_ejecuciones, insertar_ejecucion, obtener_ejecucion
+
+    ruta = str(tmp_path / "registro.db")
+    for d in range(1, 21):
+        insertar_ejecucion({
+            "timestamp": f"2025-07-{d:02d} 10:00:00",
+            "tipo": "Transporte" if d % 2 else "Asignación",
+            "estado": "Optimal",
+            "valor_objetivo": d,
+            "solucion": "{}"
+        }, ruta)
+
+    assert contar_ejecuciones(ruta) == 20
+    assert contar_ejecuciones(ruta, tipo="Transporte") == 10
+    assert contar_ejecuciones(ruta, desde="2025-07-05", hasta="2025-07-06") == 2
+
+    pagina = consultar_ejecuciones(ruta, limite=5, desplazamiento=5)
+    assert pagina["timestamp"].tolist()[0] == "2025-07-15 10:00:00"
+    assert "solucion" not in pagina.columns
+
+    detalle = obtener_ejecucion(int(pagina["id"].iloc[0]), ruta)
+    assert detalle["solucion"] == "{}"
+
+def test_contenidos_deduplicados(tmp_path):
+    from main.registro import ejecuciones_misma_entrada, estadisticas_almacenamiento, leer_ejecuciones
+
+    ruta = str(tmp_path / "registro.db")
+    for _ in range(5):
+        registrar_log("Maximización", _resultado(), _datos(), ruta=ruta)
+    otros = _datos()
+    otros["restricciones"].loc[0, "RHS"] = 100
+    registrar_log("Maximización", _resultado(), otros, ruta=ruta)
+
+    df = leer_ejecuciones(ruta)
+    assert df["entrada_modelo"].nunique() == 1
+    assert df["hash_entrada"].nunique() == 2
+
+    estadisticas = estadisticas_almacenamiento(ruta)
+    assert estadisticas["blobs"] == 4
+    assert estadisticas["bytes_referenciados"] > 4 * estadisticas["bytes_originales"]
+
+    misma = ejecuciones_misma_entrada(int(df["id"].iloc[0]), ruta)
+    assert sorted(misma["id"]) == sorted(df["id"].iloc[1:5])
+
+def test_actualizacion_desde_esquema_sin_blobs(tmp_path):
+    import sqlite3
+    from main.registro import leer_ejecuciones
+
+    ruta = str(tmp_path / "registro.db")
+    conexion = sqlite3.connect(ruta)
+    conexion.executescript("""
+        CREATE TABLE ejecuciones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, tipo TEXT NOT NULL,
+            estado TEXT, valor_objetivo REAL, entrada_modelo TEXT, entrada_restricciones TEXT,
+            entrada_costos TEXT, solucion TEXT
+        );
+        INSERT INTO ejecuciones (timestamp, tipo, estado, valor_objetivo, entrada_modelo, entrada_restricciones, entrada_costos, solucion)
+        VALUES ('2025-07-10 23:42:39', 'Maximización', 'Optimal', 500.0, '{"a":1}', '{"b":2}', '', '{"X1":0.0}');
+    """)
+    conexion.close()
+
+    df = leer_ejecuciones(ruta)
+    assert df.loc[0, "entrada_modelo"] == '{"a":1}'
+    assert df.loc[0, "solucion"] == '{"X1":0.0}'
+    assert df.loc[0, "hash_entrada"] is not None
+    assert pd.isna(df.loc[0, "gap"])
+    assert df.loc[0, "mediciones"] is None
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+from main.problemas import Maximizacion, Minimizacion, Transporte
+from main.utils import exportar_resultado_excel, generar_ejemplo_maximizacion, generar_ejemplo_transporte
+
+@pytest.mark.parametrize("solver", ["cbc", "highs"])
+@pytest.mark.parametrize("presolve", [False, True])
+def test_sensibilidad_maximizacion(solver, presolve):
+    # Max 40·X1 + 30·X2 s.a. 2·X1 + X2 <= 100, 3·X1 + 2·X2 <= 80 → X2 = 40, Z = 1200
+    df_modelo, df_restricciones = generar_ejemplo_maximizacion()
+    problema = Maximizacion(df_modelo, df_restricciones, solver=solver, presolve=presolve, sensibilidad=True)
+    problema.construir()
+    resultado = problema.resolver()
+
+    variables = resultado["sensibilidad"]["variables"].set_index("Variable")
+    restricciones = resultado["sensibilidad"]["restricciones"].set_index("Restriccion")
+
+    assert variables.loc["X1", "Costo reducido"] == pytest.approx(-5)
+    assert variables.loc["X1", ["FO mínimo", "FO máximo"]].tolist() == [-np.inf, pytest.approx(45)]
+    assert variables.loc["X2", ["FO mínimo", "FO máximo"]].tolist() == [pytest.approx(80 / 3), np.inf]
+
+    assert restricciones["Precio sombra"].tolist() == pytest.approx([0, 15])
+    assert restricciones["Holgura"].tolist() == pytest.approx([60, 0])
+    assert restricciones.loc["R1", ["RHS mínimo", "RHS máximo"]].tolist() == [pytest.approx(40), np.inf]
+    assert restricciones.loc["R2", ["RHS mínimo", "RHS máximo"]].tolist() == pytest.approx([0, 200])
+
+    libro = load_workbook(exportar_resultado_excel(resultado))
+    assert {"Sensibilidad - Variables", "Sensibilidad - Restricciones"} <= set(libro.sheetnames)
+
+def test_sensibilidad_minimizacion_y_transporte():
+    df_modelo = pd.DataFrame({
+        "Variable": ["X1", "X2"],
+        "Coef_FO": [2, 3],
+        "Coef_R1": [5, 10],
+        "Coef_R2": [4, 3],
+        "Coef_R3": [0.5, 0]
+    })
+    df_restricciones = pd.DataFrame({
+        "Restriccion": ["R1", "R2", "R3"],
+        "Tipo": [">=", ">=", ">="],
+        "RHS": [90, 48, 1.5]
+    })
+    problema = Minimizacion(df_modelo, df_restricciones, solver="highs", sensibilidad=True)
+    problema.construir()
+    restricciones = problema.resolver()["sensibilidad"]["restricciones"]
+    assert restricciones["Precio sombra"].tolist() == pytest.approx([0.24, 0.2, 0])
+    assert restricciones["RHS mínimo"].tolist()[:2] == pytest.approx([60, 34.5])
+
+    # El precio sombra de la demanda coincide con resolver de nuevo con una unidad más
+    costos = generar_ejemplo_transporte()
+    costos.loc[2, "Oferta"] = 400
+    for solver in ("modi", "highs"):
+        problema = Transporte(costos, None, solver=solver, sensibilidad=True)
+        problema.construir()
+        resultado = problema.resolver()
+        restricciones = resultado["sensibilidad"]["restricciones"]
+        assert not restricciones["Precio sombra"].isna().any()
+        demanda = restricciones[restricciones["Restriccion"] == "Demanda_D1"].iloc[0]
+        perturbados = costos.copy()
+        perturbados.loc[0, "Demanda"] += 1
+        perturbado = Transporte(perturbados, None, solver="highs")
+        perturbado.construir()
+        assert perturbado.resolver()["valor_objetivo"] - resultado["valor_objetivo"] == pytest.approx(
+            demanda["Precio sombra"]
+        )
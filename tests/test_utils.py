@@ -1,4 +1,46 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from main.utils import exportar_resultado_csv, exportar_resultado_excel, exportar_resultado_parquet
 
+RESULTADO = {"status": "Optimal", "valor_objetivo": 12.5, "solucion": {"X1": 2.5, "X2": 0.0, "X3": 1.0}}
+SENSIBILIDAD = {
+    "variables": pd.DataFrame({"Variable": ["X1", "X2"], "FO mínimo": [-np.inf, 26.5], "FO máximo": [45.0, np.inf]}),
+    "restricciones": pd.DataFrame({"Restriccion": ["R1", "R2"], "RHS mínimo": [40.0, 0.0],
+                                   "RHS máximo": [np.inf, 200.0]}),
+}
+ENTRADA = {"modelo": pd.DataFrame({"Variable": ["X1", "X2", "X3"], "Coef_FO": [5, 1, None]})}
 
+def test_exportacion_excel_streaming_igual_a_normal():
+    normal = pd.read_excel(exportar_resultado_excel(RESULTADO, ENTRADA, streaming=False), sheet_name=None)
+    streaming = pd.read_excel(exportar_resultado_excel(RESULTADO, ENTRADA, streaming=True), sheet_name=None)
 
+    assert list(normal) == list(streaming) == ["Resumen", "Solución", "Entrada - Modelo"]
+    for hoja in normal:
+        pd.testing.assert_frame_equal(normal[hoja], streaming[hoja])
 
+    con_rangos = {**RESULTADO, "sensibilidad": SENSIBILIDAD}
+    normal = pd.read_excel(exportar_resultado_excel(con_rangos, streaming=False), sheet_name=None)
+    streaming = pd.read_excel(exportar_resultado_excel(con_rangos, streaming=True), sheet_name=None)
+    assert normal["Sensibilidad - Variables"]["FO mínimo"].tolist() == [-np.inf, 26.5]
+    for hoja in ("Sensibilidad - Variables", "Sensibilidad - Restricciones"):
+        pd.testing.assert_frame_equal(normal[hoja], streaming[hoja])
+
+    reducido = pd.read_excel(
+        exportar_resultado_excel(RESULTADO, ENTRADA, omitir_ceros=True, incluir_entradas=False, streaming=True),
+        sheet_name=None
+    )
+    assert list(reducido) == ["Resumen", "Solución"]
+    assert reducido["Solución"]["Variable"].tolist() == ["X1", "X3"]
+
+def test_exportacion_csv_y_parquet():
+    df_csv = pd.read_csv(exportar_resultado_csv(RESULTADO, omitir_ceros=True), comment="#")
+    assert df_csv.to_dict("list") == {"Variable": ["X1", "X3"], "Valor": [2.5, 1.0]}
+
+    tabla = pq.read_table(exportar_resultado_parquet(RESULTADO))
+    assert tabla.schema.metadata[b"status"] == b"Optimal"
+    assert float(tabla.schema.metadata[b"valor_objetivo"]) == 12.5
+    assert tabla.to_pandas()["Valor"].tolist() == [2.5, 0.0, 1.0]
+
+    asignacion = {"status": "Óptimo", "valor_objetivo": 3, "asignaciones": [("A1", "T2"), ("A2", "T1")]}
+    assert pq.read_table(exportar_resultado_parquet(asignacion)).column_names == ["Agente", "Tarea"]
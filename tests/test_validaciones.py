@@ -77,3 +77,27 @@ def test_validacion_transporte_costo_invalido():
     })
     with pytest.raises(ValueError):
         validar_datos_transporte(df)
+
+def test_validacion_asignacion_rectangular_y_pares():
+    from main.utils import validar_datos_asignacion
+
+    validar_datos_asignacion(pd.DataFrame({"Tarea 1": [1, 2], "Tarea 2": [3, None], "Tarea 3": [0, 1]}))
+    validar_datos_asignacion(pd.DataFrame({"Agente": ["A1"], "Tarea": ["T1"], "Costo": [4]}))
+
+    with pytest.raises(ValueError):
+        validar_datos_asignacion(pd.DataFrame({"Agente": ["A1", "A1"], "Tarea": ["T1", "T1"], "Costo": [4, 5]}))
+
+def test_validacion_manual_formato_largo():
+    df_restricciones = pd.DataFrame({"Restriccion": ["R1"], "Tipo": ["<="], "RHS": [10]})
+
+    df_modelo = pd.DataFrame({"Restriccion": ["FO", "R1"], "Variable": ["X1", "X1"], "Coef": [3, None]})
+    validar_datos_manual(df_modelo, df_restricciones)
+    assert df_modelo["Coef"].tolist() == [3, 0]
+
+    repetido = pd.DataFrame({"Restriccion": ["R1", "R1"], "Variable": ["X1", "X1"], "Coef": [1, 2]})
+    with pytest.raises(ValueError, match="una sola vez"):
+        validar_datos_manual(repetido, df_restricciones)
+
+    desconocida = pd.DataFrame({"Restriccion": ["R2"], "Variable": ["X1"], "Coef": [1]})
+    with pytest.raises(ValueError, match="R2"):
+        validar_datos_manual(desconocida, df_restricciones)